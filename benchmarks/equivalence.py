@@ -0,0 +1,406 @@
+"""
+Equivalence harness: reference implementations vs alternative engine paths.
+
+Katz's outreach order depends on exact ranks, so an optimized path is only
+adopted once it reproduces the reference output exactly. This harness runs
+a reference and one or more candidates over the same inputs, real or
+synthetic, and diffs every shared output column plus the row order.
+
+References:
+  - people:    reference_people_scoring, the row-at-a-time path (scalar
+               title/contact/lead scoring, full-scan match_person_to_company)
+  - matching:  engine.people.match_person_to_company
+  - companies: engine.companies.score_companies
+
+Candidates are plain callables with the reference's signature, registered
+in PEOPLE_ENGINES / MATCH_ENGINES / COMPANY_ENGINES. A new engine gets
+checked by adding it there (or passing it to compare_* directly).
+
+Usage:
+    python -m benchmarks.equivalence                                # synthetic, all engines
+    python -m benchmarks.equivalence --input sources/accum/gdc_sf_26_accum.tsv --companies-sample 2000
+    python -m benchmarks.equivalence --people 300 --engines warm
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from engine.companies import rescore_company_weights, score_companies
+from engine.lead import calculate_lead_score
+from engine.normalize import normalize_company_name, normalize_scores
+from engine.people import (
+    calculate_contact_score,
+    calculate_title_scores,
+    calculate_warmth_score,
+    load_master_stats,
+    match_person_to_company,
+    process_people_scoring,
+)
+from engine.plan import ScoringPlan, compile_config
+
+PEOPLE_KEY_COLUMNS = ["First Name", "Last Name", "Job Title", "Company Name"]
+COMPANY_KEY_COLUMNS = ["Company Name"]
+MAX_EXAMPLES = 10
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations
+# ---------------------------------------------------------------------------
+
+def _config_dict(config) -> dict:
+    return config.config if isinstance(config, ScoringPlan) else config
+
+
+def reference_people_scoring(people_file: str, companies_file: str, config) -> pd.DataFrame:
+    """Row-at-a-time people scoring: the behaviour every faster path must reproduce.
+
+    Scalar title, warmth, contact and lead scoring on the raw config dict,
+    a full scan of the companies list per person, then master-stats
+    normalization and a Lead Score sort. Slow; for verification only.
+    """
+    config = _config_dict(config)
+    people_sep = '\t' if people_file.lower().endswith('.tsv') else ','
+    people_df = pd.read_csv(people_file, sep=people_sep)
+    companies_df = pd.read_csv(companies_file)
+    if 'Company Name' not in people_df.columns and 'Company' in people_df.columns:
+        people_df['Company Name'] = people_df['Company']
+
+    results, raw_contact_scores, raw_lead_scores = [], [], []
+    for _, person in people_df.iterrows():
+        def text(column: str) -> str:
+            value = person.get(column, '')
+            return value if pd.notna(value) else ''
+
+        first_name, last_name = text('First Name'), text('Last Name')
+        job_title, company_name = text('Job Title'), text('Company Name')
+        normal_company = text('Normal Company')
+        if not str(normal_company).strip():
+            normal_company = normalize_company_name(company_name) if company_name != '' else ''
+
+        seniority, domain = calculate_title_scores(job_title, config)
+        warmth = calculate_warmth_score(
+            {'First Name': first_name, 'Last Name': last_name, 'Company Name': company_name}, config)
+        matched_company, confidence, company_score = match_person_to_company(normal_company, companies_df)
+
+        contact = calculate_contact_score(seniority, domain, warmth, config)
+        has_title = bool(job_title and isinstance(job_title, str) and job_title.strip())
+        raw_contact_scores.append(contact)
+        raw_lead_scores.append(calculate_lead_score(contact, company_score, confidence >= 90.0, has_title))
+
+        results.append({
+            'First Name': first_name,
+            'Last Name': last_name,
+            'Full Name': f"{first_name} {last_name}".strip(),
+            'Job Title': job_title,
+            'Company Name': company_name,
+            'Company Score': round(company_score) if company_score > 0 else '',
+            'Seniority': round(seniority),
+            'Domain': round(domain),
+            'Warmth': round(warmth),
+            'Matched Company': matched_company,
+            'Match Confidence': round(confidence) if confidence > 0 else '',
+            'Source': text('Source'),
+            'Date Created': text('Date Created'),
+            'Date Updated': text('Date Updated'),
+            'Extra Data': person.get('Extra Data', ''),
+        })
+
+    stats = load_master_stats()
+    contact_normalized = normalize_scores(raw_contact_scores, stats.get("contact_score_min"), stats.get("contact_score_max"))
+    lead_normalized = normalize_scores(raw_lead_scores, stats.get("lead_score_min"), stats.get("lead_score_max"))
+
+    results_df = pd.DataFrame(results)
+    results_df['Contact Score'] = [int(round(s)) for s in contact_normalized]
+    results_df['Lead Score'] = [int(round(s)) for s in lead_normalized]
+    return results_df.sort_values('Lead Score', ascending=False).reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Candidate engines
+# ---------------------------------------------------------------------------
+
+def _score_with_cache(people_file: str, companies_file: str, config) -> pd.DataFrame:
+    # Second run is served entirely from the score cache
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "cache.pkl")
+        process_people_scoring(people_file, companies_file, config, score_cache_file=cache_file)
+        return process_people_scoring(people_file, companies_file, config, score_cache_file=cache_file)
+
+
+def _score_warm(people_file: str, companies_file: str, config) -> pd.DataFrame:
+    from engine.engagement import load_warmth_index
+    from engine.warm import CompanyIndex, WarmState, score_records
+
+    plan = config if isinstance(config, ScoringPlan) else compile_config(config)
+    state = WarmState(plan, CompanyIndex(pd.read_csv(companies_file)), load_master_stats(), load_warmth_index())
+    people_sep = '\t' if people_file.lower().endswith('.tsv') else ','
+    records = pd.read_csv(people_file, sep=people_sep).to_dict("records")
+    scored = pd.DataFrame(score_records(state, records))
+    return scored.sort_values('Lead Score', ascending=False).reset_index(drop=True)
+
+
+PEOPLE_ENGINES: Dict[str, Callable] = {
+    "process_people_scoring": process_people_scoring,
+    "score cache": _score_with_cache,
+    "warm": _score_warm,
+}
+
+
+def _index_matcher(companies_df: pd.DataFrame) -> Callable:
+    from engine.warm import CompanyIndex
+
+    return CompanyIndex(companies_df).match
+
+
+MATCH_ENGINES: Dict[str, Callable] = {
+    # factory(companies_df) -> match(normal) with match_person_to_company's result
+    "company index": _index_matcher,
+}
+
+COMPANY_ENGINES: Dict[str, Callable] = {
+    # engine.delta's path: Company Score recomputed from stored pillars
+    "rescore weights": lambda staging, config: rescore_company_weights(score_companies(staging, config), config),
+}
+
+
+# ---------------------------------------------------------------------------
+# Diffing
+# ---------------------------------------------------------------------------
+
+def _canonical(values: pd.Series) -> pd.Series:
+    """Comparable string form: blanks/NaN -> "", integral floats -> ints, floats to 6 places."""
+    def one(value):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return ""
+        if isinstance(value, (float, np.floating)):
+            return str(int(value)) if float(value).is_integer() else f"{float(value):.6f}"
+        if isinstance(value, (int, np.integer)):
+            return str(int(value))
+        return str(value)
+    return values.map(one)
+
+
+def _row_keys(df: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+    parts = [_canonical(df[column]) if column in df.columns else pd.Series("", index=df.index)
+             for column in key_columns]
+    key = parts[0]
+    for part in parts[1:]:
+        key = key + "|" + part
+    # Duplicate people get an occurrence number so every row has its own key
+    return key + "#" + key.groupby(key).cumcount().astype(str)
+
+
+def diff_outputs(reference: pd.DataFrame, candidate: pd.DataFrame, key_columns: List[str],
+                 sort_column: Optional[str] = None, max_examples: int = MAX_EXAMPLES) -> Dict:
+    """Diff two outputs column by column (rows aligned by key_columns) and by order.
+
+    Returns:
+        {"equivalent", "rows", "missing", "extra", "columns": {column: mismatch count},
+         "examples": [{"row", "column", "reference", "candidate"}],
+         "order": {"mismatches", "tie_reorders", "examples"}}
+    """
+    reference = reference.reset_index(drop=True)
+    candidate = candidate.reset_index(drop=True)
+    ref_keys, cand_keys = _row_keys(reference, key_columns), _row_keys(candidate, key_columns)
+    ref = reference.set_axis(ref_keys.values)
+    cand = candidate.set_axis(cand_keys.values)
+
+    missing = [key for key in ref.index if key not in cand.index]
+    extra = [key for key in cand.index if key not in ref.index]
+    shared_rows = [key for key in ref.index if key in cand.index]
+    shared_columns = [c for c in reference.columns if c in candidate.columns and c not in key_columns]
+
+    columns, examples = {}, []
+    for column in shared_columns:
+        ref_values = _canonical(ref.loc[shared_rows, column])
+        cand_values = _canonical(cand.loc[shared_rows, column])
+        differs = ref_values.ne(cand_values)
+        columns[column] = int(differs.sum())
+        for key in ref_values.index[differs][:max(0, max_examples - len(examples))]:
+            examples.append({"row": key.rsplit("#", 1)[0], "column": column,
+                             "reference": ref_values[key], "candidate": cand_values[key]})
+
+    order = {"mismatches": 0, "tie_reorders": 0, "examples": []}
+    if sort_column and not missing and not extra:
+        ref_sorted = _canonical(reference[sort_column])
+        cand_sorted = _canonical(candidate[sort_column])
+        moved = ref_keys.values != cand_keys.values
+        same_score = ref_sorted.values == cand_sorted.values
+        # Rows that only swapped places with equal-score rows don't change rank
+        order["tie_reorders"] = int((moved & same_score).sum())
+        bad = np.flatnonzero(~same_score)
+        order["mismatches"] = int(len(bad))
+        order["examples"] = [
+            {"position": int(i), "reference": ref_keys.iloc[i].rsplit("#", 1)[0],
+             "candidate": cand_keys.iloc[i].rsplit("#", 1)[0],
+             sort_column: [ref_sorted.iloc[i], cand_sorted.iloc[i]]}
+            for i in bad[:max_examples]
+        ]
+
+    return {
+        "equivalent": not missing and not extra and not any(columns.values()) and order["mismatches"] == 0,
+        "rows": len(reference),
+        "missing": missing[:max_examples],
+        "extra": extra[:max_examples],
+        "columns": columns,
+        "examples": examples,
+        "order": order,
+    }
+
+
+def format_report(name: str, report: Dict) -> str:
+    """Human-readable summary of a diff_outputs / compare_matching report."""
+    status = "EQUIVALENT" if report["equivalent"] else "MISMATCH"
+    lines = [f"{name}: {status} ({report['rows']} rows)"]
+    if report.get("missing"):
+        lines.append(f"  missing rows: {report['missing']}")
+    if report.get("extra"):
+        lines.append(f"  extra rows: {report['extra']}")
+    for column, count in report.get("columns", {}).items():
+        if count:
+            lines.append(f"  {column}: {count} rows differ")
+    for example in report.get("examples", []):
+        lines.append(f"    {example['row']} [{example['column']}]: "
+                     f"reference={example['reference']!r} candidate={example['candidate']!r}")
+    order = report.get("order")
+    if order and (order["mismatches"] or order["tie_reorders"]):
+        lines.append(f"  order: {order['mismatches']} positions differ in score, "
+                     f"{order['tie_reorders']} tie reorders (same rank)")
+        for example in order["examples"]:
+            lines.append(f"    #{example['position']}: reference={example['reference']} "
+                         f"candidate={example['candidate']}")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Comparisons
+# ---------------------------------------------------------------------------
+
+def compare_people_engines(people_file: str, companies_file: str, config,
+                           engines: Optional[Dict[str, Callable]] = None) -> Dict[str, Dict]:
+    """Run the reference and each candidate on the same files; one report per candidate."""
+    reference = reference_people_scoring(people_file, companies_file, config)
+    reports = {}
+    for name, engine in (engines or PEOPLE_ENGINES).items():
+        candidate = engine(people_file, companies_file, config)
+        reports[name] = diff_outputs(reference, candidate, PEOPLE_KEY_COLUMNS, sort_column="Lead Score")
+    return reports
+
+
+def compare_matching(normals: List[str], companies_df: pd.DataFrame,
+                     engines: Optional[Dict[str, Callable]] = None) -> Dict[str, Dict]:
+    """match_person_to_company vs each matcher, over the same normalized names."""
+    reference = pd.DataFrame(
+        [match_person_to_company(normal, companies_df) for normal in normals],
+        columns=["Matched Company", "Match Confidence", "Company Score"],
+    )
+    reference.insert(0, "Query", normals)
+    reports = {}
+    for name, factory in (engines or MATCH_ENGINES).items():
+        match = factory(companies_df)
+        candidate = pd.DataFrame([match(normal) for normal in normals],
+                                 columns=["Matched Company", "Match Confidence", "Company Score"])
+        candidate.insert(0, "Query", normals)
+        reports[name] = diff_outputs(reference, candidate, ["Query"])
+    return reports
+
+
+def compare_company_engines(staging: pd.DataFrame, config,
+                            engines: Optional[Dict[str, Callable]] = None) -> Dict[str, Dict]:
+    """score_companies vs each candidate on the same staging table."""
+    reference = score_companies(staging, config)
+    # 'Updated Date' is today's date in every engine; nothing to compare
+    reference = reference.drop(columns=["Updated Date"])
+    reports = {}
+    for name, engine in (engines or COMPANY_ENGINES).items():
+        candidate = engine(staging, config).drop(columns=["Updated Date"], errors="ignore")
+        reports[name] = diff_outputs(reference, candidate, COMPANY_KEY_COLUMNS)
+    return reports
+
+
+def prepare_companies(companies_df: pd.DataFrame) -> pd.DataFrame:
+    """Add the 'Normal Company' column the scorers map in before matching."""
+    companies_df = companies_df.copy()
+    if 'Normal Company' not in companies_df.columns:
+        companies_df['Normal Company'] = companies_df['Normalized Name']
+    return companies_df
+
+
+def main():
+    """CLI entrypoint for the equivalence harness."""
+    import argparse
+    import contextlib
+    import logging
+
+    from benchmarks.synthetic import synthetic_company_staging, synthetic_people
+    from engine.plan import load_plan
+
+    parser = argparse.ArgumentParser(description="Check optimized engine paths against the reference implementations")
+    parser.add_argument("--input", help="Real people TSV/CSV (staging or accum columns); default is synthetic")
+    parser.add_argument("--people", type=int, default=200, help="Synthetic people rows (default: 200)")
+    parser.add_argument("--companies-sample", type=int, default=1000,
+                        help="Companies from the store to match against (0 = all; the reference scans them per person)")
+    parser.add_argument("--company-staging", type=int, default=300, help="Synthetic company staging rows")
+    parser.add_argument("--engines", nargs="+", help="People engines to check (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = load_plan()
+    companies_df = prepare_companies(pd.read_csv(_REPO_ROOT / "store" / "companies.csv"))
+    if args.companies_sample:
+        companies_df = companies_df.sample(n=min(args.companies_sample, len(companies_df)),
+                                           random_state=args.seed).sort_index()
+
+    if args.input:
+        sep = '\t' if args.input.lower().endswith('.tsv') else ','
+        people = pd.read_csv(args.input, sep=sep, dtype=str, keep_default_na=False)
+        if 'Company Name' not in people.columns and 'Company' in people.columns:
+            people['Company Name'] = people['Company']
+    else:
+        people = synthetic_people(args.people, config, args.seed, companies=companies_df)
+
+    engines = PEOPLE_ENGINES
+    if args.engines:
+        unknown = [name for name in args.engines if name not in PEOPLE_ENGINES]
+        if unknown:
+            parser.error(f"unknown engines {unknown}; choose from {list(PEOPLE_ENGINES)}")
+        engines = {name: PEOPLE_ENGINES[name] for name in args.engines}
+
+    reports = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        companies_file = os.path.join(tmp, "companies.csv")
+        people.to_csv(people_file, sep="\t", index=False)
+        companies_df.to_csv(companies_file, index=False)
+        print(f"Scoring {len(people)} people against {len(companies_df)} companies...")
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            logging.disable(logging.INFO)
+            for name, report in compare_people_engines(people_file, companies_file, config, engines).items():
+                reports[f"people / {name}"] = report
+            normals = [normalize_company_name(name) for name in people["Company Name"]]
+            for name, report in compare_matching(normals, companies_df).items():
+                reports[f"matching / {name}"] = report
+            staging = synthetic_company_staging(args.company_staging, args.seed)
+            for name, report in compare_company_engines(staging, config).items():
+                reports[f"companies / {name}"] = report
+            logging.disable(logging.NOTSET)
+
+    print()
+    for name, report in reports.items():
+        print(format_report(name, report))
+    if not all(report["equivalent"] for report in reports.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
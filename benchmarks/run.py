@@ -0,0 +1,383 @@
+"""
+Benchmark every engine stage on synthetic data.
+
+Stages: matching, title scoring, people scoring (end to end), company
+scoring, accumulate, master build and notes merge, each at the requested
+sizes (1K/10K by default; 100K and 1M on request). Each stage is timed as
+the best of --repeat runs; --memory adds one extra traced run per
+stage/size and records its tracemalloc peak. Results are written as JSON. --compare checks
+them against a saved baseline and flags any stage/size that got slower
+than the threshold; the exit status is non-zero if anything regressed.
+
+Some stages are still superlinear in rows (company scoring's per-value
+percentiles, accumulate's per-row appends): company scoring is capped at 2K
+rows and accumulate at 20K, so by default neither is measured at 100K or 1M.
+Skipped stage/sizes are listed at the end of the run and kept in the results
+JSON; pass --uncapped to run them anyway (expect minutes to hours).
+
+Stage inputs written to disk go in a temporary directory that is removed
+after each stage/size.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 1000 10000 100000 --output benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.2
+    python -m benchmarks.run --stages matching "title scoring" --sizes 100000
+    python -m benchmarks.run --stages "master build" --sizes 100000 --memory
+"""
+
+import contextlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.synthetic import synthetic_company_staging, synthetic_people
+from engine.plan import ScoringPlan, load_plan
+
+RESULTS_DIR = _SCRIPT_DIR / "results"
+DEFAULT_SIZES = [1_000, 10_000]
+DEFAULT_THRESHOLD = 0.25
+
+# Largest size each stage runs at without --uncapped (None = no cap)
+STAGE_CAPS = {
+    "matching": 100_000,
+    "title scoring": None,
+    "people scoring": 100_000,
+    "company scoring": 2_000,
+    "accumulate": 20_000,
+    "master build": None,
+    "notes merge": None,
+}
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence engine progress output while timing."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        previous = logging.root.manager.disable
+        logging.disable(logging.INFO)
+        try:
+            yield
+        finally:
+            logging.disable(previous)
+
+
+def _normalized_companies(people: pd.DataFrame) -> List[str]:
+    from engine.normalize import normalize_company_name
+
+    return [normalize_company_name(name) for name in people["Company Name"]]
+
+
+def _scored_frame(people: pd.DataFrame, seed: int) -> pd.DataFrame:
+    """Cheap stand-in for a scored output (for master build / notes merge)."""
+    rng = np.random.default_rng(seed)
+    rows = len(people)
+    scored = people.copy()
+    scored["Full Name"] = scored["First Name"] + " " + scored["Last Name"]
+    for column in ["Lead Score", "Contact Score", "Company Score", "Seniority", "Domain", "Warmth"]:
+        scored[column] = rng.integers(0, 101, rows)
+    scored["Matched Company"] = scored["Company Name"]
+    scored["Match Confidence"] = 100
+    scored["Date Created"] = "2026-03-01"
+    scored["Date Updated"] = scored["Last Updated"]
+    return scored
+
+
+# Each stage: (setup(rows, plan, seed, tmp) -> state, run(state) -> None); tmp
+# is a scratch directory removed once the stage/size is timed
+def _setup_matching(rows, plan, seed, tmp):
+    from engine.warm import load_company_index
+
+    people = synthetic_people(rows, plan, seed)
+    return {"index": load_company_index(), "normals": _normalized_companies(people)}
+
+
+def _run_matching(state):
+    match = state["index"].match
+    for normal in state["normals"]:
+        match(normal)
+
+
+def _setup_titles(rows, plan, seed, tmp):
+    return {"plan": plan, "titles": synthetic_people(rows, plan, seed)["Job Title"].tolist()}
+
+
+def _run_titles(state):
+    title_scores = state["plan"].title_scores
+    for title in state["titles"]:
+        title_scores(title)
+
+
+def _setup_people_scoring(rows, plan, seed, tmp):
+    from engine.warm import COMPANIES_FILE, load_company_index
+
+    people_file = tmp / "people.tsv"
+    synthetic_people(rows, plan, seed).to_csv(people_file, sep="\t", index=False)
+    return {"plan": plan, "people_file": str(people_file), "companies_file": str(COMPANIES_FILE),
+            "index": load_company_index()}
+
+
+def _run_people_scoring(state):
+    from engine.people import process_people_scoring
+
+    process_people_scoring(state["people_file"], state["companies_file"], state["plan"],
+                           company_index=state["index"])
+
+
+def _setup_company_scoring(rows, plan, seed, tmp):
+    return {"plan": plan, "staging": synthetic_company_staging(rows, seed)}
+
+
+def _run_company_scoring(state):
+    from engine.companies import score_companies
+
+    score_companies(state["staging"], state["plan"])
+
+
+def _setup_accumulate(rows, plan, seed, tmp):
+    # A prior accum of rows/2 people plus a new scrape of rows/2 that
+    # overlaps it by half (updates) and adds the rest (new people)
+    people = synthetic_people(rows, plan, seed).rename(columns={"Company Name": "Company"})
+    half, quarter = rows // 2, rows // 4
+    accum = people.iloc[:half].copy()
+    accum["First Seen"] = accum["Last Updated"]
+    scrape = pd.concat([people.iloc[quarter:half], people.iloc[half:half + quarter]], ignore_index=True)
+    scrape["Job Title"] = scrape["Job Title"] + " "
+    return {"accum": accum, "scrape": scrape}
+
+
+def _run_accumulate(state):
+    from engine.accumulate import add_source
+
+    add_source(state["accum"], state["scrape"], source_label="Bench Scrape", date="2026-03-01")
+
+
+def _setup_master(rows, plan, seed, tmp):
+    import engine.master as master
+
+    scored = _scored_frame(synthetic_people(rows, plan, seed), seed)
+    # Three events, plus an older version of one that should be superseded
+    for i, part in enumerate(np.array_split(np.arange(rows), 3)):
+        scored.iloc[part].to_csv(tmp / f"EVENT{i}_Scored_People_2026-03-0{i + 1}.tsv", sep="\t", index=False)
+    scored.iloc[:rows // 10].to_csv(tmp / "EVENT0_Scored_People_2026-02-01.tsv", sep="\t", index=False)
+    return {"master": master, "tmp": tmp}
+
+
+def _run_master(state):
+    master, tmp = state["master"], state["tmp"]
+    patched = {
+        "OUTPUT_DIR": tmp, "STORE_DIR": tmp / "store", "SOURCES_DIR": tmp / "sources",
+        "MASTER_LIST_PATH": tmp / "store" / "people.csv",
+        "MASTER_STATS_PATH": tmp / "store" / "baselines" / "MASTER_PEOPLE_STATS.json",
+    }
+    original = {name: getattr(master, name) for name in patched}
+    for name, value in patched.items():
+        setattr(master, name, value)
+    try:
+        master.build_master_people_list()
+    finally:
+        for name, value in original.items():
+            setattr(master, name, value)
+
+
+def _setup_notes(rows, plan, seed, tmp):
+    from engine.notes import DK_COLUMNS
+
+    rng = np.random.default_rng(seed)
+    new_scored = _scored_frame(synthetic_people(rows, plan, seed), seed)
+    prior = new_scored.sample(frac=0.6, random_state=seed).copy()
+    annotated = rng.random(len(prior)) < 0.5
+    for column in DK_COLUMNS:
+        prior[column] = np.where(annotated, "x", "")
+    # Some prior names spelled differently, to exercise the fuzzy pass
+    renamed = rng.random(len(prior)) < 0.05
+    prior.loc[renamed, "Full Name"] = prior.loc[renamed, "Full Name"].str.lower()
+    return {"new": new_scored, "prior": prior}
+
+
+def _run_notes(state):
+    from engine.notes import merge_dk_notes
+
+    merge_dk_notes(state["new"], state["prior"])
+
+
+STAGES: Dict[str, tuple] = {
+    "matching": (_setup_matching, _run_matching),
+    "title scoring": (_setup_titles, _run_titles),
+    "people scoring": (_setup_people_scoring, _run_people_scoring),
+    "company scoring": (_setup_company_scoring, _run_company_scoring),
+    "accumulate": (_setup_accumulate, _run_accumulate),
+    "master build": (_setup_master, _run_master),
+    "notes merge": (_setup_notes, _run_notes),
+}
+
+
+def time_stage(run: Callable, state, repeat: int) -> float:
+    """Best-of-repeat wall time for one stage run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with _quiet():
+            run(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def traced_peak_mb(run: Callable, state) -> float:
+    """Peak Python memory allocated during one run of a stage, in MB (tracemalloc)."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        with _quiet():
+            run(state)
+        return round((tracemalloc.get_traced_memory()[1] - baseline) / (1024 * 1024), 1)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def run_benchmarks(sizes: List[int], stages: Optional[List[str]] = None, repeat: int = 3,
+                   seed: int = 0, uncapped: bool = False, plan: Optional[ScoringPlan] = None,
+                   memory: bool = False) -> Dict:
+    """Time each stage at each size.
+
+    Args:
+        memory: Also record each stage's tracemalloc peak ("peak_mb"), from a
+            separate run so tracing doesn't slow the timed ones.
+
+    Returns:
+        {"meta": {...}, "results": {stage: {size: {"seconds", "rows_per_second"[, "peak_mb"]} or {"skipped"}}}},
+        where meta["stage_caps"] has the caps that applied (empty when uncapped).
+    """
+    plan = plan or load_plan()
+    results = {}
+    for name in stages or list(STAGES):
+        setup, run = STAGES[name]
+        results[name] = {}
+        for rows in sizes:
+            cap = STAGE_CAPS.get(name)
+            if cap is not None and rows > cap and not uncapped:
+                results[name][str(rows)] = {"skipped": f"above cap of {cap:,} rows (use --uncapped)"}
+                print(f"{name:16} {rows:>9,}  skipped (cap {cap:,})")
+                continue
+            with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+                with _quiet():
+                    state = setup(rows, plan, seed, Path(tmp))
+                seconds = time_stage(run, state, repeat)
+                result = {"seconds": round(seconds, 6), "rows_per_second": round(rows / seconds, 1)}
+                peak = ""
+                if memory:
+                    result["peak_mb"] = traced_peak_mb(run, state)
+                    peak = f"  {result['peak_mb']:>9,.1f} MB peak"
+            results[name][str(rows)] = result
+            print(f"{name:16} {rows:>9,}  {seconds:9.3f}s  {rows / seconds:>12,.0f} rows/s{peak}")
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "config_hash": plan.config_hash,
+            "repeat": repeat,
+            "seed": seed,
+            "stage_caps": {} if uncapped else {name: STAGE_CAPS[name] for name in results
+                                               if STAGE_CAPS.get(name) is not None},
+        },
+        "results": results,
+    }
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Stage/size pairs timed in both runs, with their slowdown ratio.
+
+    Returns:
+        [{"stage", "rows", "baseline", "current", "ratio", "regression"}], where
+        regression means current > baseline * (1 + threshold).
+    """
+    rows = []
+    for stage, sizes in current["results"].items():
+        for size, result in sizes.items():
+            before = baseline.get("results", {}).get(stage, {}).get(size, {})
+            if "seconds" not in result or "seconds" not in before:
+                continue
+            ratio = result["seconds"] / before["seconds"] if before["seconds"] > 0 else float("inf")
+            rows.append({
+                "stage": stage,
+                "rows": int(size),
+                "baseline": before["seconds"],
+                "current": result["seconds"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + threshold,
+            })
+    return rows
+
+
+def main():
+    """CLI entrypoint for the benchmark suite."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark engine stages on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Row counts (default: 1000 10000)")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), help="Stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage/size; the best is kept")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--uncapped", action="store_true", help="Run quadratic stages above their size caps")
+    parser.add_argument("--memory", action="store_true", help="Also record each stage's tracemalloc peak")
+    parser.add_argument("--output", help="Results JSON (default: benchmarks/results/bench_<timestamp>.json)")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown before flagging, as a fraction (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.stages, args.repeat, args.seed, args.uncapped, memory=args.memory)
+    skipped = [(stage, int(size)) for stage, sizes in results["results"].items()
+               for size, result in sizes.items() if "skipped" in result]
+    if skipped:
+        print("\nNot measured (above the stage's size cap; --uncapped runs them):")
+        for stage, rows in skipped:
+            print(f"  {stage} at {rows:,} rows (cap {STAGE_CAPS[stage]:,})")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    os.makedirs(str(output.parent), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        comparison = compare_results(results, baseline, args.threshold)
+        print(f"\n=== COMPARED TO {os.path.basename(args.compare)} (threshold +{args.threshold:.0%}) ===")
+        for row in comparison:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"{row['stage']:16} {row['rows']:>9,}  {row['baseline']:9.3f}s -> {row['current']:9.3f}s  "
+                  f"x{row['ratio']:.2f}  {flag}")
+        regressions = [row for row in comparison if row["regression"]]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Startup benchmark: how long engine CLIs take before doing any work.
+
+Each command is run as a fresh subprocess --repeat times (median kept) and
+compared against a bare `python -c pass`. The interpreter's own start-up
+(site-packages .pth files and the like) differs a lot between machines, so
+budgets apply to the time a command adds on top of it. Light entry points
+must also not import pandas, numpy, scipy or requests at all.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 10 --output benchmarks/results/startup.json
+    python -X importtime -m engine.velocity --conference gdc_sf_26 2>&1 | sort -t'|' -k2 -n | tail
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+
+HEAVY_MODULES = ("pandas", "numpy", "scipy", "requests")
+
+# name -> (python arguments, budget in seconds over a bare interpreter or None)
+COMMANDS = {
+    "velocity report": (["-m", "engine.velocity", "--conference", "__startup_benchmark__"], 0.1),
+    "client --help": (["-m", "engine.client", "--help"], 0.1),
+    "import engine.config": (["-c", "import engine.config"], 0.1),
+    "import engine.plan": (["-c", "import engine.plan"], 0.1),
+    "import engine.people": (["-c", "import engine.people"], None),
+    "batch runner --list": (["-m", "engine.run", "--list"], None),
+}
+# Modules behind the budgeted commands, checked for heavy imports
+LIGHT_MODULES = ("engine.velocity", "engine.client", "engine.config", "engine.plan")
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(_REPO_ROOT))
+    return subprocess.run([sys.executable, *args], cwd=str(_REPO_ROOT), env=env,
+                          capture_output=True, text=True)
+
+
+def command_seconds(args: List[str], repeat: int = 5) -> float:
+    """Median wall time of `python <args>` over repeat fresh processes."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = _run(args)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"python {' '.join(args)} failed: {result.stderr.strip()[-300:]}")
+    return statistics.median(times)
+
+
+def heavy_imports(module: str) -> List[str]:
+    """Which of HEAVY_MODULES importing module pulls in."""
+    check = (f"import sys, json, {module}; "
+             f"print(json.dumps([m for m in {list(HEAVY_MODULES)!r} if m in sys.modules]))")
+    result = _run(["-c", check])
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {result.stderr.strip()[-300:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    result = _run(["-X", "importtime", "-c", code])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            times[parts[2]] = int(parts[1])
+    return times
+
+
+def import_breakdown(module: str, top: int = 8) -> List[Dict]:
+    """Slowest imports (cumulative) under module, from python -X importtime.
+
+    Modules a bare interpreter already imports (site and its .pth hooks) are
+    left out.
+    """
+    baseline = _import_times("pass")
+    rows = [{"module": name, "cumulative_ms": round(microseconds / 1000, 1)}
+            for name, microseconds in _import_times(f"import {module}").items() if name not in baseline]
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def run_startup(repeat: int = 5, commands: Optional[Dict] = None) -> Dict:
+    """Time every command against a bare interpreter.
+
+    Returns:
+        {"baseline": seconds, "commands": {name: {"seconds", "overhead", "budget", "ok"}},
+         "heavy_imports": {module: [...]}}
+    """
+    baseline = command_seconds(["-c", "pass"], repeat)
+    results = {}
+    for name, (args, budget) in (commands or COMMANDS).items():
+        seconds = command_seconds(args, repeat)
+        overhead = max(seconds - baseline, 0.0)
+        results[name] = {
+            "seconds": round(seconds, 4),
+            "overhead": round(overhead, 4),
+            "budget": budget,
+            "ok": budget is None or overhead <= budget,
+        }
+    return {
+        "baseline": round(baseline, 4),
+        "commands": results,
+        "heavy_imports": {module: heavy_imports(module) for module in LIGHT_MODULES},
+    }
+
+
+def main():
+    """CLI entrypoint for the startup benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure engine CLI startup time")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command; the median is kept")
+    parser.add_argument("--output", help="Also write results JSON here")
+    parser.add_argument("--breakdown", metavar="MODULE", help="Show the slowest imports under MODULE")
+    args = parser.parse_args()
+
+    if args.breakdown:
+        for row in import_breakdown(args.breakdown, top=15):
+            print(f"{row['cumulative_ms']:9.1f} ms  {row['module']}")
+        return
+
+    results = run_startup(args.repeat)
+    print(f"bare interpreter: {results['baseline'] * 1000:.0f} ms\n")
+    failed = False
+    for name, row in results["commands"].items():
+        budget = f"budget {row['budget'] * 1000:.0f} ms" if row["budget"] is not None else ""
+        flag = "" if row["ok"] else "  OVER BUDGET"
+        failed |= not row["ok"]
+        print(f"{name:22} {row['seconds'] * 1000:7.0f} ms  (+{row['overhead'] * 1000:4.0f} ms)  {budget}{flag}")
+    for module, heavy in results["heavy_imports"].items():
+        if heavy:
+            failed = True
+            print(f"{module} imports {', '.join(heavy)} at startup")
+
+    if args.output:
+        os.makedirs(str(Path(args.output).parent), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
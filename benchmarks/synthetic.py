@@ -0,0 +1,170 @@
+"""
+Deterministic synthetic inputs for the benchmark suite.
+
+People lists draw job titles from the tuning config's own keywords and
+companies from store/companies.csv (exact names, suffixed/cased variants,
+typos, and companies not in the store), so matching and title scoring see
+a realistic mix of hits and misses. Company staging tables carry every
+column engine.companies.score_companies reads.
+
+The same (rows, seed) always produces the same frame.
+
+Usage:
+    from benchmarks.synthetic import synthetic_people, synthetic_company_staging
+
+    people = synthetic_people(10_000)
+    staging = synthetic_company_staging(1_000)
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+COMPANIES_FILE = _REPO_ROOT / "store" / "companies.csv"
+
+FIRST_NAMES = [
+    "Ana", "Ben", "Chen", "Dana", "Eli", "Fatima", "Goran", "Hana", "Ivan", "Jun",
+    "Kai", "Lena", "Marco", "Nia", "Omar", "Priya", "Quinn", "Rosa", "Sven", "Tara",
+    "Uma", "Victor", "Wei", "Ximena", "Yusuf", "Zoe",
+]
+LAST_NAMES = [
+    "Anders", "Baker", "Costa", "Dubois", "Eriksen", "Fischer", "Garcia", "Huang", "Ito", "Jensen",
+    "Kowalski", "Lee", "Moreau", "Nakamura", "Okafor", "Petrov", "Quinn", "Rossi", "Silva", "Tanaka",
+    "Ueda", "Varga", "Weber", "Xu", "Yilmaz", "Zhang",
+]
+NOISE_TITLES = ["Student", "Artist", "Freelancer", "Consultant", "Intern", "Volunteer", "Attendee"]
+COMPANY_SUFFIXES = [" Inc", " Games", " Studios", " Ltd", " Interactive", " GmbH"]
+CLOSE_STATUSES = ["", "", "", "Qualified", "Met with Matt", "5 - Customer", "Disco incoming", "7 - Previous Customer"]
+
+
+def _config_keywords(config, pillar: str) -> List[str]:
+    components = config["peopleScore"]["pillars"].get(pillar, {}).get("components", {})
+    keywords = []
+    for data in components.values():
+        keywords.extend(k.strip() for k in str(data.get("Keywords to Match", "")).split(",") if k.strip())
+    return keywords or [pillar]
+
+
+def _typo(name: str, rng: np.random.Generator) -> str:
+    if len(name) < 4:
+        return name
+    i = int(rng.integers(1, len(name) - 1))
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def synthetic_titles(rows: int, config, seed: int = 0) -> np.ndarray:
+    """Job titles built from the config's Seniority/Domain/One-Offs keywords."""
+    rng = np.random.default_rng(seed)
+    seniority = np.array(_config_keywords(config, "Seniority"), dtype=object)
+    domain = np.array(_config_keywords(config, "Domain"), dtype=object)
+    one_offs = np.array(_config_keywords(config, "One-Offs"), dtype=object)
+
+    s = seniority[rng.integers(0, len(seniority), rows)]
+    d = domain[rng.integers(0, len(domain), rows)]
+    titles = np.where(rng.random(rows) < 0.5, s + " " + d, s + " of " + d)
+
+    kind = rng.random(rows)
+    titles = np.where(kind < 0.08, one_offs[rng.integers(0, len(one_offs), rows)], titles)
+    noise = np.array(NOISE_TITLES, dtype=object)[rng.integers(0, len(NOISE_TITLES), rows)]
+    titles = np.where((kind >= 0.08) & (kind < 0.2), noise, titles)
+    titles = np.where(kind >= 0.95, "", titles)
+    return titles
+
+
+def synthetic_company_names(rows: int, seed: int = 0, companies: Optional[pd.DataFrame] = None) -> List[str]:
+    """Company names: ~55% exact store names, 20% suffixed/cased, 5% typos, 20% unknown."""
+    rng = np.random.default_rng(seed + 1)
+    if companies is None:
+        companies = pd.read_csv(COMPANIES_FILE, usecols=["Company Name"])
+    store_names = companies["Company Name"].dropna().astype(str).to_numpy()
+
+    # Popular companies show up far more often than long-tail ones
+    weights = 1.0 / np.arange(1, len(store_names) + 1) ** 0.6
+    picks = store_names[rng.choice(len(store_names), rows, p=weights / weights.sum())]
+    kind = rng.random(rows)
+    suffixes = rng.integers(0, len(COMPANY_SUFFIXES), rows)
+
+    names = []
+    for i, name in enumerate(picks):
+        if kind[i] < 0.55:
+            names.append(name)
+        elif kind[i] < 0.65:
+            names.append(name + COMPANY_SUFFIXES[suffixes[i]])
+        elif kind[i] < 0.75:
+            names.append(name.upper() if i % 2 else name.lower())
+        elif kind[i] < 0.8:
+            names.append(_typo(name, rng))
+        else:
+            names.append(f"Unlisted Studio {int(rng.integers(0, rows * 10))}")
+    return names
+
+
+def synthetic_people(rows: int, config=None, seed: int = 0, companies: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Staging-format people list (First Name, Last Name, Job Title, Company Name, ...)."""
+    if config is None:
+        from engine.plan import load_plan
+
+        config = load_plan()
+    rng = np.random.default_rng(seed + 2)
+    first = np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), rows)]
+    # Suffix keeps names mostly unique, as in real attendee lists
+    last = (np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), rows)]
+            + np.char.mod("%d", rng.integers(0, max(rows // 10, 10), rows)).astype(object))
+    days = rng.integers(0, 120, rows)
+
+    return pd.DataFrame({
+        "First Name": first,
+        "Last Name": last,
+        "Job Title": synthetic_titles(rows, config, seed),
+        "Company Name": synthetic_company_names(rows, seed, companies),
+        "Source": np.where(rng.random(rows) < 0.6, "MTM Scrape", "LISN Export"),
+        "Extra Data": "",
+        "Last Updated": (pd.Timestamp("2026-01-01") + pd.to_timedelta(days, unit="D")).strftime("%Y-%m-%d"),
+    })
+
+
+def synthetic_company_staging(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Company staging table with the columns score_companies reads."""
+    rng = np.random.default_rng(seed + 3)
+
+    def sparse(values: np.ndarray, present: float) -> np.ndarray:
+        return np.where(rng.random(rows) < present, values, np.nan)
+
+    def flag(probability: float) -> np.ndarray:
+        return np.where(rng.random(rows) < probability, "X", "")
+
+    change_days = rng.integers(0, 1500, rows)
+    funding_days = rng.integers(0, 2000, rows)
+    statuses = np.array(CLOSE_STATUSES, dtype=object)[rng.integers(0, len(CLOSE_STATUSES), rows)]
+    names = [f"Synthetic Games {i:07d}" for i in range(rows)]
+
+    return pd.DataFrame({
+        "Company Name": names,
+        "Normalized Name": [f"synthetic {i:07d}" for i in range(rows)],
+        "Type": np.where(rng.random(rows) < 0.05, "Co-Developer", "Developer"),
+        "Makes Games": flag(0.8),
+        "F2P": flag(0.5),
+        "Mobile": flag(0.4),
+        "Founded Year": sparse(rng.integers(1990, 2027, rows).astype(float), 0.7),
+        "Rev <30D (ST)": sparse(np.round(rng.lognormal(11, 2.5, rows)), 0.4),
+        "Annual Revenue (Growjo)": sparse(np.round(rng.lognormal(15, 2, rows)), 0.5),
+        "Total Funding Amount": sparse(np.round(rng.lognormal(15, 2.5, rows)), 0.3),
+        "Current Employee Count (GJ)": sparse(np.round(rng.lognormal(3.5, 1.5, rows)), 0.6),
+        "Close Status": statuses,
+        "Close Status Change Dt": np.where(
+            statuses != "",
+            (pd.Timestamp("2026-06-01") - pd.to_timedelta(change_days, unit="D")).strftime("%Y-%m-%d"),
+            "",
+        ),
+        "Rev Change % (ST)": sparse(rng.normal(0, 30, rows).round(1), 0.4),
+        "Latest Funding Amount": sparse(np.round(rng.lognormal(14, 2, rows)), 0.25),
+        "Latest Funding Date": (pd.Timestamp("2026-06-01") - pd.to_timedelta(funding_days, unit="D")).strftime("%Y-%m-%d"),
+        "Employee Change % (GJ)": sparse(rng.normal(2, 15, rows).round(1), 0.5),
+        "Website URL": [f"https://synthetic{i}.example" for i in range(rows)],
+        "Country": np.where(rng.random(rows) < 0.5, "United States", "Finland"),
+    })
@@ -1 +1,33 @@
 # Turbine Scoring Engine
+#
+# Keep this package import-light: CLIs like `python -m engine.velocity` and
+# engine.client start without pandas, numpy, scipy or requests, and modules
+# import those only where they're used (or through LazyModule).
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def configure_logging() -> None:
+    """INFO logging for CLI runs (library imports leave logging alone)."""
+    import logging
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+
+class LazyModule:
+    """Module stand-in that imports the module on first attribute access.
+
+        np = LazyModule("numpy")   # nothing imported yet
+        np.zeros(3)                # numpy imported here
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            import importlib
+
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
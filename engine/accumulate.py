@@ -40,6 +40,8 @@ from typing import Optional
 
 import pandas as pd
 
+from engine.telemetry import timed_stage
+
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 SOURCES_DIR = _REPO_ROOT / "sources"
@@ -82,6 +84,7 @@ def load_accum(conference: str) -> pd.DataFrame:
         return pd.DataFrame(columns=ACCUM_COLUMNS)
 
 
+@timed_stage("accumulate", rows=lambda result, accum, new_data, *args, **kwargs: len(new_data))
 def add_source(
     accum: pd.DataFrame,
     new_data: pd.DataFrame,
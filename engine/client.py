@@ -0,0 +1,115 @@
+"""
+Client for the local scoring service (engine.service).
+
+Standard library only: it doesn't import pandas or the engine's scoring
+modules, so a call from a shell script or another tool costs an interpreter
+start plus one HTTP round trip.
+
+Usage:
+    python -m engine.client --first Ana --title "Head of Product" --company Supercell
+    python -m engine.client --json '[{"First Name": "Ana", "Company": "Supercell"}]'
+    python -m engine.client --health --socket /tmp/turbine.sock
+
+    from engine.client import ScoringClient
+
+    client = ScoringClient()
+    client.score_person({"First Name": "Ana", "Job Title": "CEO", "Company": "Supercell"})
+"""
+
+import http.client
+import json
+import socket
+from typing import Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ScoringClient:
+    """Keep-alive connection to a running scoring service."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 socket_path: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        if socket_path:
+            self.connection = _UnixHTTPConnection(socket_path, timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method: str, path: str, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = json.loads(response.read() or b"null")
+        if response.status != 200:
+            raise RuntimeError(f"{path} failed ({response.status}): {data.get('error', data)}")
+        return data
+
+    def score_person(self, record: Dict) -> Dict:
+        """Score one person record (First Name, Last Name, Job Title, Company)."""
+        return self._request("POST", "/score_person", record)
+
+    def score_batch(self, records: List[Dict]) -> List[Dict]:
+        """Score several person records in one request."""
+        return self._request("POST", "/score_batch", records)
+
+    def health(self) -> Dict:
+        """Loaded config, company count and reload stats."""
+        return self._request("GET", "/health")
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def main():
+    """CLI entrypoint for the scoring client."""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Score people with a running engine.service")
+    parser.add_argument("--first", default="", help="First Name")
+    parser.add_argument("--last", default="", help="Last Name")
+    parser.add_argument("--title", default="", help="Job Title")
+    parser.add_argument("--company", default="", help="Company")
+    parser.add_argument("--json", help="A person object or a list of them, as JSON ('-' reads stdin)")
+    parser.add_argument("--health", action="store_true", help="Print the service's health and exit")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Service address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Service port (default: {DEFAULT_PORT})")
+    parser.add_argument("--socket", help="Service Unix socket")
+    args = parser.parse_args()
+
+    client = ScoringClient(args.host, args.port, args.socket)
+    try:
+        if args.health:
+            result = client.health()
+        elif args.json:
+            payload = json.loads(sys.stdin.read() if args.json == "-" else args.json)
+            result = client.score_batch(payload) if isinstance(payload, list) else client.score_person(payload)
+        else:
+            result = client.score_person({
+                "First Name": args.first, "Last Name": args.last,
+                "Job Title": args.title, "Company": args.company,
+            })
+    except (OSError, RuntimeError) as e:
+        where = args.socket or f"{args.host}:{args.port}"
+        print(f"Scoring service at {where}: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        client.close()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
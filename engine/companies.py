@@ -11,28 +11,23 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
-from engine.config import load_config as _load_config
+from engine import configure_logging
 from engine.normalize import normalize_scores_0_100
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from engine.plan import ScoringPlan, load_plan
+from engine.telemetry import timed_stage
 
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 
 
 def load_config():
-    """Load scoring configuration from latest JSON file in configs/."""
-    config_dir = _REPO_ROOT / 'configs'
-    config_files = sorted(config_dir.glob('SCORE_TUNING_CONFIG_*.json'), reverse=True)
-    if not config_files:
-        return _load_config()
-    import json
-    config_path = config_files[0]
-    logging.info(f"Loading config: {config_path.name}")
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    """Load the compiled scoring plan for the latest config in configs/.
+
+    Shares engine.plan's hash-keyed cache with people scoring; the plan
+    still reads like the raw config dict.
+    """
+    return load_plan()
 
 
 def safe_float(value):
@@ -50,6 +45,9 @@ def safe_float(value):
 
 def calculate_percentile_score(value, series, invert=False):
     """Calculate percentile score (0-100) for value within series."""
+    # scipy is only needed once companies are actually scored
+    from scipy import stats
+
     if pd.isna(value):
         return 0.0
 
@@ -124,6 +122,8 @@ def calculate_status_score(status_value, change_date, config):
 
 def calculate_volatility_components(df: pd.DataFrame):
     """Calculate volatility sub-components per spec."""
+    from scipy import stats
+
     logging.info("   Calculating volatility sub-components...")
 
     # Revenue Change (weight 5)
@@ -238,15 +238,41 @@ def normalize_pillar(raw_scores):
     return normalized
 
 
+def company_pillar_weights(config) -> tuple:
+    """(Alignment, Budget, Demand) weights from a config dict or ScoringPlan."""
+    if isinstance(config, ScoringPlan):
+        weights = config.company_weights
+        return weights['Alignment'], weights['Budget'], weights['Demand']
+    pillars = config['companyScore']['pillars']
+    return pillars['Alignment']['weight'], pillars['Budget']['weight'], pillars['Demand']['weight']
+
+
+def rescore_company_weights(companies_df: pd.DataFrame, config) -> pd.DataFrame:
+    """Recompute Company Score from already-scored pillars under new pillar weights.
+
+    companyScore only feeds scoring through the three pillar weights, so a
+    weight change doesn't need the staging inputs: the stored (normalized)
+    Alignment/Budget/Demand columns reproduce score_companies exactly.
+    """
+    alignment_weight, budget_weight, demand_weight = company_pillar_weights(config)
+    total_weight = alignment_weight + budget_weight + demand_weight
+    company_scores_raw = [
+        (align * alignment_weight + budget * budget_weight + demand * demand_weight) / total_weight
+        for align, budget, demand in zip(companies_df['Alignment'], companies_df['Budget'], companies_df['Demand'])
+    ]
+    result_df = companies_df.copy()
+    result_df['Company Score'] = normalize_pillar(company_scores_raw)
+    return result_df
+
+
+@timed_stage("score companies")
 def score_companies(df: pd.DataFrame, config: dict) -> pd.DataFrame:
     """Score companies with all improvements per 2025-07-27 specification."""
     logging.info(f"Scoring {len(df):,} companies...")
 
     result_df = df.copy()
 
-    alignment_weight = config['companyScore']['pillars']['Alignment']['weight']
-    budget_weight = config['companyScore']['pillars']['Budget']['weight']
-    demand_weight = config['companyScore']['pillars']['Demand']['weight']
+    alignment_weight, budget_weight, demand_weight = company_pillar_weights(config)
 
     # ALIGNMENT PILLAR
     logging.info("Calculating Alignment pillar components...")
@@ -388,6 +414,7 @@ def score_companies(df: pd.DataFrame, config: dict) -> pd.DataFrame:
 
 def main():
     """Main company scoring workflow."""
+    configure_logging()
     start_time = datetime.now()
 
     logging.info("=" * 70)
@@ -3,17 +3,27 @@ Load scoring configuration from local JSON files or Google Sheets.
 
 Config files live in configs/ (timestamped JSON). The Google Sheets Apps Script
 endpoint is the authoritative source; cached JSONs avoid network round-trips.
+
+Refreshes compare a content hash of the fetched config against the latest
+cached file and only write a new file when something actually changed.
+Scorers refresh in a background thread (refresh_config_in_background), so a
+run never waits on the endpoint while a cached config exists.
+
+For offline testing, point TURBINE_CONFIG_URL at a local stand-in: a JSON file
+path / file:// URL, or an HTTP server started with
+    python -m engine.config --serve configs/SCORE_TUNING_CONFIG_....json
 """
 
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
 
-import requests
-
 # Resolve paths relative to repo root
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
@@ -21,16 +31,50 @@ _CONFIG_DIR = _REPO_ROOT / 'configs'
 
 # Google Sheets Web App endpoint
 CONFIG_URL = "https://script.google.com/macros/s/AKfycbxgWZsK0nSyDkh1XzNfLpWesAEBDHy2KKAmlnO4T73DAfNgszE46bwxUPPeE9AX6ZznNg/exec"
+# Override with a local file path, file:// URL or http://localhost stand-in
+CONFIG_URL_ENV = "TURBINE_CONFIG_URL"
+
+# Seconds between endpoint checks when a cached config exists
+REFRESH_MAX_AGE_SECONDS = 3600
+_REFRESH_STATE_FILE = os.path.join('.cache', 'refresh_state.json')
+
+_refresh_lock = threading.Lock()
+
+
+def get_config_url() -> str:
+    """Endpoint to fetch from: TURBINE_CONFIG_URL if set, else the Apps Script URL."""
+    return os.environ.get(CONFIG_URL_ENV) or CONFIG_URL
+
+
+def config_content_hash(config_data: dict) -> str:
+    """Stable hash of a config's content (key order and whitespace ignored)."""
+    canonical = json.dumps(config_data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _read_local_config(url: str) -> dict:
+    path = url[len('file://'):] if url.startswith('file://') else url
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
+def fetch_scoring_config(url: str = None) -> dict:
+    """Fetch the latest scoring/tuning config from the Google Sheet (or a stand-in)."""
+    url = url or get_config_url()
+    if not url.startswith(('http://', 'https://')):
+        print(f"Loading scoring config from local stand-in: {url}")
+        return _read_local_config(url)
+
+    # Only fetches need requests; runs on a cached config never import it
+    import requests
 
-def fetch_scoring_config() -> dict:
-    """Fetch the latest scoring/tuning config from the Google Sheet."""
     try:
-        print("Fetching latest scoring config from Google Sheets...")
-        response = requests.get(CONFIG_URL, timeout=15)
+        source = "Google Sheets" if url == CONFIG_URL else url
+        print(f"Fetching latest scoring config from {source}...")
+        response = requests.get(url, timeout=15)
         response.raise_for_status()
         config_data = response.json()
-        print("Successfully fetched config from Google Sheets")
+        print(f"Successfully fetched config from {source}")
         return config_data
     except requests.exceptions.RequestException as e:
         print(f"Error fetching config from Google Sheets: {e}")
@@ -54,9 +98,16 @@ def save_config_file(config_data: dict, config_dir: str = None) -> str:
     archive_dir = os.path.join(config_dir, 'archive')
     os.makedirs(archive_dir, exist_ok=True)
 
-    # Move existing config files to archive before saving new one
+    # Write the new file first (atomically) so a reader - or a background
+    # refresh cut short at exit - never sees configs/ without a config
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(config_data, f, indent=2)
+    os.replace(tmp_path, filepath)
+
+    # Then move the older config files to archive
     existing_configs = [f for f in os.listdir(config_dir)
-                        if f.startswith('SCORE_TUNING_CONFIG_') and f.endswith('.json')]
+                        if f.startswith('SCORE_TUNING_CONFIG_') and f.endswith('.json') and f != filename]
     for config_file in existing_configs:
         old_path = os.path.join(config_dir, config_file)
         new_path = os.path.join(archive_dir, config_file)
@@ -64,9 +115,6 @@ def save_config_file(config_data: dict, config_dir: str = None) -> str:
             os.rename(old_path, new_path)
             print(f"Archived old config: {config_file}")
 
-    with open(filepath, 'w') as f:
-        json.dump(config_data, f, indent=2)
-
     print(f"Saved config to: {filepath}")
     return filepath
 
@@ -101,9 +149,8 @@ def load_latest_config(config_dir: str = None) -> dict:
             return json.load(f)
     else:
         print("No local config found, fetching from Google Sheets...")
-        config_data = fetch_scoring_config()
-        save_config_file(config_data, config_dir)
-        return config_data
+        with open(update_config(force_refresh=True, config_dir=config_dir), 'r') as f:
+            return json.load(f)
 
 
 def load_config() -> dict:
@@ -111,36 +158,130 @@ def load_config() -> dict:
     return load_latest_config()
 
 
-def update_config(force_refresh: bool = False) -> str:
-    """Update the scoring config, optionally forcing a refresh from Google Sheets."""
-    config_dir = str(_CONFIG_DIR)
+def _load_refresh_state(config_dir: str) -> dict:
+    state_path = os.path.join(config_dir, _REFRESH_STATE_FILE)
+    try:
+        with open(state_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-    if force_refresh:
-        print("Force refresh requested - fetching latest config...")
-        config_data = fetch_scoring_config()
-        return save_config_file(config_data, config_dir)
 
-    latest_file = get_latest_config_file(config_dir)
-    if latest_file:
-        # Extract timestamp from filename
-        basename = os.path.basename(latest_file)
-        try:
-            parts = basename.replace('.json', '').split('_')
-            # SCORE_TUNING_CONFIG_YYYYMMDD_HHMMSS
-            file_date_str = parts[3]
-            file_time_str = parts[4]
-            file_dt = datetime.strptime(f"{file_date_str}_{file_time_str}", '%Y%m%d_%H%M%S')
-
-            now = datetime.now()
-            if (now - file_dt).total_seconds() < 3600:
-                print(f"Recent config exists: {basename}")
+def _save_refresh_state(config_dir: str, content_hash: str) -> None:
+    state_path = os.path.join(config_dir, _REFRESH_STATE_FILE)
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    with open(state_path, 'w') as f:
+        json.dump({'checked_at': time.time(), 'content_hash': content_hash}, f)
+
+
+def _seconds_since_check(config_dir: str, latest_file: str) -> float:
+    """Age of the last endpoint check (refresh state, else the filename timestamp)."""
+    checked_at = _load_refresh_state(config_dir).get('checked_at')
+    if checked_at:
+        return time.time() - checked_at
+
+    # SCORE_TUNING_CONFIG_YYYYMMDD_HHMMSS
+    try:
+        parts = os.path.basename(latest_file).replace('.json', '').split('_')
+        file_dt = datetime.strptime(f"{parts[3]}_{parts[4]}", '%Y%m%d_%H%M%S')
+        return (datetime.now() - file_dt).total_seconds()
+    except (IndexError, ValueError):
+        return float('inf')
+
+
+def update_config(force_refresh: bool = False, config_dir: str = None,
+                  max_age_seconds: float = REFRESH_MAX_AGE_SECONDS) -> str:
+    """Update the scoring config if the endpoint's content changed.
+
+    Args:
+        force_refresh: Check the endpoint even if the last check was recent.
+        config_dir: Config directory (defaults to configs/).
+        max_age_seconds: Skip the endpoint if it was checked this recently.
+
+    Returns:
+        Path of the latest config file (unchanged if the content hash matched).
+    """
+    if config_dir is None:
+        config_dir = str(_CONFIG_DIR)
+
+    with _refresh_lock:
+        latest_file = get_latest_config_file(config_dir)
+
+        if latest_file and not force_refresh:
+            if _seconds_since_check(config_dir, latest_file) < max_age_seconds:
+                print(f"Recent config exists: {os.path.basename(latest_file)}")
+                return latest_file
+
+        if force_refresh:
+            print("Force refresh requested - fetching latest config...")
+        else:
+            print("Fetching fresh config...")
+        config_data = fetch_scoring_config()
+        content_hash = config_content_hash(config_data)
+
+        if latest_file:
+            with open(latest_file, 'r') as f:
+                current_hash = config_content_hash(json.load(f))
+            if current_hash == content_hash:
+                _save_refresh_state(config_dir, content_hash)
+                print(f"Config unchanged (hash {content_hash[:12]}): {os.path.basename(latest_file)}")
                 return latest_file
-        except (IndexError, ValueError):
-            pass
 
-    print("Fetching fresh config...")
-    config_data = fetch_scoring_config()
-    return save_config_file(config_data, config_dir)
+        saved = save_config_file(config_data, config_dir)
+        _save_refresh_state(config_dir, content_hash)
+        return saved
+
+
+def refresh_config_in_background(config_dir: str = None,
+                                 max_age_seconds: float = REFRESH_MAX_AGE_SECONDS) -> threading.Thread:
+    """Check the endpoint for a newer config without blocking the caller.
+
+    If no config is cached yet there is nothing to score with, so this
+    refreshes synchronously instead. A changed config is picked up by the
+    next run; the current run keeps the config it already loaded.
+
+    Returns:
+        The refresh thread (already joined when the refresh ran synchronously).
+    """
+    def _refresh():
+        try:
+            update_config(config_dir=config_dir, max_age_seconds=max_age_seconds)
+        except Exception as e:
+            print(f"Background config refresh failed (using cached config): {e}")
+
+    thread = threading.Thread(target=_refresh, name='config-refresh', daemon=True)
+    thread.start()
+    if get_latest_config_file(config_dir) is None:
+        thread.join()
+    return thread
+
+
+def serve_config(config_path: str, port: int = 8765) -> None:
+    """Serve a config JSON over HTTP as a local stand-in for the Apps Script endpoint.
+
+    The file is re-read on every request, so edits show up on the next refresh.
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class _ConfigHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with open(config_path, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = HTTPServer(('127.0.0.1', port), _ConfigHandler)
+    print(f"Serving {config_path} at http://127.0.0.1:{port}/")
+    print(f"Use it with: {CONFIG_URL_ENV}=http://127.0.0.1:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 def main():
@@ -150,8 +291,14 @@ def main():
     parser = argparse.ArgumentParser(description='Update scoring configuration from Google Sheets')
     parser.add_argument('--force', action='store_true', help='Force refresh even if recent config exists')
     parser.add_argument('--test', action='store_true', help='Test config access after update')
+    parser.add_argument('--serve', metavar='CONFIG_JSON', help='Serve a config file as a local stand-in endpoint')
+    parser.add_argument('--port', type=int, default=8765, help='Port for --serve (default: 8765)')
     args = parser.parse_args()
 
+    if args.serve:
+        serve_config(args.serve, args.port)
+        return
+
     try:
         config_file = update_config(force_refresh=args.force)
 
@@ -0,0 +1,285 @@
+"""
+Delta rescoring: apply a tuning-config change to an already-scored output.
+
+When one keyword row changes in the "People Score - Components & Tuning"
+sheet, most people's scores can't move. diff_configs() works out which
+pillars/components changed between the config a prior output was scored
+with and the new one; rescore_with_config_delta() then:
+  - re-runs title scoring only for titles matched (under the old or the new
+    config) by a changed component — a component that matches neither
+    version of a title can't change its Seniority or Domain
+  - recomputes Company Scores from stored pillars only if companyScore changed
+  - recomputes contact/lead scores and master-stats normalization for
+    everyone (cheap arithmetic, no matching)
+
+Scored outputs carry a <stem>.meta.json sidecar (engine.outputs) recording
+the config hash they were scored with; the old config is the file in configs/
+or configs/archive/ with that hash. For outputs without one, pass
+--old-config.
+
+Usage:
+    python -m engine.delta --previous output/GDC_SAN_FRANCISCO_26_Scored_People_2026-03-01.tsv
+    python -m engine.delta --previous out.tsv --old-config configs/archive/SCORE_TUNING_CONFIG_....json
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine import configure_logging
+from engine.companies import rescore_company_weights
+from engine.engagement import person_keys, warmth_for_keys
+from engine.lead import calculate_lead_scores
+from engine.normalize import normalize_scores_array
+from engine.outputs import output_meta_path, read_output_meta, write_output_meta
+from engine.people import load_master_stats
+from engine.plan import PEOPLE_PILLARS, ScoringPlan, compile_config, load_plan_from_file
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+
+# peopleScore pillars whose components are matched against job titles
+TITLE_PILLARS = ("Seniority", "Domain", "One-Offs")
+
+
+def _config_dict(config) -> dict:
+    return config.config if isinstance(config, ScoringPlan) else config
+
+
+def _pillar_components(config: dict, pillar: str) -> dict:
+    components = config["peopleScore"]["pillars"].get(pillar, {}).get("components", {})
+    return components if isinstance(components, dict) else {}
+
+
+def diff_configs(old_config, new_config) -> Dict:
+    """Which parts of the scoring config changed between two versions.
+
+    Returns:
+        {"components": {pillar: [changed/added/removed component names]},
+         "people_weights": [people pillars whose weight changed],
+         "company": True if companyScore changed}
+    """
+    old, new = _config_dict(old_config), _config_dict(new_config)
+
+    components = {}
+    for pillar in TITLE_PILLARS:
+        old_components = _pillar_components(old, pillar)
+        new_components = _pillar_components(new, pillar)
+        changed = sorted(
+            name for name in set(old_components) | set(new_components)
+            if old_components.get(name) != new_components.get(name)
+        )
+        if changed:
+            components[pillar] = changed
+
+    old_pillars, new_pillars = old["peopleScore"]["pillars"], new["peopleScore"]["pillars"]
+    people_weights = [
+        pillar for pillar in PEOPLE_PILLARS
+        if old_pillars.get(pillar, {}).get("description") != new_pillars.get(pillar, {}).get("description")
+    ]
+
+    return {
+        "components": components,
+        "people_weights": people_weights,
+        "company": old.get("companyScore") != new.get("companyScore"),
+    }
+
+
+def _changed_regexes(plan: ScoringPlan, changed: Dict[str, List[str]]) -> list:
+    tables = {
+        "Seniority": [(name, regex) for name, _, regex in plan.seniority_components + plan.seniority_modifiers],
+        "Domain": [(name, regex) for name, _, _, regex in plan.domain_keywords],
+        "One-Offs": [(name, regex) for name, _, regex in plan.one_offs],
+    }
+    return [
+        regex
+        for pillar, names in changed.items()
+        for name, regex in tables.get(pillar, [])
+        if name in names
+    ]
+
+
+def affected_titles(titles, old_plan: ScoringPlan, new_plan: ScoringPlan, diff: Dict) -> Set[str]:
+    """Titles whose Seniority/Domain could change under the config diff."""
+    regexes = _changed_regexes(old_plan, diff["components"]) + _changed_regexes(new_plan, diff["components"])
+    if not regexes:
+        return set()
+    affected = set()
+    for title in set(titles):
+        if isinstance(title, str) and title.strip():
+            title_lower = title.lower()
+            if any(regex.search(title_lower) for regex in regexes):
+                affected.add(title)
+    return affected
+
+
+def _store_rows_for_matches(previous: pd.DataFrame, companies_df: pd.DataFrame) -> np.ndarray:
+    """Position in companies_df of each person's matched company (-1 if unmatched).
+
+    A few company names repeat in the store with different scores, so the
+    prior (rounded) Company Score disambiguates before falling back to name.
+    """
+    store = pd.DataFrame({
+        "name": companies_df["Company Name"].to_numpy(),
+        "rounded": companies_df["Company Score"].round().to_numpy(),
+        "row": np.arange(len(companies_df)),
+    })
+    by_name_and_score = store.drop_duplicates(["name", "rounded"]).set_index(["name", "rounded"])["row"]
+    by_name = store.drop_duplicates("name").set_index("name")["row"]
+
+    names = previous["Matched Company"]
+    prior = pd.to_numeric(previous["Company Score"], errors="coerce")
+    rows = pd.Series(list(zip(names, prior)), index=previous.index).map(by_name_and_score)
+    rows = rows.fillna(names.map(by_name))
+
+    matched = previous["Match Confidence"].astype(str).str.strip() != ""
+    return rows.where(matched, -1).fillna(-1).astype(int).to_numpy()
+
+
+def rescore_with_config_delta(
+    previous: pd.DataFrame,
+    old_config,
+    new_config,
+    companies_df: Optional[pd.DataFrame] = None,
+) -> Tuple[pd.DataFrame, Dict]:
+    """Produce the new scored output from a prior output plus a config change.
+
+    Args:
+        previous: Prior scored people output (read with dtype=str, keep_default_na=False).
+        old_config: Config (dict or ScoringPlan) the prior output was scored with.
+        new_config: Config to rescore under.
+        companies_df: Scored companies store. Defaults to store/companies.csv.
+
+    Returns:
+        (rescored DataFrame sorted by Lead Score, summary dict)
+    """
+    old_plan = old_config if isinstance(old_config, ScoringPlan) else compile_config(old_config)
+    new_plan = new_config if isinstance(new_config, ScoringPlan) else compile_config(new_config)
+    diff = diff_configs(old_plan, new_plan)
+
+    if companies_df is None:
+        companies_df = pd.read_csv(_REPO_ROOT / "store" / "companies.csv")
+
+    result = previous.copy()
+    titles = result["Job Title"].fillna("").astype(str)
+    seniority = pd.to_numeric(result["Seniority"], errors="coerce").fillna(0).to_numpy(dtype=float)
+    domain = pd.to_numeric(result["Domain"], errors="coerce").fillna(0).to_numpy(dtype=float)
+    # The Warmth column is rounded; rejoin the engagement store for exact values
+    warmth = warmth_for_keys(person_keys(result["First Name"], result["Last Name"], result["Company Name"]))
+
+    # Title scoring only where a changed component could match
+    affected = affected_titles(titles.unique(), old_plan, new_plan, diff)
+    if affected:
+        rescored = {title: new_plan.title_scores(title) for title in affected}
+        mask = titles.isin(affected).to_numpy()
+        pairs = [rescored[t] for t in titles[mask]]
+        seniority[mask] = [s for s, _ in pairs]
+        domain[mask] = [d for _, d in pairs]
+
+    # Company scores: exact store values, rescored only if companyScore changed
+    store_rows = _store_rows_for_matches(result, companies_df)
+    if diff["company"]:
+        companies_df = rescore_company_weights(companies_df, new_plan)
+    store_scores = companies_df["Company Score"].to_numpy(dtype=float)
+    matched = store_rows >= 0
+    company_score = np.where(matched, store_scores[np.where(matched, store_rows, 0)], 0.0)
+
+    raw_contact = new_plan.contact_score(seniority, domain, warmth)
+    has_title = titles.str.strip().ne("").to_numpy()
+    raw_lead = calculate_lead_scores(raw_contact, company_score, matched, has_title)
+
+    stats = load_master_stats()
+    contact = normalize_scores_array(raw_contact, stats.get("contact_score_min"), stats.get("contact_score_max"))
+    lead = normalize_scores_array(raw_lead, stats.get("lead_score_min"), stats.get("lead_score_max"))
+
+    result["Seniority"] = [round(s) for s in seniority]
+    result["Domain"] = [round(d) for d in domain]
+    result["Warmth"] = [round(w) for w in warmth]
+    result["Contact Score"] = np.round(contact).astype(int)
+    result["Lead Score"] = np.round(lead).astype(int)
+    result["Company Score"] = [round(cs) if cs > 0 else "" for cs in company_score]
+    result = result.sort_values("Lead Score", ascending=False, kind="stable").reset_index(drop=True)
+
+    summary = {
+        "diff": diff,
+        "titles_rescored": len(affected),
+        "people_rescored": int(titles.isin(affected).sum()),
+        "total_people": len(result),
+        "companies_rescored": diff["company"],
+    }
+    return result, summary
+
+
+def find_config_by_hash(config_hash: str, config_dir: Optional[str] = None) -> Optional[str]:
+    """Locate a config file (in configs/ or configs/archive/) by its content SHA-256."""
+    config_dir = Path(config_dir or _REPO_ROOT / "configs")
+    for directory in (config_dir, config_dir / "archive"):
+        if not directory.exists():
+            continue
+        for path in sorted(directory.glob("SCORE_TUNING_CONFIG_*.json"), reverse=True):
+            with open(path, "rb") as f:
+                if hashlib.sha256(f.read()).hexdigest() == config_hash:
+                    return str(path)
+    return None
+
+
+def main():
+    """CLI entrypoint for delta rescoring."""
+    import argparse
+    import time
+
+    from engine.plan import load_plan
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Rescore a prior output under a changed tuning config")
+    parser.add_argument("--previous", required=True, help="Prior scored people TSV")
+    parser.add_argument("--old-config", help="Config file the prior output was scored with")
+    parser.add_argument("--output", help="Where to write the rescored TSV (default: alongside --previous)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    previous = pd.read_csv(args.previous, sep="\t", dtype=str, keep_default_na=False)
+
+    old_config_file = args.old_config
+    if not old_config_file:
+        meta = read_output_meta(args.previous)
+        if not meta or not meta.get("config_hash"):
+            parser.error(f"{args.previous} has no {output_meta_path(args.previous).name} recording its config; "
+                         f"pass --old-config")
+        old_config_file = find_config_by_hash(meta["config_hash"])
+        if not old_config_file:
+            parser.error(f"no config in configs/ or configs/archive/ has hash {meta['config_hash'][:12]}; "
+                         f"pass --old-config")
+    old_plan = load_plan_from_file(old_config_file)
+    new_plan = load_plan()
+
+    if old_plan.config_hash == new_plan.config_hash:
+        print("Config unchanged since the prior output — nothing to rescore.")
+        return
+
+    rescored, summary = rescore_with_config_delta(previous, old_plan, new_plan)
+
+    output = args.output or args.previous.replace(".tsv", "_delta.tsv")
+    rescored.to_csv(output, sep="\t", index=False)
+    write_output_meta(output, new_plan.config_hash)
+
+    diff = summary["diff"]
+    print(f"\n=== CONFIG DELTA RESCORE ===")
+    print(f"Old config: {os.path.basename(old_config_file)}")
+    for pillar, names in diff["components"].items():
+        print(f"  {pillar}: {', '.join(names)}")
+    if diff["people_weights"]:
+        print(f"  People weights: {', '.join(diff['people_weights'])}")
+    print(f"  companyScore changed: {'yes' if diff['company'] else 'no'}")
+    print(f"Titles rescored: {summary['titles_rescored']} "
+          f"({summary['people_rescored']} of {summary['total_people']} people)")
+    print(f"Done in {time.perf_counter() - start:.2f}s -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Engagement event store backing the Warmth pillar.
+
+Per specs/people_scoring.md, Warmth is the recency of positive contact:
+  - Response (7 pts, half-life 6 months): responded positively to outreach,
+    or contacted Turbine (Close CRM)
+  - Engaged  (5 pts, half-life 3 months): engaged with our social content,
+    e.g. a LinkedIn post reaction
+Each event contributes points * 0.5 ** (days_old / half_life_days). A
+person's raw warmth is the sum over their events, normalized 0-100 against
+the warmest person in the store.
+
+Events live in store/engagement/events.csv (Person Key, Event Type,
+Timestamp, Source). Person Key is the accum dedup key, first|last|company
+lowercased. The enrichment scripts (close_crm, linkedin) append to it via
+add_engagement_events().
+
+Scoring loads the store once into a warmth index (person key -> 0-100) and
+joins people against it, so warmth costs one indexed lookup rather than a
+scan of events per person.
+
+Usage:
+    python -m engine.engagement --add sources/close_responses.csv --type Response
+    python -m engine.engagement --summary
+"""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+ENGAGEMENT_DIR = _REPO_ROOT / "store" / "engagement"
+EVENTS_FILE = ENGAGEMENT_DIR / "events.csv"
+
+EVENT_COLUMNS = ["Person Key", "Event Type", "Timestamp", "Source"]
+
+# Event type -> points and half-life, per the Warmth spec
+EVENT_TYPES = {
+    "Response": {"points": 7, "half_life_days": 180},
+    "Engaged": {"points": 5, "half_life_days": 90},
+}
+
+# (events file, mtime) -> warmth index, so repeated scoring calls load once
+_WARMTH_INDEX_CACHE = {}
+
+
+def person_keys(first_names, last_names, companies) -> pd.Series:
+    """Vectorized first|last|company key (same normalization as the accum dedup key)."""
+    parts = [
+        pd.Series(values, dtype=object).fillna("").astype(str).str.strip().str.lower().reset_index(drop=True)
+        for values in (first_names, last_names, companies)
+    ]
+    return parts[0] + "|" + parts[1] + "|" + parts[2]
+
+
+def load_engagement_events(events_file: Optional[Path] = None) -> pd.DataFrame:
+    """Load the event store (empty frame if none exists yet)."""
+    path = Path(events_file or EVENTS_FILE)
+    if not path.exists():
+        return pd.DataFrame(columns=EVENT_COLUMNS)
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def add_engagement_events(events: pd.DataFrame, events_file: Optional[Path] = None) -> int:
+    """Append events to the store, dropping exact duplicates.
+
+    The store is read once to find events it already has, and only the new
+    rows are appended, so an add costs one read of the store and no rewrite.
+    The file is in the order events were added; nothing depends on it being
+    sorted.
+
+    Args:
+        events: Person Key (or First Name/Last Name/Company or Company Name),
+            Event Type, Timestamp, and optionally Source.
+        events_file: Store path (defaults to store/engagement/events.csv).
+
+    Returns:
+        Number of new events written.
+    """
+    path = Path(events_file or EVENTS_FILE)
+    new = events.copy()
+    if "Person Key" not in new.columns:
+        company_column = next((col for col in ("Company", "Company Name") if col in new.columns), None)
+        if company_column is None:
+            raise ValueError("Engagement events need a Person Key, or First Name/Last Name plus a "
+                             "Company or Company Name column to build one")
+        new["Person Key"] = person_keys(new["First Name"], new["Last Name"], new[company_column]).to_numpy()
+    if "Source" not in new.columns:
+        new["Source"] = ""
+
+    unknown = sorted(set(new["Event Type"]) - set(EVENT_TYPES))
+    if unknown:
+        raise ValueError(f"Unknown engagement event types: {unknown} (expected {list(EVENT_TYPES)})")
+
+    def identity(frame):
+        return frame["Person Key"] + "\x00" + frame["Event Type"] + "\x00" + frame["Timestamp"]
+
+    new = new[EVENT_COLUMNS].astype(str).drop_duplicates(subset=["Person Key", "Event Type", "Timestamp"])
+    existing = load_engagement_events(path)
+    new = new[~identity(new).isin(identity(existing))]
+
+    os.makedirs(str(path.parent), exist_ok=True)
+    new.to_csv(path, mode="a", header=not path.exists(), index=False)
+    print(f"Added {len(new)} engagement events ({len(existing) + len(new)} total) to {path.name}")
+    return len(new)
+
+
+def raw_warmth_by_person(events: pd.DataFrame, now: Optional[datetime] = None) -> pd.Series:
+    """Sum of decayed event points per person key."""
+    if events.empty:
+        return pd.Series(dtype=float)
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    points = events["Event Type"].map({k: v["points"] for k, v in EVENT_TYPES.items()})
+    half_life = events["Event Type"].map({k: v["half_life_days"] for k, v in EVENT_TYPES.items()})
+    timestamps = pd.to_datetime(events["Timestamp"], utc=True, errors="coerce", format="mixed")
+    days_old = (pd.Timestamp(now) - timestamps).dt.days.clip(lower=0)
+
+    # Undated events count at full strength; unknown types count for nothing
+    decay = np.power(0.5, days_old / half_life).fillna(1.0)
+    contribution = (points * decay).fillna(0.0)
+    return contribution.groupby(events["Person Key"].to_numpy()).sum()
+
+
+def build_warmth_index(events: pd.DataFrame, now: Optional[datetime] = None) -> pd.Series:
+    """Person key -> Warmth (0-100), normalized against the warmest person."""
+    raw = raw_warmth_by_person(events, now)
+    if raw.empty or raw.max() <= 0:
+        return pd.Series(dtype=float)
+    return raw / raw.max() * 100
+
+
+def load_warmth_index(events_file: Optional[Path] = None) -> pd.Series:
+    """Warmth index for the event store, rebuilt only when the file changes."""
+    path = Path(events_file or EVENTS_FILE)
+    if not path.exists():
+        return pd.Series(dtype=float)
+    cache_key = (str(path), path.stat().st_mtime_ns, datetime.now(timezone.utc).date())
+    if cache_key not in _WARMTH_INDEX_CACHE:
+        _WARMTH_INDEX_CACHE.clear()
+        _WARMTH_INDEX_CACHE[cache_key] = build_warmth_index(load_engagement_events(path))
+    return _WARMTH_INDEX_CACHE[cache_key]
+
+
+def warmth_for_keys(keys, warmth_index: Optional[pd.Series] = None) -> np.ndarray:
+    """Warmth (0-100) for each person key; 0 for people with no events."""
+    if warmth_index is None:
+        warmth_index = load_warmth_index()
+    keys = pd.Series(keys, dtype=object)
+    if warmth_index.empty:
+        return np.zeros(len(keys))
+    return keys.map(warmth_index).fillna(0.0).to_numpy(dtype=float)
+
+
+def main():
+    """CLI entrypoint for the engagement store."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the engagement event store behind Warmth")
+    parser.add_argument("--add", help="CSV/TSV of events to append")
+    parser.add_argument("--type", choices=sorted(EVENT_TYPES), help="Event Type for files without that column")
+    parser.add_argument("--source", default="", help="Source label for files without a Source column")
+    parser.add_argument("--summary", action="store_true", help="Print warmth distribution")
+    args = parser.parse_args()
+
+    if args.add:
+        sep = "\t" if args.add.lower().endswith(".tsv") else ","
+        events = pd.read_csv(args.add, sep=sep, dtype=str, keep_default_na=False)
+        if "Event Type" not in events.columns:
+            if not args.type:
+                parser.error("--type is required when the file has no Event Type column")
+            events["Event Type"] = args.type
+        if "Source" not in events.columns:
+            events["Source"] = args.source
+        add_engagement_events(events)
+
+    if args.summary or not args.add:
+        events = load_engagement_events()
+        index = build_warmth_index(events)
+        print(f"\n=== ENGAGEMENT STORE ===")
+        print(f"Events: {len(events)}")
+        for event_type, count in events["Event Type"].value_counts().items():
+            print(f"  {event_type}: {count}")
+        print(f"People with warmth: {len(index)}")
+        if not index.empty:
+            print(f"Warmth median {index.median():.1f}, p90 {index.quantile(0.9):.1f}")
+
+
+if __name__ == "__main__":
+    main()
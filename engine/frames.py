@@ -0,0 +1,126 @@
+"""
+Compact in-memory representation for scored people frames.
+
+Scored outputs, accums and the master list are read with dtype=str, so
+every cell is a separate Python string. A score is then a '' or a
+'45'-string object, and a Source like "MTM Scrape" is repeated on every
+row. At 100K+ rows that is most of the process's memory. compact_frame()
+keeps the same values in lean dtypes:
+
+  - score columns -> nullable Float32 ('' -> <NA>)
+  - repeated labels (Source, Country, Matched Company, ...) -> category
+  - Extra Data (free-text JSON) left on disk by read_scored_frame() and
+    loaded on demand with load_extra_data()
+
+Float32 holds every whole score exactly, and so fractional ones like 97.5;
+a column with a value float32 can't hold exactly (e.g. 33.3) is left as it
+is rather than rounded. Writing a compact frame with
+to_csv(float_format=SCORE_FLOAT_FORMAT) produces the same file as writing
+the original, since <NA> is written as '' and the scores print the same.
+
+Usage:
+    from engine.frames import compact_frame, read_scored_frame, load_extra_data
+
+    scored = read_scored_frame("output/GDC_..._Scored_People_2026-03-01.tsv")
+    scored["Extra Data"] = load_extra_data(path)      # only when needed
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+SCORE_COLUMNS = (
+    "Lead Score", "Contact Score", "Company Score", "Seniority", "Domain", "Warmth", "Match Confidence",
+)
+CATEGORY_COLUMNS = (
+    "Source", "Country", "Matched Company", "Score Version", "Source List", "Master Added At",
+)
+EXTRA_DATA_COLUMN = "Extra Data"
+
+# Prints Float32 scores as they were read ("45", not "45.0")
+SCORE_FLOAT_FORMAT = "%.7g"
+
+
+def _compact_scores(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.Float32Dtype):
+        return series
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        numeric = series
+    else:
+        numeric = pd.to_numeric(series, errors="coerce")
+        # Anything that wasn't blank must parse
+        if (numeric.isna() & series.notna() & series.astype(str).str.strip().ne("")).any():
+            return series
+    compact = numeric.astype("Float32")
+    present = numeric.dropna().to_numpy(dtype=float)
+    if not (compact.dropna().to_numpy(dtype=float) == present).all():
+        return series
+    return compact
+
+
+def compact_frame(df: pd.DataFrame, score_columns: Iterable[str] = SCORE_COLUMNS,
+                  category_columns: Iterable[str] = CATEGORY_COLUMNS) -> pd.DataFrame:
+    """Same frame in lean dtypes: Float32 scores and categorical repeated labels.
+
+    Args:
+        df: Scored people, accum or master frame (any subset of the columns).
+        score_columns: Columns to store as nullable Float32 when it holds them exactly.
+        category_columns: Columns to store as category.
+
+    Returns:
+        A new frame; df is not modified.
+    """
+    compact = df.copy(deep=False)
+    for column in score_columns:
+        if column in compact.columns:
+            compact[column] = _compact_scores(compact[column])
+    for column in category_columns:
+        if column in compact.columns and not isinstance(compact[column].dtype, pd.CategoricalDtype):
+            compact[column] = compact[column].astype("category")
+    return compact
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """Deep memory usage of a frame, in MB."""
+    return round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2)
+
+
+def _sep(path) -> str:
+    return "\t" if Path(path).suffix.lower() == ".tsv" else ","
+
+
+def read_scored_frame(path, extra_data: bool = False) -> pd.DataFrame:
+    """Read a scored people TSV/CSV straight into compact dtypes.
+
+    Args:
+        path: Scored output, accum or master list.
+        extra_data: Also load the Extra Data column (default: leave it on
+            disk; see load_extra_data).
+    """
+    columns = pd.read_csv(path, sep=_sep(path), nrows=0).columns
+    usecols = [c for c in columns if extra_data or c != EXTRA_DATA_COLUMN]
+    # Scores parse as numbers and labels straight to category codes, never
+    # as columns of strings; only blank scores count as missing
+    dtype = {c: ("category" if c in CATEGORY_COLUMNS else str) for c in usecols if c not in SCORE_COLUMNS}
+    df = pd.read_csv(path, sep=_sep(path), usecols=usecols, dtype=dtype, keep_default_na=False,
+                     na_values={c: [""] for c in usecols if c in SCORE_COLUMNS})
+    return compact_frame(df[usecols])
+
+
+def load_extra_data(path, index: Optional[pd.Index] = None) -> pd.Series:
+    """Extra Data from a people file, optionally only for some row positions.
+
+    Args:
+        path: The file the frame was read from.
+        index: Row positions to return (e.g. the index after filtering/deduping
+            a frame read with read_scored_frame). Default: every row.
+    """
+    columns = pd.read_csv(path, sep=_sep(path), nrows=0).columns
+    if EXTRA_DATA_COLUMN not in columns:
+        rows = len(pd.read_csv(path, sep=_sep(path), usecols=[columns[0]], dtype=str, keep_default_na=False))
+        values = pd.Series("", index=pd.RangeIndex(rows), dtype=object)
+    else:
+        values = pd.read_csv(path, sep=_sep(path), usecols=[EXTRA_DATA_COLUMN], dtype=str,
+                             keep_default_na=False)[EXTRA_DATA_COLUMN]
+    return values if index is None else values.reindex(index)
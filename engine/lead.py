@@ -6,19 +6,104 @@ Penalties:
   - No company match, has title: Contact Score * 0.3  (70% penalty)
   - Has company, no title: Company Score * 0.3  (70% penalty)
   - No company, no title: 5.0
+
+Since Company Score is at most the store's maximum, a person's Lead Score is
+bounded before matching them to a company (lead_score_upper_bounds); top-leads
+runs only match the people whose bound can still make the cut
+(branch_and_bound).
 """
 
+import heapq
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+
+def calculate_lead_scores(contact_scores, company_scores,
+                          has_company_match, has_job_title) -> np.ndarray:
+    """Array form of calculate_lead_score: one Lead Score per element.
+
+    Args:
+        contact_scores: Raw contact scores (array-like of float).
+        company_scores: Company scores (array-like of float).
+        has_company_match: Array-like of bool.
+        has_job_title: Array-like of bool.
+
+    Returns:
+        float64 array, identical to calling calculate_lead_score per element.
+    """
+    contact = np.asarray(contact_scores, dtype=float)
+    company = np.asarray(company_scores, dtype=float)
+    matched = np.asarray(has_company_match, dtype=bool)
+    titled = np.asarray(has_job_title, dtype=bool)
+
+    lead = np.select(
+        [matched & titled, matched & ~titled, ~matched & titled],
+        [(contact / 100.0) * company, company * 0.3, contact * 0.3],
+        default=5.0,
+    )
+    # max(0, min(100, x)) maps NaN to 100; keep that so both forms agree
+    return np.where(np.isnan(lead), 100.0, np.clip(lead, 0.0, 100.0))
+
 
 def calculate_lead_score(contact_score: float, company_score: float,
                          has_company_match: bool, has_job_title: bool) -> float:
     """Calculate final Lead Score based on Contact Score and Company Score."""
-    if has_company_match and has_job_title:
-        lead_score = (contact_score / 100.0) * company_score
-    elif has_company_match and not has_job_title:
-        lead_score = company_score * 0.3
-    elif not has_company_match and has_job_title:
-        lead_score = contact_score * 0.3
-    else:
-        lead_score = 5.0
-
-    return max(0.0, min(100.0, lead_score))
+    return float(calculate_lead_scores([contact_score], [company_score],
+                                       [has_company_match], [has_job_title])[0])
+
+
+def lead_score_upper_bounds(contact_scores, has_job_title, max_company_score: float) -> np.ndarray:
+    """Highest Lead Score each person could get from any company match.
+
+    Args:
+        contact_scores: Raw contact scores (array-like of float).
+        has_job_title: Array-like of bool.
+        max_company_score: Highest Company Score in the store (NaN if some
+            company has none, since a match on it scores 100).
+
+    Returns:
+        float64 array, >= calculate_lead_scores for every possible match
+        (or no match).
+    """
+    contact = np.asarray(contact_scores, dtype=float)
+    titled = np.asarray(has_job_title, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        bound = np.where(
+            titled,
+            np.maximum((contact / 100.0) * max_company_score, contact * 0.3),
+            max(max_company_score * 0.3, 5.0),
+        )
+    return np.where(np.isnan(bound), 100.0, np.clip(bound, 0.0, 100.0))
+
+
+def branch_and_bound(bounds, exact_score: Callable[[int], float], min_score: Optional[float] = None,
+                     top_k: Optional[int] = None) -> Dict[int, float]:
+    """Evaluate exact scores in descending bound order, stopping once no one left can make the cut.
+
+    Args:
+        bounds: Upper bound on each position's exact score.
+        exact_score: position -> exact score (the expensive part, e.g. company matching).
+        min_score: Skip positions whose bound is below this.
+        top_k: Stop once the k-th best exact score beats every remaining bound.
+
+    Returns:
+        {position: exact score} for every position evaluated. Anyone not
+        evaluated scores below min_score or below the top_k-th exact score.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    scores: Dict[int, float] = {}
+    best: list = []  # min-heap of the top_k exact scores so far
+    for position in np.argsort(-bounds, kind="stable").tolist():
+        bound = bounds[position]
+        if min_score is not None and bound < min_score:
+            break
+        if top_k is not None and len(best) >= top_k and bound < best[0]:
+            break
+        score = scores[position] = exact_score(position)
+        if top_k is not None and (min_score is None or score >= min_score):
+            if len(best) < top_k:
+                heapq.heappush(best, score)
+            elif score > best[0]:
+                heapq.heapreplace(best, score)
+    return scores
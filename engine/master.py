@@ -3,6 +3,9 @@ Build and maintain the master people list by aggregating all scored people files
 
 Migrated from build_master_people_list.py. Scans output/ and store/ for scored
 people files, deduplicates by (name, title, company), keeps newest per event.
+
+Lists are read in compact dtypes (engine.frames) without their Extra Data,
+which is loaded back only for the rows that survive deduplication.
 """
 
 import json
@@ -14,6 +17,9 @@ from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from engine.frames import SCORE_COLUMNS, compact_frame, load_extra_data, read_scored_frame
+from engine.telemetry import stage
+
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 OUTPUT_DIR = _REPO_ROOT / "output"
@@ -129,8 +135,8 @@ def _select_latest_per_event(files: List[str]) -> Dict[str, str]:
 
 
 def _read_people_file(path: str) -> pd.DataFrame:
-    sep = "\t" if path.lower().endswith(".tsv") else ","
-    return pd.read_csv(path, sep=sep, dtype=str, keep_default_na=False)
+    # Extra Data stays on disk until _attach_extra_data
+    return read_scored_frame(path)
 
 
 def _get_col(df: pd.DataFrame, *names: str) -> Optional[str]:
@@ -189,6 +195,8 @@ def _map_to_target(df: pd.DataFrame, source_path: str) -> pd.DataFrame:
     mapped["Job Title"] = df[title_col] if title_col else ""
     mapped["Company Name"] = df[company_col] if company_col else ""
     mapped["Extra Data"] = df[extra_col] if extra_col else ""
+    # Row in the source file, so Extra Data can be loaded after deduping
+    mapped["__row"] = df.index
     mapped["Lead Score"] = _to_number(df[lead_col]) if lead_col else pd.Series(dtype=float)
     mapped["Contact Score"] = _to_number(df[contact_col]) if contact_col else pd.Series(dtype=float)
     mapped["Company Score"] = _to_number(df[company_score_col]) if company_score_col else pd.Series(dtype=float)
@@ -229,7 +237,8 @@ def _dedupe_master(df: pd.DataFrame, file_dates: Dict[str, Optional[datetime]])
 
     updated = pd.to_datetime(df["Date Updated"], errors="coerce")
     created = pd.to_datetime(df["Date Created"], errors="coerce")
-    fallback_dates = df["Source List"].map(lambda path: file_dates.get(path))
+    # Source List is categorical; map plain strings, not its categories
+    fallback_dates = df["Source List"].astype(str).map(lambda path: file_dates.get(path))
     fallback_parsed = pd.to_datetime(fallback_dates, errors="coerce")
     df["__dedupe_date"] = updated.fillna(created).fillna(fallback_parsed)
 
@@ -239,6 +248,15 @@ def _dedupe_master(df: pd.DataFrame, file_dates: Dict[str, Optional[datetime]])
     return df
 
 
+def _attach_extra_data(df: pd.DataFrame) -> pd.DataFrame:
+    extra = pd.Series("", index=df.index, dtype=object)
+    for source_list, rows in df.groupby("Source List", observed=True)["__row"]:
+        values = load_extra_data(_REPO_ROOT / source_list, pd.Index(rows.to_numpy()))
+        extra.loc[rows.index] = values.fillna("").to_numpy()
+    df["Extra Data"] = extra
+    return df.drop(columns=["__row"])
+
+
 def build_master_people_list() -> None:
     """Build or rebuild the master people list from all scored files."""
     candidates = _list_candidate_files()
@@ -250,29 +268,40 @@ def build_master_people_list() -> None:
     mapped_frames = []
     file_dates: Dict[str, Optional[datetime]] = {}
 
-    for event_key, path in selected.items():
-        try:
-            df = _read_people_file(path)
-        except Exception:
-            continue
+    with stage("master: read lists") as read_stage:
+        for event_key, path in selected.items():
+            try:
+                df = _read_people_file(path)
+            except Exception:
+                continue
 
-        lower_cols = [c.lower() for c in df.columns]
-        if not any(col in lower_cols for col in ["lead score", "total score", "contact score", "job score"]):
-            continue
+            lower_cols = [c.lower() for c in df.columns]
+            if not any(col in lower_cols for col in ["lead score", "total score", "contact score", "job score"]):
+                continue
 
-        mapped = _map_to_target(df, path)
-        mapped_frames.append(mapped)
+            mapped = _map_to_target(df, path)
+            mapped_frames.append(mapped)
 
-        filename_date = _parse_date_from_filename(os.path.basename(path))
-        file_dates[os.path.relpath(path, str(_REPO_ROOT))] = filename_date
+            filename_date = _parse_date_from_filename(os.path.basename(path))
+            file_dates[os.path.relpath(path, str(_REPO_ROOT))] = filename_date
+        read_stage["rows"] = sum(len(frame) for frame in mapped_frames)
 
     if not mapped_frames:
         raise RuntimeError("No scored people lists matched the required schema.")
 
-    master_df = pd.concat(mapped_frames, ignore_index=True)
-    master_df = master_df[~master_df["Source List"].isin(EXCLUDED_SOURCE_LISTS)]
-    master_df = master_df.reindex(columns=TARGET_COLUMNS)
-    master_df = _dedupe_master(master_df, file_dates)
+    with stage("master: dedupe", rows=read_stage["rows"]):
+        master_df = pd.concat(mapped_frames, ignore_index=True)
+        del mapped_frames
+        master_df = master_df[~master_df["Source List"].isin(EXCLUDED_SOURCE_LISTS)]
+        master_df = compact_frame(master_df.reindex(columns=TARGET_COLUMNS + ["__row"]))
+        master_df = _dedupe_master(master_df, file_dates)
+
+    with stage("master: load extra data", rows=len(master_df)):
+        master_df = _attach_extra_data(master_df)
+
+    # people.csv has always carried float scores ("81.0")
+    for column in SCORE_COLUMNS:
+        master_df[column] = master_df[column].astype(float)
 
     os.makedirs(str(STORE_DIR), exist_ok=True)
     master_df.to_csv(str(MASTER_LIST_PATH), index=False)
@@ -139,7 +139,29 @@ def normalize_scores(scores: List[float],
     if max_score == min_score:
         return scores
 
-    return [(score - min_score) / (max_score - min_score) * 100 for score in scores]
+    return normalize_scores_array(np.asarray(scores, dtype=float), min_score, max_score).tolist()
+
+
+def normalize_scores_array(scores: np.ndarray,
+                           min_score: Optional[float] = None,
+                           max_score: Optional[float] = None) -> np.ndarray:
+    """Array form of normalize_scores: min-max scale to 0-100.
+
+    Returns the input unchanged (as float) when it's empty or min == max.
+    """
+    scores = np.asarray(scores, dtype=float)
+    if scores.size == 0:
+        return scores
+
+    if min_score is None:
+        min_score = scores.min()
+    if max_score is None:
+        max_score = scores.max()
+
+    if max_score == min_score:
+        return scores
+
+    return (scores - min_score) / (max_score - min_score) * 100
 
 
 def normalize_scores_0_100(scores):
@@ -20,15 +20,24 @@ Usage:
     # new_scored: DataFrame from scoring engine output
     # prior_notes: DataFrame exported from prior Scored People tab (or notes CSV)
     merged = merge_dk_notes(new_scored, prior_notes)
+
+    # Each iteration's annotations are appended to one history per conference
+    save_notes_snapshot(merged, "gdc_sf_26", "v4")
+    history = load_notes_history("gdc_sf_26")
+    get_note_history(history, "Jane Doe", "Moon Active")
 """
 
 import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from engine.normalize import normalize_company_name
+from engine.telemetry import timed_stage
+
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 NOTES_DIR = _REPO_ROOT / "store" / "notes"
@@ -43,25 +52,136 @@ DK_COLUMNS = [
 
 # Match key: how we identify the same person across iterations
 # Using Full Name + Company Name — same logic as master list dedup
-def _match_key(row: pd.Series) -> str:
-    """Generate a stable match key for a person row."""
-    name = str(row.get("Full Name", "")).strip().lower()
-    company = str(row.get("Company Name", "")).strip().lower()
-    return f"{name}|{company}"
+def _match_keys(df: pd.DataFrame) -> pd.Series:
+    """Generate stable match keys for every person row in a frame."""
+    def _norm(col: str) -> pd.Series:
+        if col not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        return df[col].fillna("").astype(str).str.strip().str.lower()
+
+    return _norm("Full Name") + "|" + _norm("Company Name")
+
+
+def _non_empty(values: pd.DataFrame) -> pd.DataFrame:
+    """Boolean mask of cells holding a real (non-blank, non-NaN) value."""
+    return values.notna() & values.astype(str).apply(lambda col: col.str.strip().ne(""))
+
 
+# Fuzzy carry-forward: notes that miss the exact key get a second chance
+# within blocks of (normalized company, last name), so "Supercell Oy" vs
+# "Supercell" or "Mary Ng" vs "Mary J. Ng" still carry over. The full first
+# name must match: "Jon Smith" and "Jonathan Smith" (or "Jane" and "Jake")
+# at one company may be different people, and a wrong carry is worse than a
+# missed one.
+MATCH_CONFIDENCE_COLUMN = "DK Match Confidence"
+MIN_FUZZY_CONFIDENCE = 85.0
 
+
+def _name_tokens(name) -> List[str]:
+    if not isinstance(name, str):
+        return []
+    return re.sub(r"[^a-z0-9\s]", " ", name.lower()).split()
+
+
+def _name_similarity(tokens_a: List[str], tokens_b: List[str]) -> float:
+    """Name similarity (0-100) for two people already sharing a last name.
+
+    Only the same full first name scores above MIN_FUZZY_CONFIDENCE;
+    short forms and near-spellings of it score 0.
+    """
+    if tokens_a == tokens_b:
+        # Same name once case and punctuation are ignored
+        return 95.0
+    if tokens_a[0] == tokens_b[0]:
+        # Same first + last, differing middle names/initials
+        return 92.0
+    return 0.0
+
+
+def _block_keys(names: pd.Series, companies: pd.Series) -> Tuple[List[str], List[List[str]]]:
+    """Blocking key (normalized company | last name) and name tokens per row."""
+    tokens = [_name_tokens(n) for n in names]
+    companies = companies.fillna("").astype(str)
+    company_norm = {c: normalize_company_name(c) for c in companies.unique()}
+    keys = []
+    for company, name_tokens in zip(companies, tokens):
+        norm = company_norm[company]
+        keys.append(f"{norm}|{name_tokens[-1]}" if norm and name_tokens else "")
+    return keys, tokens
+
+
+def _fuzzy_carry(
+    new_names: pd.Series,
+    new_companies: pd.Series,
+    prior_names: pd.Series,
+    prior_companies: pd.Series,
+    min_confidence: float = MIN_FUZZY_CONFIDENCE,
+) -> Dict:
+    """Match leftover new rows to leftover prior rows inside blocks.
+
+    Each prior row is used at most once; best-confidence pairs are taken
+    first. Comparisons only happen within a block, so the pass stays
+    near-linear in list size.
+
+    Returns:
+        {new_index: (prior_index, confidence)}
+    """
+    new_blocks, new_tokens = _block_keys(new_names, new_companies)
+    prior_blocks, prior_tokens = _block_keys(prior_names, prior_companies)
+
+    candidates_by_block: Dict[str, List[int]] = {}
+    for pos, block in enumerate(prior_blocks):
+        if block:
+            candidates_by_block.setdefault(block, []).append(pos)
+
+    pairs = []
+    for new_pos, block in enumerate(new_blocks):
+        for prior_pos in candidates_by_block.get(block, ()) if block else ():
+            confidence = _name_similarity(new_tokens[new_pos], prior_tokens[prior_pos])
+            if confidence >= min_confidence:
+                pairs.append((confidence, new_pos, prior_pos))
+
+    new_index = list(new_names.index)
+    prior_index = list(prior_names.index)
+    matches = {}
+    used_prior = set()
+    for confidence, new_pos, prior_pos in sorted(pairs, key=lambda p: -p[0]):
+        if new_index[new_pos] in matches or prior_pos in used_prior:
+            continue
+        matches[new_index[new_pos]] = (prior_index[prior_pos], round(confidence))
+        used_prior.add(prior_pos)
+    return matches
+
+
+@timed_stage("merge dk notes")
 def merge_dk_notes(
     new_scored: pd.DataFrame,
     prior_notes: pd.DataFrame,
     fill_missing: bool = True,
+    fuzzy: bool = True,
+    match_confidence: bool = False,
 ) -> pd.DataFrame:
     """Merge DK annotations from a prior iteration into new scored output.
 
+    A single left hash-join on the normalized match key: prior notes are
+    deduplicated (last row wins), indexed by key, and looked up for every
+    new row at once. For each DK column a non-empty prior value wins;
+    otherwise whatever new_scored already held (or "") is kept.
+
+    People that miss the exact key then go through a blocked fuzzy pass
+    (same normalized company + last name, same first name).
+
     Args:
         new_scored: New scoring output (from scoring engine).
         prior_notes: Prior iteration's scored people WITH DK columns
                      (exported from Google Sheet or from store/notes/).
+                     Not modified.
         fill_missing: If True, add empty DK columns for people without prior notes.
+        fuzzy: If True, run the blocked fuzzy pass for unmatched people.
+        match_confidence: If True, add MATCH_CONFIDENCE_COLUMN: 100 for exact
+            matches, the name similarity for fuzzy ones, blank when nothing
+            was carried. Off by default so the Sheet's column layout is
+            unchanged.
 
     Returns:
         new_scored with DK columns merged in. People who existed in prior
@@ -79,103 +199,203 @@ def merge_dk_notes(
                 result[col] = ""
         return result
 
-    # Build lookup from prior notes: match_key -> DK values
-    prior_notes["_match_key"] = prior_notes.apply(_match_key, axis=1)
-    dk_lookup = {}
-    for _, row in prior_notes.iterrows():
-        key = row["_match_key"]
-        if key and key != "|":  # skip empty rows
-            dk_lookup[key] = {col: row.get(col, "") for col in available_dk_cols}
+    # Build lookup from prior notes: match_key -> DK values (skip empty rows)
+    prior_keys = _match_keys(prior_notes)
+    prior = prior_notes.reindex(columns=["Full Name", "Company Name"] + available_dk_cols)
+    prior.index = prior_keys.values
+    prior = prior[prior.index != "|"]
+    prior = prior[~prior.index.duplicated(keep="last")]
+
+    # Exact pass: left join onto the new scored output by key
+    new_keys = _match_keys(result)
+    is_exact = pd.Series(new_keys.isin(prior.index).values, index=result.index)
+    carried_keys = new_keys.where(is_exact)
+    confidence = pd.Series("", index=result.index, dtype=object)
+    confidence[is_exact] = 100
+
+    # Fuzzy pass: leftover new people vs prior notes nobody claimed
+    fuzzy_matched = 0
+    if fuzzy:
+        leftover_new = result.loc[~is_exact]
+        leftover_prior = prior[~prior.index.isin(new_keys[is_exact])]
+        if len(leftover_new) and len(leftover_prior):
+            fuzzy_matches = _fuzzy_carry(
+                leftover_new.get("Full Name", pd.Series("", index=leftover_new.index)),
+                leftover_new.get("Company Name", pd.Series("", index=leftover_new.index)),
+                leftover_prior["Full Name"],
+                leftover_prior["Company Name"],
+            )
+            if fuzzy_matches:
+                fuzzy_idx = list(fuzzy_matches)
+                carried_keys.loc[fuzzy_idx] = [fuzzy_matches[i][0] for i in fuzzy_idx]
+                confidence.loc[fuzzy_idx] = [fuzzy_matches[i][1] for i in fuzzy_idx]
+            fuzzy_matched = len(fuzzy_matches)
+
+    # Column-wise coalesce, keeping new_scored's row order and index
+    joined = prior[available_dk_cols].reindex(carried_keys.values)
+    joined.index = result.index
 
-    # Apply to new scored output
-    result["_match_key"] = result.apply(_match_key, axis=1)
-
-    matched = 0
     for col in DK_COLUMNS:
-        result[col] = ""  # initialize all empty
-
-    for idx, row in result.iterrows():
-        key = row["_match_key"]
-        if key in dk_lookup:
-            for col in available_dk_cols:
-                val = dk_lookup[key].get(col, "")
-                if pd.notna(val) and str(val).strip():
-                    result.at[idx, col] = val
-            matched += 1
+        existing = result[col].fillna("") if col in result.columns else ""
+        if col in available_dk_cols:
+            prior_vals = joined[[col]]
+            result[col] = prior_vals[col].where(_non_empty(prior_vals)[col], existing)
+        else:
+            result[col] = existing
+    if match_confidence:
+        result[MATCH_CONFIDENCE_COLUMN] = confidence
 
-    result.drop(columns=["_match_key"], inplace=True)
+    matched = int(carried_keys.notna().sum())
 
     # Stats
-    total_with_notes = sum(1 for _, row in prior_notes.iterrows()
-                           if any(str(row.get(c, "")).strip() for c in available_dk_cols))
+    total_with_notes = int(_non_empty(prior_notes[available_dk_cols]).any(axis=1).sum())
     print(f"\n=== DK NOTES MERGE ===")
     print(f"Prior iteration: {len(prior_notes)} people, {total_with_notes} with DK notes")
     print(f"New iteration: {len(result)} people")
-    print(f"Notes carried forward: {matched} people matched")
+    print(f"Notes carried forward: {matched} people matched "
+          f"({matched - fuzzy_matched} exact, {fuzzy_matched} fuzzy)")
     print(f"New people (no prior notes): {len(result) - matched}")
 
     return result
 
 
+# Notes history: one append-only long-format CSV per conference, one row per
+# (person, version). Row order is chronological, so "latest" never depends on
+# how version labels sort ("v10" vs "v9").
+HISTORY_ID_COLUMNS = ["Person Key", "Version", "Recorded At"]
+HISTORY_PERSON_COLUMNS = ["Full Name", "Job Title", "Company Name", "Lead Score"]
+HISTORY_COLUMNS = HISTORY_ID_COLUMNS + HISTORY_PERSON_COLUMNS + DK_COLUMNS
+
+
+def _history_path(conference: str, notes_dir: Optional[Path] = None) -> Path:
+    return Path(notes_dir or NOTES_DIR) / f"{conference}_dk_notes_history.csv"
+
+
+def _version_number(version: str) -> int:
+    match = re.search(r"v(\d+)", str(version), re.IGNORECASE)
+    return int(match.group(1)) if match else 0
+
+
 def save_notes_snapshot(
     scored_with_notes: pd.DataFrame,
     conference: str,
     version: str,
+    notes_dir: Optional[Path] = None,
 ) -> Path:
-    """Save a snapshot of DK notes to store/notes/ for recovery and tracking.
+    """Append a snapshot of DK notes to the conference's notes history.
 
     This is the safety net: even if a Google Sheet gets corrupted, we have
-    the notes in git. Also enables diffing notes across iterations.
+    the notes in git. Every iteration is appended to the same history file
+    (never rewritten), so older annotations stay queryable. People in this
+    list who had notes before and have none now get a row with empty DK
+    values, so a cleared note stays cleared.
 
     Args:
         scored_with_notes: Scored people with DK columns populated.
         conference: Conference key (e.g. "gdc_sf_26").
         version: Version label (e.g. "v3").
+        notes_dir: Override for store/notes/ (mainly for tests).
 
     Returns:
-        Path to the saved notes CSV.
+        Path to the notes history CSV.
     """
-    os.makedirs(str(NOTES_DIR), exist_ok=True)
+    path = _history_path(conference, notes_dir)
+    os.makedirs(str(path.parent), exist_ok=True)
 
     # Only save rows that have at least one DK value
     dk_cols_present = [c for c in DK_COLUMNS if c in scored_with_notes.columns]
-    id_cols = ["Full Name", "Job Title", "Company Name", "Lead Score"]
-    save_cols = [c for c in id_cols if c in scored_with_notes.columns] + dk_cols_present
-
-    notes_df = scored_with_notes[save_cols].copy()
-    has_notes = notes_df[dk_cols_present].apply(
-        lambda row: any(str(v).strip() for v in row), axis=1
-    )
-    notes_only = notes_df[has_notes]
-
-    filename = f"{conference}_{version}_dk_notes.csv"
-    path = NOTES_DIR / filename
-    notes_only.to_csv(path, index=False)
-
-    print(f"Saved {len(notes_only)} annotated leads to {path}")
+    if dk_cols_present:
+        has_notes = _non_empty(scored_with_notes[dk_cols_present]).any(axis=1)
+    else:
+        has_notes = pd.Series(False, index=scored_with_notes.index)
+    # Tombstones: annotated before, present now, notes cleared
+    keys = _match_keys(scored_with_notes)
+    history = load_notes_history(conference, notes_dir)
+    if history is not None:
+        previously_noted = set(latest_notes_per_person(history)["Person Key"])
+        has_notes = has_notes | keys.isin(previously_noted)
+    notes_only = scored_with_notes[has_notes]
+
+    snapshot = notes_only.reindex(columns=HISTORY_COLUMNS)
+    snapshot["Person Key"] = keys[has_notes]
+    snapshot["Version"] = version
+    snapshot["Recorded At"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    snapshot = snapshot.fillna("")
+
+    snapshot.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+    cleared = int((~_non_empty(snapshot[DK_COLUMNS]).any(axis=1)).sum())
+    print(f"Saved {len(snapshot) - cleared} annotated leads ({version}, {cleared} cleared) to {path}")
     return path
 
 
-def load_latest_notes(conference: str) -> Optional[pd.DataFrame]:
-    """Load the most recent notes snapshot for a conference.
+def load_notes_history(
+    conference: str,
+    notes_dir: Optional[Path] = None,
+) -> Optional[pd.DataFrame]:
+    """Load the full notes history for a conference, indexed by Person Key.
 
-    Scans store/notes/ for the latest version file matching the conference key.
+    The index is sorted (stable, so each person's rows stay in chronological
+    order), which makes per-person lookups a binary search instead of a scan.
 
     Returns:
-        DataFrame with DK columns, or None if no prior notes exist.
+        DataFrame indexed by Person Key, or None if no history exists.
     """
-    if not NOTES_DIR.exists():
+    path = _history_path(conference, notes_dir)
+    if not path.exists():
         return None
 
-    # Find all note files for this conference, sorted by name (version order)
-    pattern = f"{conference}_*_dk_notes.csv"
-    import glob
-    files = sorted(glob.glob(str(NOTES_DIR / pattern)))
+    history = pd.read_csv(path, dtype=str, keep_default_na=False)
+    history["_seq"] = range(len(history))
+    history = history.set_index("Person Key").sort_index(kind="mergesort")
+    return history
+
+
+def latest_notes_per_person(history: pd.DataFrame) -> pd.DataFrame:
+    """Each person's most recently recorded annotation row (none if it cleared their notes)."""
+    latest = history[~history.index.duplicated(keep="last")]
+    dk_cols_present = [c for c in DK_COLUMNS if c in latest.columns]
+    latest = latest[_non_empty(latest[dk_cols_present]).any(axis=1)]
+    return latest.sort_values("_seq").drop(columns=["_seq"]).reset_index()
 
-    if not files:
+
+def get_note_history(
+    history: pd.DataFrame,
+    full_name: str,
+    company_name: str,
+) -> pd.DataFrame:
+    """Every recorded annotation for one lead, oldest first."""
+    key = _match_keys(pd.DataFrame({"Full Name": [full_name],
+                                    "Company Name": [company_name]})).iloc[0]
+    if key not in history.index:
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    return history.loc[[key]].drop(columns=["_seq"]).reset_index()
+
+
+def load_latest_notes(
+    conference: str,
+    notes_dir: Optional[Path] = None,
+) -> Optional[pd.DataFrame]:
+    """Load the latest DK notes for every annotated person in a conference.
+
+    Reads the notes history once. Falls back to legacy per-version snapshot
+    files ({conference}_{version}_dk_notes.csv), picking the highest version
+    number rather than the lexically last filename.
+
+    Returns:
+        DataFrame with DK columns, or None if no prior notes exist.
+    """
+    history = load_notes_history(conference, notes_dir)
+    if history is not None:
+        print(f"Loading prior notes from: {_history_path(conference, notes_dir)}")
+        return latest_notes_per_person(history)
+
+    legacy = sorted(Path(notes_dir or NOTES_DIR).glob(f"{conference}_*_dk_notes.csv"),
+                    key=lambda p: _version_number(p.name[len(conference):]))
+    if not legacy:
         return None
 
-    latest = files[-1]
+    latest = legacy[-1]
     print(f"Loading prior notes from: {latest}")
     return pd.read_csv(latest, dtype=str, keep_default_na=False)
 
@@ -0,0 +1,245 @@
+"""
+Scored output files: the full list, one file per lead tier, a top-K view and
+account-level views per matched company.
+
+Katz works the scored list tier by tier (LEAD_TIERS: manual >= 60,
+high 40-59, auto 20-39, ...), usually by filtering one big TSV in Sheets.
+write_scored_outputs() can write each tier to its own file and the best K
+leads to a short file. It can also leave out everything below a tier, which
+keeps large lists small enough to import.
+
+For account-based outreach, top_contacts_per_company() keeps the best N
+contacts at each Matched Company, so a 40-person delegation doesn't crowd out
+everyone else. company_rollups() gives one row per company: contact count,
+best Lead Score, sum of its top-3 Lead Scores and the best contact.
+
+Selection never re-sorts the whole frame:
+  - top_k_rows() picks the K best with np.partition and orders only those
+  - partition_tiers() splits rows by tier in one pass, keeping their order
+  - per-company views rank contacts within each company with one grouped rank
+so they work as well on unsorted frames (merged, master) as on scorer output.
+
+Usage:
+    from engine.outputs import write_scored_outputs
+
+    write_scored_outputs(results_df, output_file, tier_files=True, top_k=200, min_tier="auto",
+                         per_company=3)
+    # -> output/..._Scored_People_<date>.tsv            (manual/high/auto rows only)
+    #    output/..._Scored_People_<date>_manual.tsv     (one per written tier)
+    #    output/..._Scored_People_<date>_top200.tsv
+    #    output/..._Scored_People_<date>_by_company.tsv (best 3 contacts per company)
+    #    output/..._Scored_People_<date>_companies.tsv  (one row per company)
+
+With config_hash, a <stem>.meta.json sidecar records which config scored the
+file, so engine.delta can find the old config from the output alone.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from engine.velocity import LEAD_TIERS, assign_lead_tiers
+
+
+def _scores(df: pd.DataFrame, column: str) -> np.ndarray:
+    return pd.to_numeric(df[column], errors="coerce").fillna(-np.inf).to_numpy(dtype=float)
+
+
+def top_k_rows(df: pd.DataFrame, k: int, column: str = "Lead Score") -> pd.DataFrame:
+    """The k highest-scoring rows, best first, without sorting the rest.
+
+    Ties keep their order in df, so on an already-sorted frame this is the
+    same as df.head(k).
+    """
+    if k <= 0 or df.empty:
+        return df.iloc[:0]
+    scores = _scores(df, column)
+    if k < len(df):
+        # Everything scoring above the k-th best, plus the first ties at it
+        kth = np.partition(scores, len(df) - k)[len(df) - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        positions = np.concatenate([above, ties])
+    else:
+        positions = np.arange(len(df))
+    order = np.lexsort((positions, -scores[positions]))
+    return df.iloc[positions[order]]
+
+
+def tiers_from(min_tier: Optional[str], tiers: List = LEAD_TIERS) -> List:
+    """Tiers at or above min_tier (all of them when None)."""
+    labels = [label for label, _ in tiers]
+    if min_tier is None:
+        return list(tiers)
+    if min_tier not in labels:
+        raise ValueError(f"Unknown tier {min_tier!r} (expected one of {', '.join(labels)})")
+    return list(tiers[:labels.index(min_tier) + 1])
+
+
+def partition_tiers(df: pd.DataFrame, column: str = "Lead Score",
+                    min_tier: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """Split rows by lead tier, highest tier first, keeping their order within a tier.
+
+    Args:
+        df: Scored frame.
+        column: Score column to tier on.
+        min_tier: Leave out tiers below this one (e.g. "auto").
+
+    Returns:
+        {tier label: rows}, including empty tiers.
+    """
+    labels = assign_lead_tiers(df[column]).to_numpy()
+    return {label: df[labels == label] for label, _ in tiers_from(min_tier)}
+
+
+def _company_ranks(df: pd.DataFrame, column: str, company_column: str):
+    # Rows with a matched company, their company codes, the company names by
+    # code, scores, and each row's rank within its company (1 = best; ties
+    # keep frame order)
+    codes, companies = pd.factorize(df[company_column])
+    # Blank checks run over the distinct companies, not every row
+    blank = np.array([not str(company).strip() for company in companies], dtype=bool)
+    present = codes >= 0
+    present[present] = ~blank[codes[present]]
+    matched, codes = df[present], codes[present]
+    scores = _scores(matched, column)
+    rank = pd.Series(scores).groupby(codes, sort=False).rank(method="first", ascending=False).to_numpy()
+    return matched, codes, np.asarray(companies.astype(str)), scores, rank
+
+
+def top_contacts_per_company(df: pd.DataFrame, n: int = 3, column: str = "Lead Score",
+                             company_column: str = "Matched Company") -> pd.DataFrame:
+    """The best n contacts at each matched company.
+
+    Rows without a matched company are left out. Companies are ordered by
+    their best contact's score, and contacts by score within a company.
+    """
+    matched, codes, _, scores, rank = _company_ranks(df, column, company_column)
+    positions = np.flatnonzero(rank <= n)
+    if not len(positions):
+        return matched.iloc[:0]
+    best = pd.Series(scores[positions]).groupby(codes[positions], sort=False).transform("max").to_numpy()
+    order = np.lexsort((rank[positions], codes[positions], -best))
+    return matched.iloc[positions[order]]
+
+
+def company_rollups(df: pd.DataFrame, top: int = 3, column: str = "Lead Score",
+                    company_column: str = "Matched Company") -> pd.DataFrame:
+    """One row per matched company: contacts, best score, sum of the top scores.
+
+    Args:
+        df: Scored people.
+        top: How many of each company's best scores to sum.
+        column: Score column.
+        company_column: Company to group by.
+
+    Returns:
+        Matched Company, Contacts, Best <column>, Top <top> <column> Sum, Best
+        Contact (and Company Score when df has it), ordered by the top-score
+        sum, then the best score.
+    """
+    matched, codes, companies, _, rank = _company_ranks(df, column, company_column)
+    values = pd.to_numeric(matched[column], errors="coerce").to_numpy()
+    grouped = pd.DataFrame({"code": codes, "score": values, "rank": rank})
+    by_company = grouped.groupby("code", sort=False)
+    best_sum = f"Top {top} {column} Sum"
+    rollups = pd.DataFrame({
+        "Contacts": by_company.size(),
+        f"Best {column}": by_company["score"].max(),
+        best_sum: grouped[grouped["rank"] <= top].groupby("code", sort=False)["score"].sum(),
+    })
+
+    leaders = matched.iloc[np.flatnonzero(rank == 1)]
+    leader_codes = codes[rank == 1]
+    if "Full Name" in leaders.columns:
+        names = leaders["Full Name"]
+    else:
+        names = (leaders.get("First Name", "").astype(str) + " " + leaders.get("Last Name", "").astype(str)).str.strip()
+    rollups["Best Contact"] = pd.Series(names.to_numpy(), index=leader_codes)
+    if "Company Score" in leaders.columns:
+        rollups["Company Score"] = pd.Series(leaders["Company Score"].to_numpy(), index=leader_codes)
+
+    rollups = rollups.sort_values([best_sum, f"Best {column}"], ascending=False, kind="stable")
+    rollups.insert(0, company_column, companies[rollups.index.to_numpy()])
+    return rollups.reset_index(drop=True)
+
+
+def _sibling(path: Path, suffix: str) -> Path:
+    return path.with_name(f"{path.stem}_{suffix}{path.suffix}")
+
+
+def output_meta_path(output_file) -> Path:
+    """Sidecar next to a scored output: <stem>.meta.json."""
+    output_file = Path(output_file)
+    return output_file.with_name(f"{output_file.stem}.meta.json")
+
+
+def write_output_meta(output_file, config_hash: str) -> Path:
+    """Record the config hash an output was scored with in its sidecar."""
+    path = output_meta_path(output_file)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"config_hash": config_hash, "written": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}, f)
+    return path
+
+
+def read_output_meta(output_file) -> Optional[Dict]:
+    """An output's sidecar metadata, or None if it has none."""
+    path = output_meta_path(output_file)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_scored_outputs(results_df: pd.DataFrame, output_file, tier_files: bool = False,
+                         top_k: Optional[int] = None, min_tier: Optional[str] = None,
+                         per_company: Optional[int] = None, column: str = "Lead Score",
+                         config_hash: Optional[str] = None) -> Dict[str, Path]:
+    """Write the scored list plus optional per-tier, top-K and per-company files.
+
+    Args:
+        results_df: Scored people (normally already sorted by Lead Score).
+        output_file: Main output TSV/CSV; tier and top-K files go next to it
+            as <stem>_<tier> and <stem>_top<k>.
+        tier_files: Also write one file per tier.
+        top_k: Also write the k best leads.
+        min_tier: Only write rows in this tier or above (main and tier files).
+        per_company: Also write the best per_company contacts at each matched
+            company (<stem>_by_company) and per-company rollups (<stem>_companies).
+        column: Score column to tier and rank on.
+        config_hash: Also write <stem>.meta.json recording the scoring config.
+
+    Returns:
+        {"all": main path, "top": top-K path, "by_company", "companies",
+        <tier>: tier path} for every file written.
+    """
+    output_file = Path(output_file)
+    sep = "\t" if output_file.suffix.lower() == ".tsv" else ","
+    os.makedirs(str(output_file.parent), exist_ok=True)
+
+    labels = assign_lead_tiers(results_df[column]).to_numpy()
+    tiers = [label for label, _ in tiers_from(min_tier)]
+    kept = results_df if min_tier is None else results_df[np.isin(labels, tiers)]
+
+    written = {"all": output_file}
+    kept.to_csv(output_file, sep=sep, index=False)
+    if tier_files:
+        for label in tiers:
+            written[label] = _sibling(output_file, label)
+            results_df[labels == label].to_csv(written[label], sep=sep, index=False)
+    if top_k:
+        written["top"] = _sibling(output_file, f"top{top_k}")
+        top_k_rows(kept, top_k, column).to_csv(written["top"], sep=sep, index=False)
+    if per_company:
+        written["by_company"] = _sibling(output_file, "by_company")
+        top_contacts_per_company(kept, per_company, column).to_csv(written["by_company"], sep=sep, index=False)
+        written["companies"] = _sibling(output_file, "companies")
+        company_rollups(kept, column=column).to_csv(written["companies"], sep=sep, index=False)
+    if config_hash:
+        write_output_meta(output_file, config_hash)
+    return written
@@ -8,20 +8,31 @@ import re
 import os
 import json
 import logging
+import time
 from typing import Dict, List, Tuple
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
-from engine.config import load_config
+from engine.config import config_content_hash
+from engine.engagement import person_keys, warmth_for_keys
+from engine.plan import ScoringPlan
+from engine.score_cache import (
+    cache_person_key,
+    cached_entry,
+    company_store_version,
+    load_score_cache,
+    save_score_cache,
+)
+from engine.telemetry import record_stage, stage, timed_stage
 from engine.normalize import (
     normalize_company_name,
     calculate_match_score_normalized,
-    normalize_scores,
+    normalize_scores_array,
 )
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from engine.lead import branch_and_bound, calculate_lead_scores, lead_score_upper_bounds
+from engine.warm import CompanyIndex
 
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
@@ -164,8 +175,13 @@ def calculate_domain_score(title: str, config: dict) -> float:
 
 
 def calculate_warmth_score(person_data: dict, config: dict) -> float:
-    """Calculate warmth score based on engagement data."""
-    return 0.0
+    """Calculate warmth score (0-100) from the engagement event store.
+
+    Single-person lookup; process_people_scoring joins everyone at once.
+    """
+    company = person_data.get('Company Name', person_data.get('Company', ''))
+    key = person_keys([person_data.get('First Name', '')], [person_data.get('Last Name', '')], [company])
+    return float(warmth_for_keys(key)[0])
 
 
 def check_one_offs(title: str, config: dict) -> Tuple[float, float]:
@@ -197,8 +213,24 @@ def apply_seniority_modifiers(title: str, base_score: float, config: dict) -> fl
     return max(0, min(100, modified_score))
 
 
+def calculate_title_scores(title: str, config: dict) -> Tuple[float, float]:
+    """Seniority and Domain for a job title, with One-Off overrides applied."""
+    if isinstance(config, ScoringPlan):
+        return config.title_scores(title)
+
+    one_off_seniority, one_off_domain = check_one_offs(title, config)
+
+    if one_off_seniority is not None and one_off_domain is not None:
+        return apply_seniority_modifiers(title, one_off_seniority, config), one_off_domain
+
+    return calculate_seniority_score(title, config), calculate_domain_score(title, config)
+
+
 def calculate_contact_score(seniority: float, domain: float, warmth: float, config: dict) -> float:
     """Calculate Contact Score using weighted average of pillars."""
+    if isinstance(config, ScoringPlan):
+        return config.contact_score(seniority, domain, warmth)
+
     seniority_weight = float(config['peopleScore']['pillars']['Seniority']['description'])
     domain_weight = float(config['peopleScore']['pillars']['Domain']['description'])
     warmth_weight = float(config['peopleScore']['pillars']['Warmth']['description'])
@@ -255,12 +287,113 @@ def load_master_stats() -> dict:
         return {}
 
 
-def process_people_scoring(input_file: str, companies_file: str, config: dict) -> pd.DataFrame:
-    """Main function to process people scoring. Returns scored DataFrame."""
+def _text_column(df: pd.DataFrame, name: str) -> list:
+    if name not in df.columns:
+        return [''] * len(df)
+    return [value if pd.notna(value) else '' for value in df[name]]
+
+
+def prescore_top_leads(people_df: pd.DataFrame, warmth_scores, config, company_index: CompanyIndex,
+                       stats: dict, score_cache: dict = None, min_lead_score: int = None,
+                       top_k: int = None) -> Dict[int, tuple]:
+    """Title-score everyone, then company-match only people who can still be a top lead.
+
+    A person's Lead Score is at most what the store's best company would give
+    them, so after the (cheap) title scores, people are matched in order of
+    that bound until no one left can reach min_lead_score or the top_k-th
+    Lead Score found so far. Bounds are compared as output Lead Scores, so
+    this needs the fixed master normalization stats; without them everyone
+    is matched.
+
+    Returns:
+        {people_df index: (seniority, domain, matched company, match confidence,
+        company score, from cache)} for the people who make the cut.
+    """
+    first, last = _text_column(people_df, 'First Name'), _text_column(people_df, 'Last Name')
+    titles, companies = _text_column(people_df, 'Job Title'), _text_column(people_df, 'Company Name')
+    normals, updated = _text_column(people_df, 'Normal Company'), _text_column(people_df, 'Last Updated')
+
+    cached, seniority, domain = [], [], []
+    for i in range(len(people_df)):
+        entry = cached_entry(score_cache or {}, cache_person_key(first[i], last[i], companies[i]),
+                             titles[i], companies[i], updated[i])
+        cached.append(entry)
+        title_scores = (entry['Seniority'], entry['Domain']) if entry is not None else calculate_title_scores(titles[i], config)
+        seniority.append(title_scores[0])
+        domain.append(title_scores[1])
+
+    raw_contact = np.asarray(calculate_contact_score(
+        np.asarray(seniority, dtype=float), np.asarray(domain, dtype=float),
+        np.asarray(warmth_scores, dtype=float), config), dtype=float)
+    has_title = np.array([bool(isinstance(t, str) and t.strip()) for t in titles])
+    lead_min, lead_max = stats.get("lead_score_min"), stats.get("lead_score_max")
+
+    def output_lead(raw_lead):
+        return np.round(normalize_scores_array(raw_lead, lead_min, lead_max))
+
+    bounded = lead_min is not None and lead_max is not None
+    if bounded:
+        bounds = output_lead(lead_score_upper_bounds(raw_contact, has_title, company_index.max_company_score))
+    else:
+        logging.warning("Top leads: no master stats, so every person is matched.")
+        bounds = np.full(len(people_df), np.inf)
+
+    matches = {}
 
-    people_sep = '\t' if input_file.lower().endswith('.tsv') else ','
-    people_df = pd.read_csv(input_file, sep=people_sep)
-    companies_df = pd.read_csv(companies_file)
+    def exact_lead(i):
+        entry = cached[i]
+        if entry is not None:
+            matches[i] = entry['Matched Company'], entry['Match Confidence'], entry['Company Score']
+        else:
+            matches[i] = company_index.match(normals[i])
+        _, confidence, company_score = matches[i]
+        raw_lead = calculate_lead_scores(raw_contact[i:i + 1], [company_score], [confidence >= 90.0], has_title[i:i + 1])
+        return float(output_lead(raw_lead)[0])
+
+    leads = branch_and_bound(bounds, exact_lead, min_lead_score, top_k)
+    keep = sorted(leads)
+    if bounded:
+        # Drop matched people who fell short after all
+        cut = min_lead_score if min_lead_score is not None else -np.inf
+        ranked = sorted((lead for lead in leads.values() if lead >= cut), reverse=True)
+        if top_k is not None and len(ranked) >= top_k:
+            cut = max(cut, ranked[top_k - 1])
+        keep = [i for i in keep if leads[i] >= cut]
+    print(f"Top leads: matched {len(leads)} of {len(people_df)} people, {len(keep)} make the cut")
+
+    index = people_df.index
+    return {index[i]: (seniority[i], domain[i], *matches[i], cached[i] is not None) for i in keep}
+
+
+@timed_stage("score people")
+def process_people_scoring(input_file: str, companies_file: str, config: dict,
+                           score_cache_file: str = None,
+                           company_index: CompanyIndex = None,
+                           min_lead_score: int = None, top_k: int = None) -> pd.DataFrame:
+    """Main function to process people scoring. Returns scored DataFrame.
+
+    Args:
+        input_file: Staging people TSV/CSV.
+        companies_file: Scored companies CSV (unused if company_index is given).
+        config: Scoring config dict or ScoringPlan.
+        score_cache_file: Optional engine.score_cache file. People whose title,
+            company and Last Updated are unchanged reuse their cached title
+            scores and company match; normalization still runs over everyone.
+        company_index: Optional prebuilt engine.warm.CompanyIndex, so several
+            conferences scored in one process share one companies load.
+        min_lead_score: Top-leads mode: only return people with at least this
+            Lead Score, skipping company matching for anyone who can't reach it
+            (see prescore_top_leads).
+        top_k: Top-leads mode: only return the top_k people by Lead Score.
+    """
+
+    with stage("read people + companies") as read_stage:
+        people_sep = '\t' if input_file.lower().endswith('.tsv') else ','
+        people_df = pd.read_csv(input_file, sep=people_sep)
+        if company_index is None:
+            company_index = CompanyIndex(pd.read_csv(companies_file))
+        companies_df = company_index.companies_df
+        read_stage["rows"] = len(people_df)
 
     if 'Company Name' not in people_df.columns and 'Company' in people_df.columns:
         people_df['Company Name'] = people_df['Company']
@@ -280,17 +413,49 @@ def process_people_scoring(input_file: str, companies_file: str, config: dict) -
     print(f"Loaded {len(people_df)} people from staging")
     print(f"Loaded {len(companies_df)} companies for matching")
 
-    results = []
+    score_cache, new_score_cache = {}, {}
+    if score_cache_file:
+        config_hash = config.config_hash if isinstance(config, ScoringPlan) else config_content_hash(config)
+        store_version = company_store_version(companies_df)
+        score_cache = load_score_cache(score_cache_file, config_hash, store_version)
+
+    # Warmth for everyone in one indexed join against the engagement store
+    with stage("warmth join", rows=len(people_df)):
+        names = people_df.reindex(columns=['First Name', 'Last Name', 'Company Name'])
+        warmth_scores = warmth_for_keys(person_keys(names['First Name'], names['Last Name'], names['Company Name']))
+
+    stats = load_master_stats()
     total_people = len(people_df)
+    top_leads = None
+    if min_lead_score is not None or top_k is not None:
+        with stage("top-leads prescore", rows=total_people):
+            top_leads = prescore_top_leads(people_df, warmth_scores, config, company_index, stats,
+                                           score_cache, min_lead_score, top_k)
+        if score_cache_file:
+            # Keep cache entries for people skipped this time
+            names = zip(people_df.index, *(_text_column(people_df, c) for c in ('First Name', 'Last Name', 'Company Name')))
+            for idx, first_name, last_name, company_name in names:
+                key = cache_person_key(first_name, last_name, company_name)
+                if idx not in top_leads and key in score_cache:
+                    new_score_cache[key] = score_cache[key]
+
+    results = []
 
-    print(f"\nProcessing {total_people} people...")
+    # Top-leads runs only finish scoring the people prescore_top_leads kept
+    rows_df = people_df if top_leads is None else people_df.loc[list(top_leads)]
+    print(f"\nProcessing {len(rows_df)} people...")
     print("Progress (0.0%): [" + "░" * 50 + "]", end="", flush=True)
 
     raw_contact_scores = []
-    raw_lead_scores = []
-
-    for idx, person in people_df.iterrows():
-        progress = (idx + 1) / total_people
+    company_scores = []
+    company_matches = []
+    job_titles_present = []
+    title_seconds = 0.0
+    match_seconds = 0.0
+    reused = 0
+
+    for position, (idx, person) in enumerate(rows_df.iterrows()):
+        progress = (position + 1) / len(rows_df)
         filled_length = int(50 * progress)
         bar = "█" * filled_length + "░" * (50 - filled_length)
         percent = progress * 100
@@ -304,31 +469,50 @@ def process_people_scoring(input_file: str, companies_file: str, config: dict) -
         source = person.get('Source', '') if pd.notna(person.get('Source', '')) else ''
         date_created = person.get('Date Created', '') if pd.notna(person.get('Date Created', '')) else ''
         date_updated = person.get('Date Updated', '') if pd.notna(person.get('Date Updated', '')) else ''
-
-        one_off_seniority, one_off_domain = check_one_offs(job_title, config)
-
-        if one_off_seniority is not None and one_off_domain is not None:
-            seniority_score = apply_seniority_modifiers(job_title, one_off_seniority, config)
-            domain_score = one_off_domain
+        last_updated = person.get('Last Updated', '') if pd.notna(person.get('Last Updated', '')) else ''
+
+        person_key = cache_person_key(first_name, last_name, company_name)
+        cached = cached_entry(score_cache, person_key, job_title, company_name, last_updated) if top_leads is None else None
+        if top_leads is not None:
+            seniority_score, domain_score, matched_company, match_confidence, company_score, was_cached = top_leads[idx]
+            reused += was_cached
+        elif cached is not None:
+            seniority_score, domain_score = cached['Seniority'], cached['Domain']
+            matched_company = cached['Matched Company']
+            match_confidence, company_score = cached['Match Confidence'], cached['Company Score']
+            reused += 1
         else:
-            seniority_score = calculate_seniority_score(job_title, config)
-            domain_score = calculate_domain_score(job_title, config)
-
-        warmth_score = calculate_warmth_score(person.to_dict(), config)
+            title_start = time.perf_counter()
+            seniority_score, domain_score = calculate_title_scores(job_title, config)
+            title_seconds += time.perf_counter() - title_start
+
+            match_start = time.perf_counter()
+            matched_company, match_confidence, company_score = company_index.match(normal_company)
+            match_seconds += time.perf_counter() - match_start
+
+        if score_cache_file:
+            new_score_cache[person_key] = {
+                'Job Title': job_title,
+                'Company Name': company_name,
+                'Last Updated': last_updated,
+                'Seniority': seniority_score,
+                'Domain': domain_score,
+                'Matched Company': matched_company,
+                'Match Confidence': match_confidence,
+                'Company Score': company_score,
+            }
+
+        warmth_score = warmth_scores[idx]
 
         raw_contact_score = calculate_contact_score(seniority_score, domain_score, warmth_score, config)
 
-        matched_company, match_confidence, company_score = match_person_to_company(normal_company, companies_df)
-
         has_company_match = match_confidence >= 90.0
         has_job_title = bool(job_title and isinstance(job_title, str) and job_title.strip())
 
-        # Import lead score calculation
-        from engine.lead import calculate_lead_score
-        raw_lead_score = calculate_lead_score(raw_contact_score, company_score, has_company_match, has_job_title)
-
         raw_contact_scores.append(raw_contact_score)
-        raw_lead_scores.append(raw_lead_score)
+        company_scores.append(company_score)
+        company_matches.append(has_company_match)
+        job_titles_present.append(has_job_title)
 
         extra_data = person.get('Extra Data', '')
 
@@ -339,8 +523,6 @@ def process_people_scoring(input_file: str, companies_file: str, config: dict) -
             'Job Title': job_title,
             'Company Name': company_name,
             'Extra Data': extra_data,
-            'Raw Contact Score': raw_contact_score,
-            'Raw Lead Score': raw_lead_score,
             'Company Score': round(company_score) if company_score > 0 else '',
             'Seniority': round(seniority_score),
             'Domain': round(domain_score),
@@ -356,24 +538,26 @@ def process_people_scoring(input_file: str, companies_file: str, config: dict) -
 
     print(f"\rProgress (100.0%): [{'█' * 50}] - Complete!", flush=True)
     print()
+    scored_people = len(results)
+    if top_leads is None:
+        record_stage("title scoring", title_seconds, scored_people - reused)
+        record_stage("company matching", match_seconds, scored_people - reused)
+
+    if score_cache_file:
+        print(f"Score cache: reused {reused}, rescored {scored_people - reused} of {scored_people} people")
+        save_score_cache(score_cache_file, new_score_cache, config_hash, store_version)
 
     # Apply min-max normalization
+    normalize_start = time.perf_counter()
     print("Applying min-max normalization...")
-    stats = load_master_stats()
     contact_min = stats.get("contact_score_min")
     contact_max = stats.get("contact_score_max")
     lead_min = stats.get("lead_score_min")
     lead_max = stats.get("lead_score_max")
-    normalized_contact_scores = normalize_scores(raw_contact_scores, contact_min, contact_max)
-    normalized_lead_scores = normalize_scores(raw_lead_scores, lead_min, lead_max)
-
-    for i, result in enumerate(results):
-        result['Contact Score'] = round(normalized_contact_scores[i])
-        result['Lead Score'] = round(normalized_lead_scores[i])
-        del result['Raw Contact Score']
-        del result['Raw Lead Score']
-
-    results_df = pd.DataFrame(results)
+    raw_contact_scores = np.asarray(raw_contact_scores, dtype=float)
+    raw_lead_scores = calculate_lead_scores(raw_contact_scores, company_scores, company_matches, job_titles_present)
+    normalized_contact_scores = normalize_scores_array(raw_contact_scores, contact_min, contact_max)
+    normalized_lead_scores = normalize_scores_array(raw_lead_scores, lead_min, lead_max)
 
     column_order = [
         'First Name', 'Last Name', 'Full Name', 'Job Title', 'Company Name',
@@ -382,13 +566,26 @@ def process_people_scoring(input_file: str, companies_file: str, config: dict) -
         'Extra Data'
     ]
 
+    results_df = pd.DataFrame(results, columns=[c for c in column_order if c not in ('Lead Score', 'Contact Score')])
+    results_df['Contact Score'] = np.round(normalized_contact_scores).astype(int)
+    results_df['Lead Score'] = np.round(normalized_lead_scores).astype(int)
+
     results_df = results_df[column_order]
     results_df = results_df.sort_values('Lead Score', ascending=False).reset_index(drop=True)
-
-    raw_contact_range = f"{min(raw_contact_scores):.1f}-{max(raw_contact_scores):.1f}"
-    norm_contact_range = f"{min(normalized_contact_scores):.1f}-{max(normalized_contact_scores):.1f}"
-    raw_lead_range = f"{min(raw_lead_scores):.1f}-{max(raw_lead_scores):.1f}"
-    norm_lead_range = f"{min(normalized_lead_scores):.1f}-{max(normalized_lead_scores):.1f}"
+    if min_lead_score is not None:
+        results_df = results_df[results_df['Lead Score'] >= min_lead_score].reset_index(drop=True)
+    if top_k is not None:
+        results_df = results_df.head(top_k)
+    record_stage("normalize + sort", time.perf_counter() - normalize_start, scored_people)
+
+    if not scored_people:
+        print("No people scored.")
+        return results_df
+
+    raw_contact_range = f"{raw_contact_scores.min():.1f}-{raw_contact_scores.max():.1f}"
+    norm_contact_range = f"{normalized_contact_scores.min():.1f}-{normalized_contact_scores.max():.1f}"
+    raw_lead_range = f"{raw_lead_scores.min():.1f}-{raw_lead_scores.max():.1f}"
+    norm_lead_range = f"{normalized_lead_scores.min():.1f}-{normalized_lead_scores.max():.1f}"
 
     print(f"Normalization applied:")
     print(f"   Contact Scores: {raw_contact_range} -> {norm_contact_range}")
@@ -0,0 +1,340 @@
+"""
+Pipeline runner for the v4 workflow: accumulate -> score -> notes -> velocity.
+
+Each stage declares its inputs, and its outputs are cached under a hash of
+them (store/pipeline_cache/<conference>/, gitignored):
+
+    accumulate  new source files (+ labels), the current accum
+    score       accum, company store, config hash, engagement store,
+                master stats, column mapping, top-leads settings
+    notes       scored output, prior notes (exported Sheet or notes history),
+                extra-file settings (tier files, top-K view, per-company)
+    velocity    scored output, version label (skipped for top-leads runs,
+                as in engine.run)
+
+A stage whose inputs hash the same as a previous run is reused: its cached
+output is restored instead of recomputed. Rerunning after a notes-only
+change (a fresh Sheet export) therefore skips accumulate and scoring
+entirely, and velocity isn't recorded twice for the same scored output.
+
+Accumulate updates the accum in place, so it also counts as reused when the
+accum on disk is already what applying the same sources produced.
+
+Usage:
+    python -m engine.pipeline gdc_sf_26 --source sources/mtm_scrape_4.tsv "MTM Scrape 4" --label v4
+    python -m engine.pipeline gdc_sf_26 --notes exports/v3_scored_people.tsv --label v4
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from engine import configure_logging
+from engine.accumulate import ACCUM_COLUMNS, add_source
+from engine.engagement import EVENTS_FILE
+from engine.notes import _history_path, load_latest_notes, merge_dk_notes
+from engine.plan import ScoringPlan, load_plan
+from engine.profiling import profile_run
+from engine.outputs import write_output_meta, write_scored_outputs
+from engine.run import _repo_path, is_top_leads, load_registry, output_options, output_path, score_conference
+from engine.warm import COMPANIES_FILE, MASTER_STATS_FILE, load_company_index
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+PIPELINE_CACHE_DIR = _REPO_ROOT / "store" / "pipeline_cache"
+
+# Bump when a stage's logic changes so old cache entries stop matching
+PIPELINE_VERSION = 1
+
+
+def file_digest(path) -> str:
+    """SHA-256 of a file's bytes ("missing" if it doesn't exist)."""
+    path = Path(path)
+    if not path.exists():
+        return "missing"
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class StageCache:
+    """Content-addressed stage manifests and output objects for one conference."""
+
+    def __init__(self, conference: str, cache_dir: Optional[Path] = None):
+        self.dir = Path(cache_dir or PIPELINE_CACHE_DIR) / conference
+        self.objects = self.dir / "objects"
+
+    def key(self, stage: str, inputs: Dict) -> str:
+        payload = json.dumps({"stage": stage, "version": PIPELINE_VERSION, "inputs": inputs}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _manifest_path(self, stage: str, key: str) -> Path:
+        return self.dir / f"{stage}-{key[:16]}.json"
+
+    def lookup(self, stage: str, key: str) -> Optional[Dict]:
+        """Outputs recorded for this stage key, if their objects still exist."""
+        path = self._manifest_path(stage, key)
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("key") != key:
+            return None
+        if not all((self.objects / digest).exists() for digest in manifest["outputs"].values() if digest):
+            return None
+        return manifest["outputs"]
+
+    def manifests(self, stage: str) -> List[Dict]:
+        found = []
+        for path in sorted(self.dir.glob(f"{stage}-*.json")):
+            with open(path, "r") as f:
+                found.append(json.load(f))
+        return found
+
+    def record(self, stage: str, key: str, inputs: Dict, outputs: Dict) -> None:
+        os.makedirs(str(self.dir), exist_ok=True)
+        manifest = {
+            "stage": stage,
+            "key": key,
+            "inputs": inputs,
+            "outputs": outputs,
+            "recorded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with open(self._manifest_path(stage, key), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    def store(self, path: Path) -> str:
+        """Copy a file into the object store; returns its digest."""
+        digest = file_digest(path)
+        target = self.objects / digest
+        if not target.exists():
+            os.makedirs(str(self.objects), exist_ok=True)
+            shutil.copyfile(path, target)
+        return digest
+
+    def restore(self, digest: str, path: Path) -> None:
+        """Put a stored object at path (no-op if it's already there)."""
+        if file_digest(path) == digest:
+            return
+        os.makedirs(str(Path(path).parent), exist_ok=True)
+        shutil.copyfile(self.objects / digest, path)
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects / digest
+
+
+def _read_tsv(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path, sep="\t", dtype=str, keep_default_na=False)
+
+
+def _read_table(path: Path) -> pd.DataFrame:
+    sep = "\t" if Path(path).suffix.lower() == ".tsv" else ","
+    return pd.read_csv(path, sep=sep, dtype=str, keep_default_na=False)
+
+
+def _write_output(cache: StageCache, digest: str, output_file: Path, entry: dict, config_hash: str) -> None:
+    # The plain list is restored byte for byte; extra files need the frame
+    options = output_options(entry)
+    if not any(options.values()):
+        cache.restore(digest, output_file)
+        if config_hash:
+            write_output_meta(output_file, config_hash)
+        return
+    write_scored_outputs(_read_tsv(cache.object_path(digest)), output_file, config_hash=config_hash, **options)
+
+
+def _accumulate(cache: StageCache, accum_path: Path, sources: List[Tuple[str, str]]) -> str:
+    if not sources:
+        return "skipped (no new sources)"
+
+    source_inputs = [[file_digest(_repo_path(path)), label] for path, label in sources]
+    current = file_digest(accum_path)
+
+    # Already applied: the accum on disk is what these sources produced
+    for manifest in cache.manifests("accumulate"):
+        if manifest["inputs"]["sources"] == source_inputs and manifest["outputs"]["accum"] == current:
+            return "reused"
+
+    inputs = {"sources": source_inputs, "accum": current}
+    key = cache.key("accumulate", inputs)
+    outputs = cache.lookup("accumulate", key)
+    if outputs:
+        cache.restore(outputs["accum"], accum_path)
+        return "reused"
+
+    accum = _read_tsv(accum_path) if accum_path.exists() else pd.DataFrame(columns=ACCUM_COLUMNS)
+    for path, label in sources:
+        accum = add_source(accum, _read_table(_repo_path(path)), source_label=label)
+    os.makedirs(str(accum_path.parent), exist_ok=True)
+    accum.drop(columns=["_key"], errors="ignore").to_csv(accum_path, sep="\t", index=False)
+    print(f"Saved accum: {len(accum)} people -> {accum_path}")
+
+    cache.record("accumulate", key, inputs, {"accum": cache.store(accum_path)})
+    return "ran"
+
+
+def run_pipeline(
+    key: str,
+    entry: dict,
+    sources: Optional[List[Tuple[str, str]]] = None,
+    notes_file: Optional[str] = None,
+    version_label: Optional[str] = None,
+    plan: Optional[ScoringPlan] = None,
+    companies_file: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    notes_dir: Optional[Path] = None,
+    current_date: Optional[str] = None,
+) -> Dict:
+    """Run accumulate -> score -> notes -> velocity, reusing cached stages.
+
+    Args:
+        key: Registry key (see engine.run).
+        entry: Registry entry; its input is the accum the pipeline maintains.
+        sources: New (source file, label) pairs to accumulate.
+        notes_file: Exported annotated Sheet (TSV/CSV). Defaults to the latest
+            notes in the conference's notes history.
+        version_label: Velocity label (default: the entry's, else the date).
+        plan: Compiled config (default: load_plan()).
+        companies_file: Scored companies CSV (default: store/companies.csv).
+        cache_dir: Override for store/pipeline_cache/.
+        notes_dir: Override for store/notes/.
+        current_date: Date used in the output name (default: today).
+
+    Returns:
+        {"stages": {stage: "ran" | "reused" | "skipped (...)"}, "output": path}
+    """
+    from engine.velocity import record_iteration
+
+    cache = StageCache(key, cache_dir)
+    plan = plan or load_plan()
+    companies_file = Path(companies_file or COMPANIES_FILE)
+    accum_path = _repo_path(entry["input"])
+    label = version_label or entry["version_label"] or datetime.now().strftime("%Y-%m-%d")
+    stages = {}
+
+    def report(stage: str, status: str, start: float) -> None:
+        stages[stage] = status
+        timing = f" in {time.perf_counter() - start:.1f}s" if status == "ran" else ""
+        print(f"[pipeline] {stage}: {status}{timing}")
+
+    start = time.perf_counter()
+    report("accumulate", _accumulate(cache, accum_path, sources or []), start)
+    if not accum_path.exists():
+        raise FileNotFoundError(f"No accum at {accum_path}; pass --source to start one")
+
+    # Score
+    start = time.perf_counter()
+    score_inputs = {
+        "accum": file_digest(accum_path),
+        "companies": file_digest(companies_file),
+        "config": plan.config_hash,
+        "engagement": file_digest(EVENTS_FILE),
+        "master_stats": file_digest(MASTER_STATS_FILE),
+        "columns": entry["columns"],
+        "score_cache": bool(entry.get("score_cache")),
+        "min_lead_score": entry.get("min_lead_score"),
+        "top_leads": entry.get("top_leads"),
+    }
+    score_key = cache.key("score", score_inputs)
+    outputs = cache.lookup("score", score_key)
+    if outputs:
+        scored_digest = outputs["scored"]
+        report("score", "reused", start)
+    else:
+        scored = score_conference(key, entry, plan, load_company_index(companies_file))
+        scored_file = cache.dir / "scored_tmp.tsv"
+        os.makedirs(str(cache.dir), exist_ok=True)
+        scored.to_csv(scored_file, sep="\t", index=False)
+        scored_digest = cache.store(scored_file)
+        os.remove(scored_file)
+        cache.record("score", score_key, score_inputs, {"scored": scored_digest})
+        report("score", "ran", start)
+
+    # Notes
+    start = time.perf_counter()
+    output_file = output_path(key, entry, current_date)
+    notes_source = Path(notes_file) if notes_file else _history_path(entry["velocity_key"], notes_dir)
+    if not notes_source.exists():
+        _write_output(cache, scored_digest, output_file, entry, plan.config_hash)
+        report("notes", "skipped (no prior notes)", start)
+    else:
+        notes_inputs = {"scored": scored_digest, "notes": file_digest(notes_source),
+                        "outputs": output_options(entry)}
+        notes_key = cache.key("notes", notes_inputs)
+        outputs = cache.lookup("notes", notes_key)
+        if outputs:
+            _write_output(cache, outputs["merged"], output_file, entry, plan.config_hash)
+            report("notes", "reused", start)
+        else:
+            if notes_file:
+                prior = _read_table(notes_source)
+            else:
+                prior = load_latest_notes(entry["velocity_key"], notes_dir)
+            merged = merge_dk_notes(_read_tsv(cache.object_path(scored_digest)), prior)
+            merged_file = cache.dir / "merged_tmp.tsv"
+            os.makedirs(str(cache.dir), exist_ok=True)
+            merged.to_csv(merged_file, sep="\t", index=False)
+            merged_digest = cache.store(merged_file)
+            os.remove(merged_file)
+            cache.record("notes", notes_key, notes_inputs, {"merged": merged_digest})
+            _write_output(cache, merged_digest, output_file, entry, plan.config_hash)
+            report("notes", "ran", start)
+
+    # Velocity
+    start = time.perf_counter()
+    if is_top_leads(entry):
+        # A partial list would skew velocity history, as engine.run also skips it
+        report("velocity", "skipped (top-leads run)", start)
+        return {"stages": stages, "output": str(output_file)}
+    velocity_inputs = {"scored": scored_digest, "label": label, "velocity_key": entry["velocity_key"]}
+    velocity_key = cache.key("velocity", velocity_inputs)
+    if cache.lookup("velocity", velocity_key) is not None:
+        report("velocity", "reused", start)
+    else:
+        record_iteration(entry["velocity_key"], _read_tsv(cache.object_path(scored_digest)), label,
+                         config_hash=plan.config_hash)
+        cache.record("velocity", velocity_key, velocity_inputs, {})
+        report("velocity", "ran", start)
+
+    return {"stages": stages, "output": str(output_file)}
+
+
+def main():
+    """CLI entrypoint for the pipeline runner."""
+    import argparse
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Run accumulate -> score -> notes -> velocity with stage caching")
+    parser.add_argument("conference", help="Registry key (file stem in conferences/)")
+    parser.add_argument("--source", nargs=2, action="append", metavar=("FILE", "LABEL"), default=[],
+                        help="New source file and its label (repeatable)")
+    parser.add_argument("--notes", help="Exported annotated Sheet to carry notes from (default: notes history)")
+    parser.add_argument("--label", help="Velocity version label")
+    parser.add_argument("--profile", action="store_true", help="cProfile the run and count hot paths (TURBINE_PROFILE=1)")
+    args = parser.parse_args()
+
+    registry = load_registry()
+    if args.conference not in registry:
+        parser.error(f"{args.conference} is not in the registry (see python -m engine.run --list)")
+
+    start = time.perf_counter()
+    with profile_run(f"pipeline_{args.conference}", enabled=args.profile or None):
+        result = run_pipeline(args.conference, registry[args.conference], [tuple(s) for s in args.source],
+                              args.notes, args.label)
+    reused = [stage for stage, status in result["stages"].items() if status == "reused"]
+    print(f"\nPipeline done in {time.perf_counter() - start:.1f}s "
+          f"(reused: {', '.join(reused) or 'none'}) -> {result['output']}")
+
+
+if __name__ == "__main__":
+    main()
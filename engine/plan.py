@@ -0,0 +1,240 @@
+"""
+Compiled scoring plan: a validated, pre-compiled form of SCORE_TUNING_CONFIG.
+
+The tuning JSON is ~1K lines of nested dicts, and the title scorers in
+engine.people re-walk them (and rebuild regexes) for every person. A
+ScoringPlan turns that into flat tables once:
+  - people pillar weights as floats
+  - Seniority components / modifiers, Domain keywords and One-Offs with
+    their regexes compiled
+  - company pillar weights as floats
+
+Plans are pickled to configs/.cache/ keyed by the SHA-256 of the config
+file's bytes, so a warm start is one hash + one unpickle instead of a JSON
+parse + compile. The plan also behaves like the raw config dict
+(plan["companyScore"]), so every function that takes `config` accepts it.
+
+Usage:
+    from engine.plan import load_plan
+
+    plan = load_plan()                       # latest configs/ file, cached
+    seniority, domain = plan.title_scores("Senior Producer")
+    results = process_people_scoring(staging, companies, plan)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+PLAN_CACHE_DIR = _REPO_ROOT / "configs" / ".cache"
+
+# Bump when ScoringPlan's layout or compile rules change, to invalidate caches
+PLAN_FORMAT_VERSION = 2
+
+PEOPLE_PILLARS = ("Seniority", "Domain", "Warmth")
+COMPANY_PILLARS = ("Alignment", "Budget", "Demand")
+
+
+def _keywords(keywords_string) -> List[str]:
+    if not isinstance(keywords_string, str):
+        return []
+    return [k.strip() for k in keywords_string.split(",") if k.strip()]
+
+
+def _keyword_regex(keywords: List[str]) -> Pattern:
+    # Same word-boundary pattern as engine.people.parse_keywords_to_regex, but
+    # lowercased instead of (?i): titles are lowercased before matching, and
+    # case-insensitive patterns cost ~3x more to compile on every cache load.
+    escaped = [re.escape(k.lower()) for k in keywords]
+    return re.compile(r"(^|[^a-z])(" + "|".join(escaped) + r")($|[^a-z])")
+
+
+def _is_modifier(score) -> bool:
+    return isinstance(score, str) and (score.startswith("+") or score.startswith("-"))
+
+
+def _pillar_weight(pillars: dict, name: str, key: str, section: str) -> float:
+    try:
+        return float(pillars[name][key])
+    except KeyError:
+        raise ValueError(f"{section} pillar '{name}' is missing from the config")
+    except (TypeError, ValueError):
+        raise ValueError(f"{section} pillar '{name}' has a non-numeric weight: {pillars[name][key]!r}")
+
+
+def _components(pillars: dict, name: str) -> dict:
+    components = pillars.get(name, {}).get("components", {})
+    return components if isinstance(components, dict) else {}
+
+
+@dataclass
+class ScoringPlan:
+    """Compiled, validated scoring tables derived from one config file."""
+
+    config_hash: str
+    config: dict
+    seniority_weight: float
+    domain_weight: float
+    warmth_weight: float
+    company_weights: Dict[str, float]
+    # (component, score, regex)
+    seniority_components: List[Tuple[str, int, Pattern]] = field(default_factory=list)
+    # (component, modifier, regex)
+    seniority_modifiers: List[Tuple[str, int, Pattern]] = field(default_factory=list)
+    # (component, score, keyword, regex) in config order
+    domain_keywords: List[Tuple[str, int, str, Pattern]] = field(default_factory=list)
+    # (component, score, regex)
+    one_offs: List[Tuple[str, int, Pattern]] = field(default_factory=list)
+
+    # The plan stands in for the raw config dict wherever one is expected
+    def __getitem__(self, key):
+        return self.config[key]
+
+    def get(self, key, default=None):
+        return self.config.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.config
+
+    def _apply_modifiers(self, title_lower: str, score: float, clamp_each_step: bool) -> float:
+        for _, modifier, regex in self.seniority_modifiers:
+            if regex.search(title_lower):
+                score = min(100, score + modifier) if clamp_each_step else score + modifier
+        return score
+
+    def title_scores(self, title) -> Tuple[float, float]:
+        """Seniority and Domain for a title; same rules as engine.people."""
+        if not isinstance(title, str) or not title.strip():
+            return 0.0, 0.0
+        title_lower = title.lower()
+
+        one_off_scores = [score for _, score, regex in self.one_offs if regex.search(title_lower)]
+        if one_off_scores:
+            best = max(one_off_scores)
+            seniority = self._apply_modifiers(title_lower, best, clamp_each_step=False)
+            return max(0, min(100, seniority)), best
+
+        seniority_scores = [score for _, score, regex in self.seniority_components if regex.search(title_lower)]
+        seniority = self._apply_modifiers(title_lower, max(seniority_scores, default=0), clamp_each_step=True)
+
+        # Longest keyword wins; ties keep config order
+        domain = 0.0
+        longest = -1
+        for _, score, keyword, regex in self.domain_keywords:
+            if len(keyword) > longest and regex.search(title_lower):
+                domain, longest = score, len(keyword)
+
+        return seniority, domain
+
+    def contact_score(self, seniority: float, domain: float, warmth: float) -> float:
+        """Weighted average of the people pillars."""
+        total_weight = self.seniority_weight + self.domain_weight + self.warmth_weight
+        return (
+            seniority * self.seniority_weight
+            + domain * self.domain_weight
+            + warmth * self.warmth_weight
+        ) / total_weight
+
+
+def compile_config(config: dict, config_hash: str = "") -> ScoringPlan:
+    """Validate a SCORE_TUNING_CONFIG dict and compile it into a ScoringPlan.
+
+    Raises:
+        ValueError: missing pillars, non-numeric weights or component scores.
+    """
+    try:
+        people = config["peopleScore"]["pillars"]
+        company = config["companyScore"]["pillars"]
+    except (KeyError, TypeError):
+        raise ValueError("Config must contain peopleScore.pillars and companyScore.pillars")
+
+    plan = ScoringPlan(
+        config_hash=config_hash,
+        config=config,
+        # People pillar weights live in "description" in the sheet export
+        seniority_weight=_pillar_weight(people, "Seniority", "description", "People"),
+        domain_weight=_pillar_weight(people, "Domain", "description", "People"),
+        warmth_weight=_pillar_weight(people, "Warmth", "description", "People"),
+        company_weights={name: _pillar_weight(company, name, "weight", "Company") for name in COMPANY_PILLARS},
+    )
+    if plan.seniority_weight + plan.domain_weight + plan.warmth_weight == 0:
+        raise ValueError("People pillar weights sum to zero")
+
+    for name, data in _components(people, "Seniority").items():
+        keywords, score = _keywords(data.get("Keywords to Match", "")), data.get("Score", 0)
+        if not keywords or not score:
+            continue
+        try:
+            value = int(score)
+        except ValueError:
+            if _is_modifier(score):
+                continue  # unparseable modifiers are skipped, as in engine.people
+            raise ValueError(f"Seniority component '{name}' has a non-numeric score: {score!r}")
+        target = plan.seniority_modifiers if _is_modifier(score) else plan.seniority_components
+        target.append((name, value, _keyword_regex(keywords)))
+
+    for name, data in _components(people, "Domain").items():
+        keywords, score = _keywords(data.get("Keywords to Match", "")), data.get("Score", 0)
+        if not keywords or not score or isinstance(score, str):
+            continue
+        for keyword in keywords:
+            plan.domain_keywords.append((name, int(score), keyword, _keyword_regex([keyword])))
+
+    for name, data in _components(people, "One-Offs").items():
+        keywords, score = _keywords(data.get("Keywords to Match", "")), data.get("Score", 0)
+        if not keywords or not score or _is_modifier(score):
+            continue
+        try:
+            plan.one_offs.append((name, int(score), _keyword_regex(keywords)))
+        except ValueError:
+            raise ValueError(f"One-Off component '{name}' has a non-numeric score: {score!r}")
+
+    return plan
+
+
+def _plan_cache_path(config_hash: str, cache_dir: Optional[Path] = None) -> Path:
+    return Path(cache_dir or PLAN_CACHE_DIR) / f"plan_v{PLAN_FORMAT_VERSION}_{config_hash[:20]}.pkl"
+
+
+def load_plan_from_file(config_path: str, cache_dir: Optional[Path] = None) -> ScoringPlan:
+    """Load a compiled plan for a config file, compiling and caching on a miss."""
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    config_hash = hashlib.sha256(raw).hexdigest()
+
+    cache_path = _plan_cache_path(config_hash, cache_dir)
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # stale or corrupt cache entry — recompile below
+
+    plan = compile_config(json.loads(raw), config_hash)
+    os.makedirs(str(cache_path.parent), exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return plan
+
+
+def load_plan(config_dir: str = None, cache_dir: Optional[Path] = None) -> ScoringPlan:
+    """Compiled plan for the latest config in configs/ (fetching one if none exist)."""
+    from engine.config import get_latest_config_file, load_latest_config
+
+    latest_file = get_latest_config_file(config_dir)
+    if not latest_file:
+        # No local config yet: load_latest_config fetches and saves one
+        load_latest_config(config_dir)
+        latest_file = get_latest_config_file(config_dir)
+
+    print(f"Loading compiled scoring plan for: {os.path.basename(latest_file)}")
+    return load_plan_from_file(latest_file, cache_dir)
@@ -0,0 +1,272 @@
+"""
+Opt-in profiling: cProfile for a whole run plus hot-path counters.
+
+Off unless TURBINE_PROFILE=1 (or --profile on the CLIs that take it). When
+off, profile_run() yields immediately and nothing is patched, so scoring runs
+the same code at the same speed.
+
+When on, profile_run():
+  - runs cProfile over the block and saves it to output/profile_<label>_<time>.prof
+    (open with `python -m pstats` or snakeviz)
+  - wraps the hot paths with counters for the length of the run:
+      titles scored / regex evaluations   (plan and legacy title scorers)
+      company lookups / candidates compared (CompanyIndex and the full scan)
+      match scores computed / fuzzy ratio calls (SequenceMatcher.ratio)
+      score cache hits / misses, plan cache hits / compiles
+  - prints the counters and the slowest functions when the block ends
+
+Worker processes (engine.run --workers) aren't profiled; profile with one
+worker to see everything.
+
+Usage:
+    TURBINE_PROFILE=1 python -m scorers.gdc_sf_26
+    python -m engine.run gdc_sf_26 --profile
+
+    from engine.profiling import profile_run
+
+    with profile_run("gdc_sf_26"):
+        main()
+"""
+
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+PROFILE_DIR = _REPO_ROOT / "output"
+PROFILE_ENV_VAR = "TURBINE_PROFILE"
+TOP_FUNCTIONS = 15
+
+COUNTERS: Counter = Counter()
+
+# (owner, attribute, original) for everything install_counters() replaced
+_PATCHES: List[Tuple[object, str, object]] = []
+# id() of plans whose regexes are currently counted
+_COUNTED_PLANS: set = set()
+
+
+def profiling_enabled() -> bool:
+    """True when TURBINE_PROFILE is set to something other than 0/empty."""
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+
+
+class _CountingPattern:
+    """Compiled regex stand-in that counts search() calls."""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def search(self, *args):
+        COUNTERS["regex evaluations"] += 1
+        return self.pattern.search(*args)
+
+    def __reduce__(self):
+        # Pickles (e.g. into the plan cache) as the plain pattern
+        return re.compile, (self.pattern.pattern, self.pattern.flags)
+
+
+class _CountingRe:
+    """`re` module stand-in for engine.people's legacy title scorers."""
+
+    def search(self, pattern, string, flags=0):
+        COUNTERS["regex evaluations"] += 1
+        return re.search(pattern, string, flags)
+
+    def __getattr__(self, name):
+        return getattr(re, name)
+
+
+def _patch(owner, attribute: str, replacement) -> None:
+    _PATCHES.append((owner, attribute, owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)))
+    setattr(owner, attribute, replacement)
+
+
+def _count_plan_regexes(plan) -> None:
+    # Swap each compiled pattern for a counting one; restored by uninstall_counters
+    for attribute in ("seniority_components", "seniority_modifiers", "domain_keywords", "one_offs"):
+        rows = getattr(plan, attribute)
+        _PATCHES.append((plan, attribute, rows))
+        setattr(plan, attribute, [row[:-1] + (_CountingPattern(row[-1]),) for row in rows])
+    _COUNTED_PLANS.add(id(plan))
+
+
+def install_counters() -> None:
+    """Wrap the hot paths with counters (no-op if already installed)."""
+    if _PATCHES:
+        return
+    import engine.normalize as normalize
+    import engine.people as people
+    import engine.plan as plan_module
+    import engine.warm as warm
+
+    title_scores = plan_module.ScoringPlan.title_scores
+
+    def counted_title_scores(plan, title):
+        if id(plan) not in _COUNTED_PLANS:
+            _count_plan_regexes(plan)
+        COUNTERS["titles scored"] += 1
+        return title_scores(plan, title)
+
+    calculate_title_scores = people.calculate_title_scores
+
+    def counted_calculate_title_scores(title, config):
+        # Plans are counted in title_scores
+        if not isinstance(config, plan_module.ScoringPlan):
+            COUNTERS["titles scored"] += 1
+        return calculate_title_scores(title, config)
+
+    candidates = warm.CompanyIndex._candidates
+
+    def counted_candidates(index, length):
+        positions = candidates(index, length)
+        COUNTERS["candidates compared"] += len(positions)
+        return positions
+
+    index_match = warm.CompanyIndex.match
+
+    def counted_index_match(index, normal):
+        COUNTERS["company lookups"] += 1
+        return index_match(index, normal)
+
+    full_scan = people.match_person_to_company
+
+    def counted_full_scan(normal, companies_df):
+        COUNTERS["company lookups"] += 1
+        COUNTERS["candidates compared"] += len(companies_df)
+        return full_scan(normal, companies_df)
+
+    match_score = normalize.calculate_match_score_normalized
+
+    def counted_match_score(person_normal, company_normal):
+        COUNTERS["match scores computed"] += 1
+        return match_score(person_normal, company_normal)
+
+    class CountingSequenceMatcher(normalize.SequenceMatcher):
+        def ratio(self):
+            COUNTERS["fuzzy ratio calls"] += 1
+            return super().ratio()
+
+    cached_entry = people.cached_entry
+
+    def counted_cached_entry(cache, key, *args):
+        entry = cached_entry(cache, key, *args)
+        # Only count lookups against a loaded cache, not runs without one
+        if cache:
+            COUNTERS["score cache hits" if entry is not None else "score cache misses"] += 1
+        return entry
+
+    load_plan_from_file = plan_module.load_plan_from_file
+
+    def counted_load_plan_from_file(*args, **kwargs):
+        COUNTERS["plan cache lookups"] += 1
+        return load_plan_from_file(*args, **kwargs)
+
+    compile_config = plan_module.compile_config
+
+    def counted_compile_config(*args, **kwargs):
+        COUNTERS["plan compiles"] += 1
+        return compile_config(*args, **kwargs)
+
+    _patch(plan_module.ScoringPlan, "title_scores", counted_title_scores)
+    _patch(people, "calculate_title_scores", counted_calculate_title_scores)
+    _patch(people, "re", _CountingRe())
+    _patch(warm.CompanyIndex, "_candidates", counted_candidates)
+    _patch(warm.CompanyIndex, "match", counted_index_match)
+    _patch(people, "match_person_to_company", counted_full_scan)
+    _patch(people, "calculate_match_score_normalized", counted_match_score)
+    _patch(warm, "calculate_match_score_normalized", counted_match_score)
+    _patch(normalize, "SequenceMatcher", CountingSequenceMatcher)
+    _patch(people, "cached_entry", counted_cached_entry)
+    _patch(plan_module, "load_plan_from_file", counted_load_plan_from_file)
+    _patch(plan_module, "compile_config", counted_compile_config)
+
+
+def uninstall_counters() -> None:
+    """Put every wrapped function (and counted plan regex) back."""
+    while _PATCHES:
+        owner, attribute, original = _PATCHES.pop()
+        setattr(owner, attribute, original)
+    _COUNTED_PLANS.clear()
+
+
+def format_counters(counters: Optional[Counter] = None) -> str:
+    """Counter lines plus the per-title / per-lookup ratios worth watching."""
+    counters = COUNTERS if counters is None else counters
+    if not counters:
+        return "  (no hot-path calls counted)"
+    lines = [f"  {name:26} {count:>12,}" for name, count in sorted(counters.items())]
+
+    def ratio(label: str, numerator: str, denominator: str) -> None:
+        if counters[denominator]:
+            lines.append(f"  {label:26} {counters[numerator] / counters[denominator]:>12.1f}")
+
+    ratio("regex evals / title", "regex evaluations", "titles scored")
+    ratio("candidates / lookup", "candidates compared", "company lookups")
+    ratio("fuzzy ratios / lookup", "fuzzy ratio calls", "company lookups")
+    lookups = counters["score cache hits"] + counters["score cache misses"]
+    if lookups:
+        lines.append(f"  {'score cache hit rate':26} {counters['score cache hits'] / lookups:>12.1%}")
+    return "\n".join(lines)
+
+
+def save_profile(profiler, label: str, profile_dir: Optional[Path] = None) -> Path:
+    """Dump cProfile stats to output/profile_<label>_<timestamp>.prof."""
+    directory = Path(profile_dir or PROFILE_DIR)
+    os.makedirs(str(directory), exist_ok=True)
+    safe_label = re.sub(r"[^A-Za-z0-9_.-]+", "_", label) or "run"
+    path = directory / f"profile_{safe_label}_{time.strftime('%Y%m%d_%H%M%S')}.prof"
+    profiler.dump_stats(str(path))
+    return path
+
+
+@contextmanager
+def profile_run(label: str, enabled: Optional[bool] = None,
+                profile_dir: Optional[Path] = None) -> Iterator[Optional[Counter]]:
+    """Profile and count hot paths for the block; a no-op unless enabled.
+
+    Args:
+        label: Used in the profile file name (conference key, CLI name).
+        enabled: Force on/off; defaults to the TURBINE_PROFILE env var.
+        profile_dir: Override for output/.
+
+    Yields:
+        COUNTERS while profiling, else None.
+    """
+    if not (profiling_enabled() if enabled is None else enabled):
+        yield None
+        return
+
+    import cProfile
+    import io
+    import pstats
+
+    COUNTERS.clear()
+    install_counters()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield COUNTERS
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        uninstall_counters()
+        path = save_profile(profiler, label, profile_dir)
+
+        top = io.StringIO()
+        pstats.Stats(profiler, stream=top).strip_dirs().sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        print(f"\n=== PROFILE: {label} ({elapsed:.1f}s) ===")
+        print("Hot-path counters:")
+        print(format_counters())
+        print(f"\nTop {TOP_FUNCTIONS} functions by cumulative time:")
+        table = top.getvalue()
+        header = table.rfind("\n", 0, table.find("ncalls")) + 1
+        print(table[header:].rstrip() if "ncalls" in table else "  (no calls recorded)")
+        print(f"\nProfile saved to {path} (python -m pstats {path})")
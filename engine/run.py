@@ -0,0 +1,349 @@
+"""
+Batch runner: score any set of registered conferences in one process.
+
+Each conference is a small JSON file in conferences/ (the registry) instead
+of a copy of scorers/TEMPLATE.py:
+
+    {
+      "name": "GDC San Francisco '26",
+      "input": "sources/accum/gdc_sf_26_accum.tsv",
+      "columns": {"Company Name": "Company"},
+      "output": "output/GDC_SAN_FRANCISCO_26_Scored_People_{date}.tsv",
+      "velocity_key": "gdc_sf_26",
+      "version_label": "v3 (accumulated)",
+      "score_cache": true,
+      "min_lead_score": null,
+      "top_leads": null,
+      "tier_files": false,
+      "top_view": null,
+      "min_tier": null,
+      "per_company": null
+    }
+
+"columns" maps staging columns (First Name, Last Name, Job Title,
+Company Name, Source, Extra Data, Last Updated) to input column names;
+unlisted ones default to the same name, and optional ones may be absent.
+"output" accepts {date} and {key}. Paths are relative to the repo root.
+"min_lead_score" / "top_leads" (or --min-lead-score / --top) make it a
+top-leads run: only people who can make the cut are matched to companies,
+the result goes to a "_Top_Leads" file next to the usual output, and no
+velocity iteration is recorded since the list is partial.
+"tier_files", "top_view" and "min_tier" (or --tier-files, --top-view,
+--min-tier) add one file per lead tier and a top-K file next to the output,
+and leave tiers below min_tier out of the written files (see engine.outputs).
+"per_company" (--per-company N) adds the best N contacts at each matched
+company and a one-row-per-company rollup for account-based outreach.
+
+The compiled config and company index are loaded once and shared by every
+conference in the run (and inherited by workers with --workers).
+
+Usage:
+    python -m engine.run --list
+    python -m engine.run --all
+    python -m engine.run gdc_sf_26 dice_26 --workers 2 --label "v4 (MTM scrape 2)"
+    python -m engine.run gdc_sf_26 --profile
+    python -m engine.run gdc_sf_26 --top 200 --min-lead-score 40
+    python -m engine.run gdc_sf_26 --tier-files --top-view 200 --min-tier auto
+    python -m engine.run gdc_sf_26 --per-company 3
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from engine import configure_logging
+from engine.outputs import write_scored_outputs
+from engine.people import process_people_scoring
+from engine.plan import ScoringPlan, load_plan
+from engine.profiling import profile_run
+from engine.score_cache import score_cache_path
+from engine.telemetry import stage
+from engine.warm import CompanyIndex, load_company_index
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+CONFERENCES_DIR = _REPO_ROOT / "conferences"
+
+REQUIRED_FIELDS = ("input", "output", "velocity_key")
+STAGING_COLUMNS = ["First Name", "Last Name", "Job Title", "Company Name", "Source", "Extra Data", "Last Updated"]
+REQUIRED_COLUMNS = ["First Name", "Last Name", "Job Title", "Company Name"]
+OUTPUT_COLUMNS = [
+    "First Name", "Last Name", "Full Name", "Job Title", "Company Name",
+    "Lead Score", "Contact Score", "Company Score", "Seniority", "Domain", "Warmth",
+    "Matched Company", "Match Confidence", "Source", "Date Created", "Date Updated",
+    "Extra Data",
+]
+
+# Warm state handed to worker processes by _init_worker
+_WORKER_STATE = {}
+
+
+def load_registry(conferences_dir: Optional[Path] = None) -> Dict[str, dict]:
+    """Load every conference entry in the registry, keyed by file stem."""
+    directory = Path(conferences_dir or CONFERENCES_DIR)
+    registry = {}
+    for path in sorted(directory.glob("*.json")):
+        with open(path, "r") as f:
+            entry = json.load(f)
+        missing = [name for name in REQUIRED_FIELDS if not entry.get(name)]
+        if missing:
+            raise ValueError(f"{path.name}: missing required fields {missing}")
+        entry.setdefault("name", path.stem)
+        entry.setdefault("columns", {})
+        entry.setdefault("version_label", "")
+        entry.setdefault("score_cache", False)
+        entry.setdefault("min_lead_score", None)
+        entry.setdefault("top_leads", None)
+        entry.setdefault("tier_files", False)
+        entry.setdefault("top_view", None)
+        entry.setdefault("min_tier", None)
+        entry.setdefault("per_company", None)
+        registry[path.stem] = entry
+    return registry
+
+
+def build_staging(people_df: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+    """Map an input frame to the staging columns process_people_scoring expects."""
+    mapping = {name: columns.get(name, name) for name in STAGING_COLUMNS}
+    missing = [f"{name} ({mapping[name]})" for name in REQUIRED_COLUMNS if mapping[name] not in people_df.columns]
+    if missing:
+        raise ValueError(f"Input is missing columns: {', '.join(missing)}")
+    return pd.DataFrame({
+        name: people_df[source] if source in people_df.columns else ""
+        for name, source in mapping.items()
+    })
+
+
+def _repo_path(path: str) -> Path:
+    path = Path(path)
+    return path if path.is_absolute() else _REPO_ROOT / path
+
+
+def is_top_leads(entry: dict) -> bool:
+    """True when the entry asks for a top-leads run instead of the full list."""
+    return entry.get("min_lead_score") is not None or entry.get("top_leads") is not None
+
+
+def output_options(entry: dict) -> Dict:
+    """The entry's extra-file settings, as engine.outputs.write_scored_outputs arguments."""
+    return {
+        "tier_files": bool(entry.get("tier_files")),
+        "top_k": entry.get("top_view"),
+        "min_tier": entry.get("min_tier"),
+        "per_company": entry.get("per_company"),
+    }
+
+
+def output_path(key: str, entry: dict, current_date: Optional[str] = None) -> Path:
+    """Resolved output file for a registry entry (date defaults to today)."""
+    current_date = current_date or datetime.now().strftime("%Y-%m-%d")
+    path = _repo_path(entry["output"].format(date=current_date, key=key))
+    return path.with_name(f"{path.stem}_Top_Leads{path.suffix}") if is_top_leads(entry) else path
+
+
+def score_conference(key: str, entry: dict, plan: ScoringPlan, company_index: CompanyIndex) -> pd.DataFrame:
+    """Score a registered conference's input; returns OUTPUT_COLUMNS, sorted by Lead Score."""
+    input_file = _repo_path(entry["input"])
+    input_sep = "\t" if input_file.suffix.lower() == ".tsv" else ","
+    with stage("load input") as load_stage:
+        people_df = pd.read_csv(input_file, sep=input_sep, dtype=str, keep_default_na=False)
+        load_stage["rows"] = len(people_df)
+    staging_df = build_staging(people_df, entry["columns"])
+
+    staging_file = _REPO_ROOT / "output" / f"STAGING_{key}_temp.tsv"
+    os.makedirs(staging_file.parent, exist_ok=True)
+    staging_df.to_csv(staging_file, sep="\t", index=False)
+    try:
+        cache_file = str(score_cache_path(entry["velocity_key"])) if entry["score_cache"] else None
+        results_df = process_people_scoring(str(staging_file), None, plan,
+                                            score_cache_file=cache_file, company_index=company_index,
+                                            min_lead_score=entry.get("min_lead_score"),
+                                            top_k=entry.get("top_leads"))
+    finally:
+        os.remove(staging_file)
+    return results_df[OUTPUT_COLUMNS]
+
+
+def run_conference(key: str, entry: dict, plan: ScoringPlan, company_index: CompanyIndex,
+                   version_label: Optional[str] = None, current_date: Optional[str] = None) -> Dict:
+    """Score one registered conference with shared warm state.
+
+    Args:
+        key: Registry key (file stem in conferences/).
+        entry: Registry entry (see load_registry).
+        plan: Compiled scoring config.
+        company_index: Shared company index.
+        version_label: Velocity label override (default: the entry's, else the date).
+        current_date: Date used in the output name (default: today).
+
+    Returns:
+        Summary dict with status, people, matched, avg_lead, seconds and output.
+    """
+    from engine.velocity import record_iteration
+
+    start = time.perf_counter()
+    current_date = current_date or datetime.now().strftime("%Y-%m-%d")
+    input_file = _repo_path(entry["input"])
+    if not input_file.exists():
+        print(f"[{key}] No input at {input_file}, skipping")
+        return {"conference": key, "status": "missing input"}
+
+    print(f"\n=== {entry['name']} ({key}) ===")
+    results_df = score_conference(key, entry, plan, company_index)
+
+    output_file = output_path(key, entry, current_date)
+    with stage("write output", rows=len(results_df)):
+        written = write_scored_outputs(results_df, output_file, config_hash=plan.config_hash,
+                                       **output_options(entry))
+    for name, path in written.items():
+        if name != "all":
+            print(f"[{key}] {name}: {path}")
+
+    if is_top_leads(entry):
+        print(f"[{key}] Top-leads run: velocity not recorded")
+    else:
+        label = version_label or entry["version_label"] or current_date
+        record_iteration(entry["velocity_key"], results_df, label, config_hash=plan.config_hash)
+
+    return {
+        "conference": key,
+        "status": "scored",
+        "people": len(results_df),
+        "matched": int((results_df["Match Confidence"] != "").sum()),
+        "avg_lead": float(results_df["Lead Score"].mean()) if len(results_df) else 0.0,
+        "seconds": time.perf_counter() - start,
+        "output": str(output_file),
+    }
+
+
+def _run_safely(key: str, entry: dict, plan: ScoringPlan, company_index: CompanyIndex,
+                version_label: Optional[str]) -> Dict:
+    # One bad input shouldn't stop the rest of the batch
+    try:
+        return run_conference(key, entry, plan, company_index, version_label)
+    except Exception as e:
+        print(f"[{key}] FAILED: {e}")
+        return {"conference": key, "status": f"failed: {e}"}
+
+
+def _init_worker(plan: ScoringPlan, company_index: CompanyIndex) -> None:
+    _WORKER_STATE["plan"] = plan
+    _WORKER_STATE["company_index"] = company_index
+
+
+def _run_in_worker(key: str, entry: dict, version_label: Optional[str]) -> Dict:
+    return _run_safely(key, entry, _WORKER_STATE["plan"], _WORKER_STATE["company_index"], version_label)
+
+
+def run_conferences(keys: List[str], registry: Dict[str, dict], workers: int = 1,
+                    companies_file: Optional[Path] = None, version_label: Optional[str] = None,
+                    plan: Optional[ScoringPlan] = None) -> List[Dict]:
+    """Score several conferences sharing one compiled config and company index.
+
+    Args:
+        keys: Registry keys to score, in order.
+        registry: Output of load_registry().
+        workers: Worker processes (1 scores sequentially in this process).
+        companies_file: Scored companies CSV (default: store/companies.csv).
+        version_label: Velocity label applied to every conference in the run.
+        plan: Compiled config (default: the latest, via load_plan()).
+
+    Returns:
+        One summary dict per conference, in the order of keys.
+    """
+    if plan is None:
+        from engine.config import refresh_config_in_background
+
+        plan = load_plan()
+        # Sheet edits are saved for the next run; this run keeps the cached config
+        refresh_config_in_background()
+    company_index = load_company_index(companies_file)
+    print(f"Loaded {len(company_index)} companies (shared across {len(keys)} conferences)")
+
+    if workers <= 1 or len(keys) <= 1:
+        return [_run_safely(key, registry[key], plan, company_index, version_label) for key in keys]
+
+    # fork lets workers inherit the warm state instead of unpickling it
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=min(workers, len(keys)), mp_context=context,
+                             initializer=_init_worker, initargs=(plan, company_index)) as pool:
+        futures = [pool.submit(_run_in_worker, key, registry[key], version_label) for key in keys]
+        return [future.result() for future in futures]
+
+
+def main():
+    """CLI entrypoint for the batch runner."""
+    import argparse
+
+    from engine.velocity import LEAD_TIERS
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Score registered conferences in one process")
+    parser.add_argument("conferences", nargs="*", help="Registry keys (file stems in conferences/)")
+    parser.add_argument("--all", action="store_true", help="Score every registered conference")
+    parser.add_argument("--list", action="store_true", help="List registered conferences and exit")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--label", help="Velocity version label for this run")
+    parser.add_argument("--companies", help="Scored companies CSV (default: store/companies.csv)")
+    parser.add_argument("--profile", action="store_true", help="cProfile the run and count hot paths (TURBINE_PROFILE=1)")
+    parser.add_argument("--min-lead-score", type=int, help="Top-leads run: only people with at least this Lead Score")
+    parser.add_argument("--top", type=int, help="Top-leads run: only the top N people by Lead Score")
+    parser.add_argument("--tier-files", action="store_true", help="Also write one file per lead tier")
+    parser.add_argument("--top-view", type=int, help="Also write the top N leads to their own file")
+    parser.add_argument("--min-tier", choices=[label for label, _ in LEAD_TIERS],
+                        help="Leave tiers below this one out of the written files")
+    parser.add_argument("--per-company", type=int, metavar="N",
+                        help="Also write the best N contacts per matched company and per-company rollups")
+    args = parser.parse_args()
+
+    registry = load_registry()
+    for key, entry in registry.items():
+        if args.min_lead_score is not None:
+            entry["min_lead_score"] = args.min_lead_score
+        if args.top is not None:
+            entry["top_leads"] = args.top
+        if args.tier_files:
+            entry["tier_files"] = True
+        if args.top_view is not None:
+            entry["top_view"] = args.top_view
+        if args.min_tier is not None:
+            entry["min_tier"] = args.min_tier
+        if args.per_company is not None:
+            entry["per_company"] = args.per_company
+    if args.list:
+        for key, entry in registry.items():
+            status = "ready" if _repo_path(entry["input"]).exists() else "no input"
+            print(f"{key:24} {entry['name']:32} {entry['input']} ({status})")
+        return
+
+    keys = list(registry) if args.all else args.conferences
+    unknown = [key for key in keys if key not in registry]
+    if unknown:
+        parser.error(f"not in the registry: {', '.join(unknown)} (see --list)")
+    if not keys:
+        parser.error("name conferences to score, or pass --all")
+
+    start = time.perf_counter()
+    with profile_run("batch", enabled=args.profile or None):
+        summaries = run_conferences(keys, registry, args.workers, args.companies, args.label)
+
+    print(f"\n=== BATCH SUMMARY ({time.perf_counter() - start:.1f}s) ===")
+    for summary in summaries:
+        if summary["status"] != "scored":
+            print(f"{summary['conference']:24} {summary['status']}")
+            continue
+        matched_pct = summary["matched"] / summary["people"] * 100 if summary["people"] else 0.0
+        print(f"{summary['conference']:24} {summary['people']:6} people, {matched_pct:5.1f}% matched, "
+              f"avg lead {summary['avg_lead']:.1f}, {summary['seconds']:.1f}s -> {summary['output']}")
+
+
+if __name__ == "__main__":
+    main()
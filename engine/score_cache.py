@@ -0,0 +1,97 @@
+"""
+Per-person raw score cache for incremental conference rescoring.
+
+Most people in an accum haven't changed between scrapes, but every scorer
+run re-does title scoring and company matching (the slow part) for all of
+them. This cache keeps, per person key:
+    Job Title, Company Name, Last Updated   -> what the scores were computed from
+    Seniority, Domain                       -> raw title scores
+    Matched Company, Match Confidence,
+    Company Score                           -> raw company match
+stamped with the config hash and company-store version they were computed
+under. process_people_scoring reuses an entry only when all of those still
+match, so the combined raw scores — and the normalization run over them —
+are identical to a full rescore.
+
+Contact/lead scores are not cached: they're cheap arithmetic and recomputed
+every run from the cached pillars.
+
+Cache files are derived data (store/score_cache/<conference>.pkl, gitignored).
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+SCORE_CACHE_DIR = _REPO_ROOT / "store" / "score_cache"
+
+CACHED_FIELDS = [
+    "Job Title", "Company Name", "Last Updated",
+    "Seniority", "Domain",
+    "Matched Company", "Match Confidence", "Company Score",
+]
+
+
+def score_cache_path(conference: str) -> Path:
+    """Cache file for a conference's scorer."""
+    return SCORE_CACHE_DIR / f"{conference}.pkl"
+
+
+def company_store_version(companies_df: pd.DataFrame) -> str:
+    """Hash of the company columns that feed matching and lead scores."""
+    columns = [c for c in ("Company Name", "Company Score", "Normal Company") if c in companies_df.columns]
+    row_hashes = pd.util.hash_pandas_object(companies_df[columns], index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+
+def cache_person_key(first_name, last_name, company_name) -> str:
+    """first|last|company, normalized the same way as the accum dedup key."""
+    return "|".join(str(v).strip().lower() for v in (first_name, last_name, company_name))
+
+
+def load_score_cache(path, config_hash: str, store_version: str) -> Dict[str, Dict]:
+    """Cached entries by person key; empty if missing or built under another config/store."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable score cache {path.name}: {e}")
+        return {}
+
+    if payload.get("config_hash") != config_hash:
+        print("Score cache built under a different config — rescoring everyone")
+        return {}
+    if payload.get("store_version") != store_version:
+        print("Score cache built against a different company store — rescoring everyone")
+        return {}
+    return payload.get("entries", {})
+
+
+def save_score_cache(path, entries: Dict[str, Dict], config_hash: str, store_version: str) -> None:
+    """Write cache entries (current people only) atomically."""
+    path = Path(path)
+    os.makedirs(str(path.parent), exist_ok=True)
+    payload = {"config_hash": config_hash, "store_version": store_version, "entries": entries}
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def cached_entry(cache: Dict[str, Dict], key: str, job_title, company_name, last_updated) -> Optional[Dict]:
+    """The cache entry for a person if it was computed from the same inputs."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if (entry["Job Title"], entry["Company Name"], entry["Last Updated"]) != (job_title, company_name, last_updated):
+        return None
+    return entry
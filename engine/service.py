@@ -0,0 +1,224 @@
+"""
+Local scoring service: keeps warm scoring state in memory and scores
+people over HTTP in milliseconds.
+
+Tools that score one person at a time (e.g. the LinkedIn extraction in
+turbine-bd-tools) otherwise pay a full process start per call: importing
+pandas, parsing companies.csv, loading the config. The service loads
+engine.warm state once, serves requests from it, and hot-reloads when the
+latest config, companies.csv, the engagement store or master stats change.
+
+Endpoints (JSON in, JSON out):
+    POST /score_person   {"First Name": ..., "Last Name": ..., "Job Title": ..., "Company": ...}
+    POST /score_batch    [{...}, {...}]   or   {"people": [{...}, ...]}
+    GET  /health         loaded config, company count, reloads
+
+Usage:
+    python -m engine.service                       # http://127.0.0.1:8766
+    python -m engine.service --port 9000
+    python -m engine.service --socket /tmp/turbine.sock
+
+    curl -s localhost:8766/score_person -d '{"First Name": "Ana", "Job Title": "CEO", "Company": "Supercell"}'
+    python -m engine.client --title CEO --company Supercell      # see engine.client
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from engine import configure_logging
+from engine.client import DEFAULT_HOST, DEFAULT_PORT
+from engine.warm import load_warm_state, score_records, warm_state_signature
+
+RELOAD_INTERVAL_SECONDS = 2.0
+# Larger batches are scored off the event loop so other requests keep flowing
+INLINE_BATCH_LIMIT = 50
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class ScoringService:
+    """Warm scoring state plus the request handlers around it."""
+
+    def __init__(self, companies_file: Optional[Path] = None, config_dir: Optional[str] = None,
+                 reload_interval: float = RELOAD_INTERVAL_SECONDS):
+        self.companies_file = companies_file
+        self.config_dir = config_dir
+        self.reload_interval = reload_interval
+        self.reloads = 0
+        self.requests = 0
+        start = time.perf_counter()
+        self.state = load_warm_state(companies_file, config_dir)
+        self.load_seconds = time.perf_counter() - start
+
+    def score_person(self, record: Dict) -> Dict:
+        """Score one person record."""
+        return score_records(self.state, [record])[0]
+
+    def score_batch(self, records: List[Dict]) -> List[Dict]:
+        """Score a list of person records."""
+        return score_records(self.state, records)
+
+    def health(self) -> Dict:
+        config_file, _ = self.state.signature[0] if self.state.signature else (None, None)
+        return {
+            "status": "ok",
+            "config": os.path.basename(config_file) if config_file else None,
+            "config_hash": self.state.plan.config_hash,
+            "companies": len(self.state.company_index),
+            "people_with_warmth": int(len(self.state.warmth_index)),
+            "reloads": self.reloads,
+            "requests": self.requests,
+            "load_seconds": round(self.load_seconds, 3),
+        }
+
+    def reload_if_changed(self) -> bool:
+        """Rebuild warm state if any input changed on disk. Returns True if reloaded."""
+        signature = warm_state_signature(self.companies_file, self.config_dir)
+        if signature == self.state.signature:
+            return False
+        start = time.perf_counter()
+        # Build fully before swapping so in-flight requests keep the old state
+        self.state = load_warm_state(self.companies_file, self.config_dir)
+        self.load_seconds = time.perf_counter() - start
+        self.reloads += 1
+        print(f"Reloaded scoring state in {self.load_seconds:.2f}s")
+        return True
+
+    async def watch(self) -> None:
+        """Poll inputs and hot-reload in a worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await loop.run_in_executor(None, self.reload_if_changed)
+            except Exception as e:
+                print(f"Reload failed, keeping current state: {e}")
+
+    async def dispatch(self, method: str, path: str, body: bytes):
+        """Route one request. Returns (status, payload)."""
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        if path == "/health":
+            return 200, self.health()
+        if path not in ("/score_person", "/score_batch"):
+            return 404, {"error": f"unknown endpoint {path}"}
+        if method != "POST":
+            return 405, {"error": f"{path} expects POST"}
+
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+
+        self.requests += 1
+        if path == "/score_person":
+            if not isinstance(payload, dict):
+                return 400, {"error": "score_person expects a JSON object"}
+            return 200, self.score_person(payload)
+
+        records = payload.get("people") if isinstance(payload, dict) else payload
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            return 400, {"error": "score_batch expects a list of objects (or {\"people\": [...]})"}
+        if len(records) <= INLINE_BATCH_LIMIT:
+            return 200, self.score_batch(records)
+        loop = asyncio.get_running_loop()
+        return 200, await loop.run_in_executor(None, self.score_batch, records)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Minimal HTTP/1.1 with keep-alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0) or 0))
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                try:
+                    status, payload = await self.dispatch(method.upper(), path, body)
+                except Exception as e:
+                    status, payload = 500, {"error": str(e)}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(service: ScoringService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                socket_path: Optional[str] = None) -> None:
+    """Run the service until cancelled."""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = await asyncio.start_unix_server(service.handle_connection, path=socket_path)
+        where = f"unix:{socket_path}"
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        where = f"http://{host}:{port}"
+
+    print(f"Scoring service ready at {where} "
+          f"({len(service.state.company_index)} companies, loaded in {service.load_seconds:.2f}s)")
+    watcher = asyncio.create_task(service.watch())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+
+def main():
+    """CLI entrypoint for the scoring service."""
+    import argparse
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Local warm scoring service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--socket", help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--companies", help="Scored companies CSV (default: store/companies.csv)")
+    parser.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL_SECONDS,
+                        help="Seconds between checks for config/store changes")
+    args = parser.parse_args()
+
+    service = ScoringService(args.companies, reload_interval=args.reload_interval)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        print("\nScoring service stopped")
+
+
+if __name__ == "__main__":
+    main()
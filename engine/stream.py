@@ -0,0 +1,106 @@
+"""
+Streaming scorer: JSON-lines people in on stdin, scored JSON-lines out on stdout.
+
+For tools that pull people from MTM pages, badge scans or CRM exports and
+would otherwise write a TSV into sources/ and run a scorer script. Warm
+state (compiled config, company index, master stats, warmth index) is
+loaded once at start; each record is then scored and written as soon as
+it's read, normalized with the fixed master stats, so memory stays flat
+and a record's score doesn't depend on what else is in the stream.
+
+Input records use the staging column names (First Name, Last Name,
+Job Title, Company Name or Company). Any other fields are passed through
+unchanged so callers can join results back (e.g. an "id" field).
+Unparseable lines are reported on stderr and skipped; stdout only ever
+carries scored records.
+
+Usage:
+    cat people.jsonl | python -m engine.stream > scored.jsonl
+    python -m engine.stream < badge_scans.jsonl | jq -c 'select(."Lead Score" >= 40)'
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, Optional, TextIO
+
+from engine import configure_logging
+from engine.warm import WarmState, load_warm_state, score_records
+
+
+def score_stream(state: WarmState, lines: Iterable[str], output: TextIO, errors: Optional[TextIO] = None) -> Dict:
+    """Score JSON-lines records one at a time, writing each result immediately.
+
+    Args:
+        state: Warm scoring state (see engine.warm.load_warm_state).
+        lines: Iterable of JSON-lines input (e.g. sys.stdin).
+        output: Where scored records are written, one JSON object per line.
+        errors: Where bad lines are reported (default: stderr).
+
+    Returns:
+        Summary dict: scored, skipped, seconds, and max_ms per record.
+    """
+    errors = errors or sys.stderr
+    scored = skipped = 0
+    max_ms = 0.0
+    start = time.perf_counter()
+
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        record_start = time.perf_counter()
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            skipped += 1
+            print(f"line {line_number}: skipped ({e})", file=errors)
+            continue
+
+        result = {**record, **score_records(state, [record])[0]}
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        scored += 1
+        max_ms = max(max_ms, (time.perf_counter() - record_start) * 1000)
+
+    return {
+        "scored": scored,
+        "skipped": skipped,
+        "seconds": time.perf_counter() - start,
+        "max_ms": max_ms,
+    }
+
+
+def main():
+    """CLI entrypoint for the streaming scorer."""
+    import argparse
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Score JSON-lines people from stdin to stdout")
+    parser.add_argument("--companies", help="Scored companies CSV (default: store/companies.csv)")
+    parser.add_argument("--quiet", action="store_true", help="Don't print the summary to stderr")
+    args = parser.parse_args()
+
+    # stdout is the data channel; loading chatter goes to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        state = load_warm_state(args.companies)
+
+    try:
+        summary = score_stream(state, sys.stdin, sys.stdout)
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+
+    if not args.quiet:
+        per_record = summary["seconds"] / summary["scored"] * 1000 if summary["scored"] else 0.0
+        print(f"Scored {summary['scored']} people ({summary['skipped']} skipped) in {summary['seconds']:.2f}s, "
+              f"{per_record:.1f}ms/record avg, {summary['max_ms']:.1f}ms max", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Pipeline run telemetry: wall time, rows/sec and peak RSS per stage.
+
+With TURBINE_TRACEMALLOC=1 (or whenever tracemalloc is already tracing),
+each stage also records traced_peak_mb: the most Python memory allocated
+at any point inside the stage, above what was allocated when it started.
+Peak RSS only ever grows, so this is what shows which stage the memory
+went to. Tracing slows allocation-heavy code down, so it's opt-in.
+
+Stages are recorded into a per-process list as they finish. record_iteration
+(engine.velocity) drains that list into the velocity entry for the run, so
+performance sits next to the signal metrics we already review every iteration.
+
+Usage:
+    from engine.telemetry import stage, timed_stage
+
+    with stage("load companies") as s:
+        companies_df = pd.read_csv(companies_file)
+        s["rows"] = len(companies_df)
+
+    @timed_stage("score people")
+    def process_people_scoring(...): ...
+"""
+
+import functools
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_STAGES: List[Dict] = []
+# Nesting depth of open stages; sub-stages recorded inside another stage get depth > 0
+_DEPTH = [0]
+MEMORY_ENV_VAR = "TURBINE_TRACEMALLOC"
+_TRACE_MEMORY = os.environ.get(MEMORY_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+# Per open stage while tracing: [traced bytes at start, highest peak seen in its sub-stages]
+_PEAKS: List[List[int]] = []
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def record_stage(name: str, seconds: float, rows: Optional[int] = None,
+                 traced_peak_mb: Optional[float] = None) -> Dict:
+    """Record one finished stage."""
+    entry = {
+        "stage": name,
+        "seconds": round(seconds, 3),
+        "rows": rows,
+        "rows_per_sec": round(rows / seconds, 1) if rows and seconds > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "traced_peak_mb": traced_peak_mb,
+        "depth": _DEPTH[0],
+    }
+    _STAGES.append(entry)
+    return entry
+
+
+def _open_stage() -> bool:
+    _DEPTH[0] += 1
+    if _TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if not tracemalloc.is_tracing():
+        return False
+    current, peak = tracemalloc.get_traced_memory()
+    # The enclosing stage's peak so far is carried on the stack, since the
+    # tracemalloc peak is reset for this one
+    if _PEAKS:
+        _PEAKS[-1][1] = max(_PEAKS[-1][1], peak)
+    _PEAKS.append([current, 0])
+    tracemalloc.reset_peak()
+    return True
+
+
+def _close_stage(traced: bool) -> Optional[float]:
+    _DEPTH[0] -= 1
+    if not traced or not _PEAKS:
+        return None
+    start, sub_peak = _PEAKS.pop()
+    peak = max(sub_peak, tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0)
+    if _PEAKS:
+        _PEAKS[-1][1] = max(_PEAKS[-1][1], peak)
+    return round(max(peak - start, 0) / (1024 * 1024), 1)
+
+
+@contextmanager
+def stage(name: str, rows: Optional[int] = None) -> Iterator[Dict]:
+    """Time a block; set info["rows"] inside the block if not known up front."""
+    info = {"rows": rows}
+    start = time.perf_counter()
+    traced = _open_stage()
+    try:
+        yield info
+    finally:
+        traced_peak = _close_stage(traced)
+        record_stage(name, time.perf_counter() - start, info["rows"], traced_peak)
+
+
+def timed_stage(name: str, rows: Optional[Callable[..., int]] = None):
+    """Decorator form of stage().
+
+    Args:
+        name: Stage name.
+        rows: rows(result, *args, **kwargs) -> row count. Defaults to len(result).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            traced = _open_stage()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                traced_peak = _close_stage(traced)
+            elapsed = time.perf_counter() - start
+            if rows is not None:
+                count = rows(result, *args, **kwargs)
+            else:
+                count = len(result) if hasattr(result, "__len__") else None
+            record_stage(name, elapsed, count, traced_peak)
+            return result
+        return wrapper
+    return decorator
+
+
+def drain_stages() -> List[Dict]:
+    """Return every stage recorded so far and reset the list."""
+    stages = list(_STAGES)
+    _STAGES.clear()
+    return stages
+
+
+def summarize_stages(stages: List[Dict]) -> Dict:
+    """Total wall time (top-level stages), slowest stage, peak RSS and the stage with the largest traced peak."""
+    if not stages:
+        return {}
+    top_level = [s for s in stages if not s.get("depth")]
+    # A stage that closes right after deeper stages is their parent; the
+    # slowest stage is picked among the rest so it points at real work.
+    leaves = [s for prev, s in zip([None] + stages[:-1], stages)
+              if prev is None or prev.get("depth", 0) <= s.get("depth", 0)]
+    slowest = max(leaves or stages, key=lambda s: s["seconds"])
+    peaks = [s["peak_rss_mb"] for s in stages if s.get("peak_rss_mb") is not None]
+    summary = {
+        "total_seconds": round(sum(s["seconds"] for s in top_level), 3),
+        "slowest_stage": slowest["stage"],
+        "slowest_seconds": slowest["seconds"],
+        "peak_rss_mb": max(peaks) if peaks else None,
+    }
+    traced = [s for s in (leaves or stages) if s.get("traced_peak_mb") is not None]
+    if traced:
+        hungriest = max(traced, key=lambda s: s["traced_peak_mb"])
+        summary["traced_peak_stage"] = hungriest["stage"]
+        summary["traced_peak_mb"] = hungriest["traced_peak_mb"]
+    return summary
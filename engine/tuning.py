@@ -0,0 +1,328 @@
+"""
+Scoring-config replay harness driven by Katz's DK feedback.
+
+extract_scoring_feedback() pulls the rows where Katz flagged a title as
+scored too low (1) / too high (0), or rated the lead DK Score 0. This module
+replays those rows under candidate SCORE_TUNING_CONFIG variants (keyword and
+score edits) across a process pool and reports, per variant:
+  - flags fixed  (contact score moved the way Katz asked)
+  - flags broken (contact score moved the opposite way)
+  - collateral   (unflagged feedback rows whose contact score changed)
+  - lead tier counts over the whole scored list and their shift vs the
+    current config, so collateral moves outside the feedback show up
+  - the same tier shift over the feedback rows alone ("Feedback <tier> Δ")
+
+Feedback rows and the scored list are loaded once; each worker gets them
+(and the baseline scores) a single time via the pool initializer, so a
+variant is just a small list of edits. The scored list is --population, or
+by default the --notes-file export itself, else the master list
+(store/people.csv).
+
+Variants file (JSON list):
+    [
+      {"name": "Producer up to 40",
+       "edits": [{"pillar": "Seniority", "component": "Producer", "Score": 40}]},
+      {"name": "Add LiveOps to Product",
+       "edits": [{"pillar": "Domain", "component": "Product",
+                  "Keywords to Match": "Product, Strategy, Revenue, Retention, LiveOps"}]},
+      {"name": "Domain weight 80",
+       "edits": [{"pillar": "Domain", "description": 80}]}
+    ]
+
+Usage:
+    python -m engine.tuning --conference gdc_sf_26 --variants variants.json
+    python -m engine.tuning --notes-file sources/gdc_v3_annotated.tsv --variants variants.json --workers 8
+    python -m engine.tuning --conference gdc_sf_26 --variants variants.json \
+        --population output/GDC_SAN_FRANCISCO_26_Scored_People_2026-03-01.tsv
+"""
+
+import copy
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine import configure_logging
+from engine.config import load_latest_config
+from engine.lead import calculate_lead_scores
+from engine.normalize import normalize_company_name, normalize_scores_array
+from engine.notes import extract_scoring_feedback, load_latest_notes
+from engine.people import (
+    calculate_contact_score,
+    calculate_title_scores,
+    load_master_stats,
+)
+from engine.plan import ScoringPlan, compile_config
+from engine.velocity import LEAD_TIERS, assign_lead_tiers
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+
+MASTER_LIST_PATH = _REPO_ROOT / "store" / "people.csv"
+
+TITLE_FLAG_COLUMN = "DK: title too low (1) or too high (0)"
+DK_SCORE_COLUMN = "DK Score (0-2)"
+
+# Per-worker state, set once by _init_worker
+_WORKER_STATE: Dict = {}
+
+
+def apply_config_edits(config: dict, edits: List[Dict]) -> dict:
+    """Return a copy of a SCORE_TUNING_CONFIG with people-score edits applied.
+
+    Each edit names a peopleScore pillar and optionally a component:
+      {"pillar": "Seniority", "component": "CXO", "Score": 90}
+          -> set fields on a component (created if missing)
+      {"pillar": "Seniority", "component": "Intern", "remove": true}
+          -> delete a component
+      {"pillar": "Domain", "description": 80}
+          -> set fields on the pillar itself (people weights live in "description")
+    """
+    if isinstance(config, ScoringPlan):
+        config = config.config
+    edited = copy.deepcopy(config)
+    pillars = edited["peopleScore"]["pillars"]
+
+    for edit in edits:
+        fields = dict(edit)
+        pillar_name = fields.pop("pillar")
+        component_name = fields.pop("component", None)
+        pillar = pillars.setdefault(pillar_name, {"weight": "", "description": "", "components": {}})
+
+        if component_name is None:
+            pillar.update(fields)
+            continue
+
+        if not isinstance(pillar.get("components"), dict):
+            pillar["components"] = {}
+        components = pillar["components"]
+
+        if fields.pop("remove", False):
+            components.pop(component_name, None)
+            continue
+
+        component = components.setdefault(component_name, {"Pillar": pillar_name, "Label": component_name})
+        component.update(fields)
+
+    return edited
+
+
+def _expected_direction(feedback: pd.DataFrame) -> np.ndarray:
+    """+1 where Katz wants a higher score, -1 for lower, 0 for note-only rows."""
+    title_flag = feedback.get(TITLE_FLAG_COLUMN, pd.Series("", index=feedback.index)).astype(str).str.strip()
+    dk_score = feedback.get(DK_SCORE_COLUMN, pd.Series("", index=feedback.index)).astype(str).str.strip()
+    return np.select(
+        [title_flag == "1", title_flag == "0", dk_score == "0"],
+        [1, -1, -1],
+        default=0,
+    )
+
+
+def _company_scores(feedback: pd.DataFrame) -> np.ndarray:
+    """Company Score per feedback row.
+
+    Uses the row's own Company Score (present in Scored People exports).
+    Rows without one (e.g. from the notes history) fall back to an exact
+    normalized-name lookup in store/companies.csv.
+    """
+    scores = pd.to_numeric(feedback.get("Company Score", pd.Series(np.nan, index=feedback.index)),
+                           errors="coerce")
+    missing = scores.isna()
+    if missing.any() and "Company Name" in feedback.columns:
+        companies = pd.read_csv(_REPO_ROOT / "store" / "companies.csv",
+                                usecols=["Company Score", "Normalized Name"])
+        companies = companies.dropna(subset=["Normalized Name"])
+        lookup = companies.drop_duplicates("Normalized Name").set_index("Normalized Name")["Company Score"]
+        normalized = feedback.loc[missing, "Company Name"].map(normalize_company_name)
+        scores[missing] = normalized.map(lookup)
+    return scores.fillna(0.0).to_numpy(dtype=float)
+
+
+def prepare_replay_rows(feedback: pd.DataFrame) -> pd.DataFrame:
+    """Reduce feedback rows to what replay needs: title, company score, direction."""
+    return pd.DataFrame({
+        "Job Title": feedback.get("Job Title", pd.Series("", index=feedback.index)).fillna("").astype(str),
+        "Company Score": _company_scores(feedback),
+        "Expected Direction": _expected_direction(feedback),
+    }).reset_index(drop=True)
+
+
+def _read_people(path: str) -> pd.DataFrame:
+    sep = "," if str(path).lower().endswith(".csv") else "\t"
+    return pd.read_csv(path, sep=sep, dtype=str, keep_default_na=False)
+
+
+def load_feedback(conference: Optional[str] = None, notes_file: Optional[str] = None) -> pd.DataFrame:
+    """Load DK feedback rows once, from an annotated export or the notes history."""
+    if notes_file:
+        notes = _read_people(notes_file)
+    else:
+        notes = load_latest_notes(conference)
+        if notes is None:
+            return pd.DataFrame()
+    return extract_scoring_feedback(notes)
+
+
+def score_replay_rows(rows: pd.DataFrame, config: dict, stats: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """Raw contact scores and normalized lead scores for replay rows."""
+    titles = rows["Job Title"]
+    title_scores = {title: calculate_title_scores(title, config) for title in titles.unique()}
+    contact = np.array([calculate_contact_score(*title_scores[t], 0.0, config) for t in titles], dtype=float)
+
+    has_title = titles.str.strip().ne("").to_numpy()
+    company = rows["Company Score"].to_numpy(dtype=float)
+    raw_lead = calculate_lead_scores(contact, company, company > 0, has_title)
+    lead = normalize_scores_array(raw_lead, stats.get("lead_score_min"), stats.get("lead_score_max"))
+    return contact, lead
+
+
+def _tier_counts(lead: np.ndarray) -> Dict[str, int]:
+    tiers = assign_lead_tiers(pd.Series(lead)).value_counts()
+    return {label: int(tiers.get(label, 0)) for label, _ in LEAD_TIERS}
+
+
+def _init_worker(rows: pd.DataFrame, population: pd.DataFrame, base_config: dict, stats: dict) -> None:
+    # Longest-match INFO logs from calculate_domain_score would flood the pool
+    logging.disable(logging.INFO)
+    base_plan = compile_config(base_config)
+    baseline_contact, baseline_lead = score_replay_rows(rows, base_plan, stats)
+    _, population_lead = score_replay_rows(population, base_plan, stats)
+    _WORKER_STATE.update(
+        rows=rows,
+        population=population,
+        base_config=base_config,
+        stats=stats,
+        baseline_contact=baseline_contact,
+        baseline_tiers=_tier_counts(baseline_lead),
+        population_tiers=_tier_counts(population_lead),
+    )
+
+
+def _replay_variant(variant: Dict) -> Dict:
+    state = _WORKER_STATE
+    config = compile_config(apply_config_edits(state["base_config"], variant.get("edits", [])))
+    contact, lead = score_replay_rows(state["rows"], config, state["stats"])
+
+    direction = state["rows"]["Expected Direction"].to_numpy()
+    moved = np.sign(np.round(contact - state["baseline_contact"], 6))
+
+    result = {
+        "Variant": variant.get("name", ""),
+        "Fixed": int(((direction != 0) & (moved == direction)).sum()),
+        "Broken": int(((direction != 0) & (moved == -direction)).sum()),
+        "Collateral": int(((direction == 0) & (moved != 0)).sum()),
+    }
+    _, population_lead = score_replay_rows(state["population"], config, state["stats"])
+    population_tiers = _tier_counts(population_lead)
+    for label, _ in LEAD_TIERS:
+        result[label] = population_tiers[label]
+        result[f"{label} Δ"] = population_tiers[label] - state["population_tiers"][label]
+    feedback_tiers = _tier_counts(lead)
+    for label, _ in LEAD_TIERS:
+        result[f"Feedback {label} Δ"] = feedback_tiers[label] - state["baseline_tiers"][label]
+    return result
+
+
+def run_replay(
+    feedback: pd.DataFrame,
+    variants: List[Dict],
+    base_config: Optional[dict] = None,
+    workers: Optional[int] = None,
+    population: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Replay feedback rows under every variant and summarize fixes/breaks.
+
+    Args:
+        feedback: Output of extract_scoring_feedback (or load_feedback).
+        variants: [{"name": ..., "edits": [...]}, ...] — see apply_config_edits.
+        base_config: Config the variants are edits of. Defaults to the latest config.
+        workers: Process pool size. 1 runs in-process; None uses all CPUs.
+        population: The whole scored list (Job Title, Company Score or Company
+            Name) the tier counts and "<tier> Δ" shifts are taken over.
+            Defaults to the feedback rows.
+
+    Returns:
+        One row per variant (plus a "baseline" row first), sorted by net fixes.
+    """
+    if base_config is None:
+        base_config = load_latest_config()
+    if isinstance(base_config, ScoringPlan):
+        base_config = base_config.config
+    rows = prepare_replay_rows(feedback)
+    population_rows = rows if population is None else prepare_replay_rows(population)
+    stats = load_master_stats()
+    all_variants = [{"name": "baseline", "edits": []}] + list(variants)
+
+    if workers == 1:
+        _init_worker(rows, population_rows, base_config, stats)
+        try:
+            results = [_replay_variant(v) for v in all_variants]
+        finally:
+            logging.disable(logging.NOTSET)
+    else:
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(all_variants) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(rows, population_rows, base_config, stats)) as pool:
+            results = list(pool.map(_replay_variant, all_variants, chunksize=chunksize))
+
+    report = pd.DataFrame(results)
+    baseline, candidates = report.iloc[:1], report.iloc[1:]
+    candidates = candidates.assign(_net=candidates["Fixed"] - candidates["Broken"])
+    candidates = candidates.sort_values(["_net", "Collateral"], ascending=[False, True]).drop(columns="_net")
+    return pd.concat([baseline, candidates], ignore_index=True)
+
+
+def main():
+    """CLI entrypoint for config replay."""
+    import argparse
+    import time
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Replay DK feedback under candidate scoring configs")
+    parser.add_argument("--conference", help="Conference key whose notes history to replay (e.g. gdc_sf_26)")
+    parser.add_argument("--notes-file", help="Annotated Scored People export (TSV/CSV) instead of the notes history")
+    parser.add_argument("--variants", required=True, help="JSON file with a list of {name, edits} variants")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: all CPUs)")
+    parser.add_argument("--population", help="Scored people list to count tier shifts over "
+                                             "(default: --notes-file, else store/people.csv)")
+    args = parser.parse_args()
+
+    if not args.conference and not args.notes_file:
+        parser.error("one of --conference or --notes-file is required")
+    population_file = args.population or args.notes_file
+    if not population_file:
+        if not MASTER_LIST_PATH.exists():
+            parser.error("no scored list to count tier shifts over; pass --population")
+        population_file = str(MASTER_LIST_PATH)
+
+    feedback = load_feedback(args.conference, args.notes_file)
+    if feedback.empty:
+        print("No DK feedback rows found — nothing to replay.")
+        return
+
+    with open(args.variants, "r", encoding="utf-8") as f:
+        variants = json.load(f)
+
+    population = _read_people(population_file)
+    flagged = int((_expected_direction(feedback) != 0).sum())
+    print(f"Replaying {len(feedback)} feedback rows ({flagged} flagged) "
+          f"under {len(variants)} variants; tier shifts over {len(population):,} people "
+          f"in {os.path.basename(population_file)}...")
+    start = time.perf_counter()
+    report = run_replay(feedback, variants, workers=args.workers, population=population)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(report.to_string(index=False))
+    print(f"\n{len(variants)} variants replayed in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,37 @@ Tracks iteration-over-iteration metrics for conference scoring runs:
 Produces a velocity report (JSON + human-readable summary) that Katz and Zeb
 use to assess scraping momentum and scoring signal quality before conferences.
 
+The log lives in store/velocity/{conference}.jsonl, one entry per line,
+appended once per iteration. Each entry carries fixed-bin histograms of
+Lead/Contact/Company score and match confidence, so tier re-cuts and
+percentiles can be recomputed later without rescoring old outputs. Entries
+also carry the run's hashed person keys (compressed, base64) so the next
+iteration can count exact added/removed/updated people.
+
 Usage:
     python -m engine.velocity --conference gdc_sf_26
     python -m engine.velocity --conference gdc_sf_26 --format markdown
 """
 
+from __future__ import annotations
+
+import base64
+import bisect
+import hashlib
+import itertools
 import json
 import os
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from engine import LazyModule
+from engine.telemetry import drain_stages, summarize_stages
 
-import pandas as pd
+# Imported on first use, so the report CLI starts without them
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
 
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
@@ -29,25 +48,258 @@ STORE_DIR = _REPO_ROOT / "store"
 OUTPUT_DIR = _REPO_ROOT / "output"
 VELOCITY_DIR = STORE_DIR / "velocity"
 
+# Lead score tiers Katz works from, highest first: (label, inclusive lower bound)
+LEAD_TIERS = [
+    ("manual", 60),
+    ("high", 40),
+    ("auto", 20),
+    ("low", 10),
+    ("noise", float("-inf")),
+]
 
-def _load_velocity_log(conference: str) -> List[Dict]:
-    """Load the velocity log for a conference, or return empty list."""
-    path = VELOCITY_DIR / f"{conference}.json"
+
+def assign_lead_tiers(lead_scores: pd.Series) -> pd.Series:
+    """Label each lead score with its tier (NaN scores land in "noise")."""
+    scores = pd.to_numeric(lead_scores, errors="coerce").fillna(float("-inf"))
+    labels = [label for label, _ in LEAD_TIERS]
+    conditions = [scores >= floor for _, floor in LEAD_TIERS]
+    return pd.Series(np.select(conditions, labels, default="noise"), index=lead_scores.index)
+
+
+# Fixed-bin score histograms: one integer-wide bin per point on the 0-100
+# scale, plus under/overflow. Scored outputs round to whole points, so tier
+# re-cuts and percentiles computed from these are exact.
+HISTOGRAM_MIN = 0
+HISTOGRAM_BINS = 101
+
+HISTOGRAM_COLUMNS = {
+    "lead_score": "Lead Score",
+    "contact_score": "Contact Score",
+    "company_score": "Company Score",
+    "match_confidence": "Match Confidence",
+}
+
+
+def _velocity_path(conference: str) -> Path:
+    return VELOCITY_DIR / f"{conference}.jsonl"
+
+
+def _legacy_velocity_path(conference: str) -> Path:
+    return VELOCITY_DIR / f"{conference}.json"
+
+
+def _iter_velocity_log(conference: str) -> Iterator[Dict]:
+    """Stream velocity entries for a conference, oldest first."""
+    path = _velocity_path(conference)
     if path.exists():
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
 
+    # Pre-JSONL logs were a single JSON array
+    legacy = _legacy_velocity_path(conference)
+    if legacy.exists():
+        with open(legacy, "r", encoding="utf-8") as f:
+            yield from json.load(f)
 
-def _save_velocity_log(conference: str, log: List[Dict]) -> Path:
-    """Save velocity log for a conference."""
+
+def _load_velocity_log(conference: str) -> List[Dict]:
+    """Load the velocity log for a conference, or return empty list."""
+    return list(_iter_velocity_log(conference))
+
+
+def _last_velocity_entry(conference: str) -> Optional[Dict]:
+    """Read only the final entry of the log (seeks from the end of the file)."""
+    path = _velocity_path(conference)
+    if not path.exists():
+        log = _load_velocity_log(conference)
+        return log[-1] if log else None
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        pos = end
+        tail = b""
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            lines = [line for line in tail.splitlines() if line.strip()]
+            if len(lines) > 1 or (pos == 0 and lines):
+                return json.loads(lines[-1])
+    return None
+
+
+def _append_velocity_entry(conference: str, entry: Dict) -> Path:
+    """Append one entry to the conference's JSONL velocity log."""
     os.makedirs(str(VELOCITY_DIR), exist_ok=True)
-    path = VELOCITY_DIR / f"{conference}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(log, f, indent=2)
+    path = _velocity_path(conference)
+
+    if not path.exists():
+        # Carry a legacy JSON array over before the first append
+        legacy_entries = _load_velocity_log(conference)
+        with open(path, "w", encoding="utf-8") as f:
+            for old in legacy_entries:
+                f.write(json.dumps(old) + "\n")
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
     return path
 
 
+def score_histogram(values: pd.Series) -> Dict:
+    """Fixed-bin histogram of a 0-100 score column."""
+    numeric = pd.to_numeric(values, errors="coerce")
+    present = numeric.dropna().to_numpy(dtype=float)
+    bins = np.floor(present).astype(int) - HISTOGRAM_MIN
+    in_range = (bins >= 0) & (bins < HISTOGRAM_BINS)
+    counts = np.bincount(bins[in_range], minlength=HISTOGRAM_BINS)
+    return {
+        "min": HISTOGRAM_MIN,
+        "counts": counts.tolist(),
+        "below": int((bins < 0).sum()),
+        "above": int((bins >= HISTOGRAM_BINS).sum()),
+        "missing": int(numeric.isna().sum()),
+    }
+
+
+def histogram_tier_counts(histogram: Dict, tiers: List = LEAD_TIERS) -> Dict[str, int]:
+    """Re-cut a score histogram into tiers ((label, inclusive lower bound), highest first)."""
+    counts = np.asarray(histogram["counts"])
+    values = np.arange(len(counts)) + histogram["min"]
+    result = {}
+    upper = float("inf")
+    for label, floor in tiers:
+        in_tier = (values >= floor) & (values < upper)
+        total = int(counts[in_tier].sum())
+        if floor == float("-inf"):
+            total += histogram["below"]
+        if upper == float("inf"):
+            total += histogram["above"]
+        result[label] = total
+        upper = floor
+    return result
+
+
+def histogram_percentile(histogram: Dict, q: float) -> Optional[float]:
+    """Approximate q-th percentile (0-100) from a histogram (lower bin edge)."""
+    # Plain Python so the report CLI doesn't need numpy
+    counts = [histogram["below"], *histogram["counts"], histogram["above"]]
+    cumulative = list(itertools.accumulate(counts))
+    total = cumulative[-1]
+    if total == 0:
+        return None
+    position = bisect.bisect_left(cumulative, q / 100 * total)
+    position = min(max(position, 1), len(counts) - 2)
+    return float(histogram["min"] + position - 1)
+
+
+# Person key sets: each iteration persists the hashed, sorted set of person
+# keys (first|last|company, as in the accum dedup) plus a hash of the fields
+# accumulate updates, so deltas are exact set diffs rather than count diffs.
+HIGH_TIER_FLOOR = dict(LEAD_TIERS)["high"]
+
+
+def _hash64(values) -> np.ndarray:
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(v.encode("utf-8"), digest_size=8).digest(), "little")
+         for v in values),
+        dtype=np.uint64,
+    )
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str).str.strip()
+
+
+def person_key_set(scored_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Hashed, sorted person keys for a scored frame (first row wins on dupes).
+
+    Returns:
+        {"keys": uint64 sorted, "content": uint64 aligned hash of
+         title/source/extra data, "lead": float aligned Lead Score}
+    """
+    keys = (_column(scored_df, "First Name").str.lower() + "|"
+            + _column(scored_df, "Last Name").str.lower() + "|"
+            + _column(scored_df, "Company Name").str.lower())
+    content = (_column(scored_df, "Job Title") + "|"
+               + _column(scored_df, "Source") + "|"
+               + _column(scored_df, "Extra Data"))
+
+    key_hashes = _hash64(keys)
+    unique_keys, first_pos = np.unique(key_hashes, return_index=True)
+    lead = pd.to_numeric(scored_df.get("Lead Score", pd.Series(np.nan, index=scored_df.index)),
+                         errors="coerce").to_numpy(dtype=float)
+    return {
+        "keys": unique_keys,
+        "content": _hash64(content.iloc[first_pos]),
+        "lead": lead[first_pos],
+    }
+
+
+def _encode_key_set(key_set: Dict[str, np.ndarray]) -> Dict:
+    """Compact, JSON-safe form of a key set for the log entry itself.
+
+    Keys and content hashes are stored as zlib-compressed little-endian
+    uint64 bytes in base64, so the set travels with the committed log.
+    """
+    def pack(values):
+        return base64.b64encode(zlib.compress(np.asarray(values, dtype="<u8").tobytes(), 9)).decode("ascii")
+
+    return {"count": int(len(key_set["keys"])), "keys": pack(key_set["keys"]),
+            "content": pack(key_set["content"])}
+
+
+def _decode_key_set(stored) -> Optional[Dict[str, np.ndarray]]:
+    """Key set from a log entry's people_keys, or None when it's unavailable.
+
+    Older entries point to a .npz file under VELOCITY_DIR instead; those only
+    load where the file still exists.
+    """
+    if isinstance(stored, dict):
+        def unpack(text):
+            return np.frombuffer(zlib.decompress(base64.b64decode(text)), dtype="<u8").astype(np.uint64)
+
+        return {"keys": unpack(stored["keys"]), "content": unpack(stored["content"])}
+    if not stored:
+        return None
+    path = VELOCITY_DIR / stored
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        return {"keys": data["keys"], "content": data["content"]}
+
+
+def diff_key_sets(previous: Dict[str, np.ndarray], current: Dict[str, np.ndarray]) -> Dict[str, int]:
+    """Exact added/removed/updated counts between two sorted key sets.
+
+    The two sorted key arrays are merged (np.intersect1d on unique keys uses a
+    stable sort, which merges the two sorted runs in one linear pass), so the
+    diff is O(n) in the set sizes.
+    """
+    prev_keys, cur_keys = previous["keys"], current["keys"]
+    _, prev_pos, cur_pos = np.intersect1d(prev_keys, cur_keys, assume_unique=True, return_indices=True)
+
+    in_prev = np.zeros(len(cur_keys), dtype=bool)
+    in_prev[cur_pos] = True
+    added = ~in_prev
+    retained = len(cur_pos)
+
+    result = {
+        "added": int(added.sum()),
+        "removed": int(len(prev_keys) - retained),
+        "updated": int((previous["content"][prev_pos] != current["content"][cur_pos]).sum()),
+    }
+    if "lead" in current:
+        result["new_high_tier"] = int((added & (current["lead"] >= HIGH_TIER_FLOOR)).sum())
+    return result
+
+
 def compute_iteration_stats(scored_df: pd.DataFrame, version_label: str) -> Dict:
     """Compute stats for a single scoring iteration.
 
@@ -97,27 +349,45 @@ def compute_iteration_stats(scored_df: pd.DataFrame, version_label: str) -> Dict
             "mean": round(float(company_scores.mean()), 1) if not company_scores.dropna().empty else None,
             "median": round(float(company_scores.median()), 1) if not company_scores.dropna().empty else None,
         },
+        "histograms": {
+            key: score_histogram(scored_df.get(col, pd.Series(dtype=float)))
+            for key, col in HISTOGRAM_COLUMNS.items()
+        },
     }
     return stats
 
 
-def record_iteration(conference: str, scored_df: pd.DataFrame, version_label: str) -> Dict:
+def record_iteration(conference: str, scored_df: pd.DataFrame, version_label: str,
+                     config_hash: Optional[str] = None) -> Dict:
     """Record a scoring iteration and compute velocity deltas.
 
+    Any pipeline stage telemetry recorded in this process (see
+    engine.telemetry) is drained into the entry.
+
     Args:
         conference: Conference key (e.g. "gdc_sf_26")
         scored_df: Scored people DataFrame
         version_label: e.g. "v3 (Scrape 3 + LISN)"
+        config_hash: ScoringPlan.config_hash of the config used, so
+            engine.delta can find it again later
 
     Returns:
         Dict with current stats + velocity deltas vs previous iteration.
     """
-    log = _load_velocity_log(conference)
+    prev = _last_velocity_entry(conference)
     current = compute_iteration_stats(scored_df, version_label)
+    key_set = person_key_set(scored_df)
+    current["people_keys"] = _encode_key_set(key_set)
+    if config_hash:
+        current["config_hash"] = config_hash
+
+    # Pipeline stage timings recorded so far in this run (engine.telemetry)
+    stages = drain_stages()
+    if stages:
+        current["telemetry"] = {"summary": summarize_stages(stages), "stages": stages}
 
     # Compute deltas if we have a previous iteration
-    if log:
-        prev = log[-1]
+    if prev:
         current["delta"] = {
             "new_people": current["total_people"] - prev["total_people"],
             "new_matched": current["company_matched"] - prev["company_matched"],
@@ -127,17 +397,25 @@ def record_iteration(conference: str, scored_df: pd.DataFrame, version_label: st
             ),
             "previous_version": prev["version"],
         }
+        prev_keys = _decode_key_set(prev.get("people_keys"))
+        if prev_keys is not None:
+            current["delta"].update(diff_key_sets(prev_keys, key_set))
+        elif "people_keys" in prev:
+            # The previous entry had a key set, but it can't be read here
+            current["delta"]["baseline"] = "missing"
     else:
         current["delta"] = None
 
-    log.append(current)
-    _save_velocity_log(conference, log)
+    _append_velocity_entry(conference, current)
     return current
 
 
 def format_velocity_report(conference: str, format: str = "text") -> str:
     """Generate a human-readable velocity report.
 
+    Entries are streamed from the log one line at a time; only the latest
+    one is held for the detail section.
+
     Args:
         conference: Conference key
         format: "text" for plain text, "markdown" for markdown
@@ -145,9 +423,11 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
     Returns:
         Formatted report string.
     """
-    log = _load_velocity_log(conference)
-    if not log:
+    entries = _iter_velocity_log(conference)
+    first = next(entries, None)
+    if first is None:
         return f"No velocity data for {conference}."
+    entries = itertools.chain([first], entries)
 
     lines = []
     conf_label = conference.upper().replace("_", " ")
@@ -162,13 +442,16 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
         lines.append("| Version | People | Matched | Match % | Mean Lead | High (40+) | New People |")
         lines.append("|---------|--------|---------|---------|-----------|------------|------------|")
 
-        for entry in log:
+        for entry in entries:
+            latest = entry
             ls = entry["lead_score"]
             high_count = ls["tier_manual_90plus"] + ls["tier_high_60plus"] + ls["tier_mid_40_59"]
             delta_people = ""
             if entry.get("delta"):
                 dp = entry["delta"]["new_people"]
                 delta_people = f"+{dp}" if dp > 0 else str(dp)
+                if "added" in entry["delta"]:
+                    delta_people += f" (+{entry['delta']['added']} / −{entry['delta']['removed']})"
 
             mean_str = f"{ls['mean']:.1f}" if ls.get('mean') is not None else "—"
             lines.append(
@@ -184,7 +467,6 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
         lines.append("")
 
         # Latest iteration detail
-        latest = log[-1]
         ls = latest["lead_score"]
         lines.append(f"### Latest: {latest['version']} ({latest['timestamp']})")
         lines.append("")
@@ -200,6 +482,14 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
         lines.append(f"- ⬜ Noise (<10): **{ls['tier_noise_below_10']}**")
         lines.append("")
 
+        lead_hist = latest.get("histograms", {}).get("lead_score")
+        if lead_hist:
+            pcts = [f"p{q}: {histogram_percentile(lead_hist, q):.0f}" for q in (50, 75, 90, 99)
+                    if histogram_percentile(lead_hist, q) is not None]
+            if pcts:
+                lines.append(f"**Lead Score percentiles:** {', '.join(pcts)}")
+                lines.append("")
+
         if latest.get("delta"):
             d = latest["delta"]
             lines.append(f"**vs {d['previous_version']}:** "
@@ -207,6 +497,13 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
                           f"+{d['new_matched']} matched, "
                           f"match rate {'↑' if d['match_rate_change'] >= 0 else '↓'}{abs(d['match_rate_change'])}%, "
                           f"mean lead score {'↑' if d['mean_lead_score_change'] >= 0 else '↓'}{abs(d['mean_lead_score_change'])}")
+            if "added" in d:
+                lines.append("")
+                lines.append(f"**People churn:** +{d['added']} added, −{d['removed']} removed, "
+                              f"{d['updated']} updated, **{d['new_high_tier']}** new leads ≥40")
+            elif d.get("baseline") == "missing":
+                lines.append("")
+                lines.append("**People churn:** unavailable (previous key set missing)")
 
         # Source breakdown
         lines.append("")
@@ -214,6 +511,29 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
         for src, count in latest.get("sources", {}).items():
             lines.append(f"- {src}: {count:,}")
 
+        telemetry = latest.get("telemetry")
+        if telemetry:
+            lines.append("")
+            lines.append("**Pipeline performance:**")
+            lines.append("")
+            traced = any(st.get("traced_peak_mb") is not None for st in telemetry["stages"])
+            if traced:
+                lines.append("| Stage | Time (s) | Rows | Rows/s | Peak RSS (MB) | Traced peak (MB) |")
+                lines.append("|-------|----------|------|--------|---------------|------------------|")
+            else:
+                lines.append("| Stage | Time (s) | Rows | Rows/s | Peak RSS (MB) |")
+                lines.append("|-------|----------|------|--------|---------------|")
+            for st in telemetry["stages"]:
+                name = ("↳ " * st.get("depth", 0)) + st["stage"]
+                rows = f"{st['rows']:,}" if st.get("rows") is not None else "—"
+                rate = f"{st['rows_per_sec']:,.0f}" if st.get("rows_per_sec") is not None else "—"
+                rss = f"{st['peak_rss_mb']:,.0f}" if st.get("peak_rss_mb") is not None else "—"
+                row = f"| {name} | {st['seconds']:.2f} | {rows} | {rate} | {rss} |"
+                if traced:
+                    peak = f"{st['traced_peak_mb']:,.1f}" if st.get("traced_peak_mb") is not None else "—"
+                    row += f" {peak} |"
+                lines.append(row)
+
     else:
         # Plain text format
         lines.append(f"{'='*60}")
@@ -222,7 +542,7 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
         lines.append(f"{'='*60}")
         lines.append("")
 
-        for i, entry in enumerate(log):
+        for entry in entries:
             ls = entry["lead_score"]
             high_count = ls["tier_manual_90plus"] + ls["tier_high_60plus"] + ls["tier_mid_40_59"]
             mean_str = f"{ls['mean']:.1f}" if ls.get('mean') is not None else "—"
@@ -234,6 +554,18 @@ def format_velocity_report(conference: str, format: str = "text") -> str:
                 lines.append(f"    Δ vs {d['previous_version']}: "
                               f"+{d['new_people']} people, +{d['new_matched']} matched, "
                               f"mean LS {'+' if d['mean_lead_score_change'] >= 0 else ''}{d['mean_lead_score_change']}")
+                if "added" in d:
+                    lines.append(f"    Churn: +{d['added']} added, -{d['removed']} removed, "
+                                  f"{d['updated']} updated, {d['new_high_tier']} new leads 40+")
+                elif d.get("baseline") == "missing":
+                    lines.append("    Churn: unavailable (previous key set missing)")
+            perf = (entry.get("telemetry") or {}).get("summary")
+            if perf:
+                rss = f" | peak RSS {perf['peak_rss_mb']:,.0f} MB" if perf.get("peak_rss_mb") is not None else ""
+                if perf.get("traced_peak_mb") is not None:
+                    rss += f" | most memory: {perf['traced_peak_stage']} {perf['traced_peak_mb']:,.1f} MB"
+                lines.append(f"    Run: {perf['total_seconds']:.1f}s | slowest: "
+                              f"{perf['slowest_stage']} {perf['slowest_seconds']:.1f}s{rss}")
             lines.append("")
 
         lines.append(f"{'='*60}")
@@ -0,0 +1,242 @@
+"""
+Warm scoring state: everything needed to score a person, loaded once.
+
+A cold scorer run imports pandas, parses companies.csv, loads the config and
+then fuzzy-matches every person against all ~11K companies. WarmState keeps
+the compiled ScoringPlan, a CompanyIndex, master stats and the warmth index
+in memory so long-lived callers (engine.service, engine.stream, engine.run)
+pay that once and score individual people in milliseconds.
+
+CompanyIndex returns exactly what match_person_to_company's full scan does.
+A match needs >= 90 confidence, which only three cases in
+calculate_match_score_normalized can give:
+  - identical names (100)                       -> dict lookup
+  - containment with length ratio > 0.9 (97)    -> only same-ish lengths
+  - SequenceMatcher ratio >= 0.98               -> impossible unless both
+    names are >= 25 chars and within ~4% length of each other
+so only companies in a narrow length window are compared, in store order.
+
+Usage:
+    from engine.warm import load_warm_state, score_records
+
+    state = load_warm_state()
+    scored = score_records(state, [{"First Name": "Ana", "Last Name": "Lee",
+                                    "Job Title": "Senior Producer", "Company": "Supercell"}])
+"""
+
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine.config import get_latest_config_file
+from engine.engagement import EVENTS_FILE, load_warmth_index, person_keys, warmth_for_keys
+from engine.lead import calculate_lead_scores
+from engine.normalize import (
+    calculate_match_score_normalized,
+    normalize_company_name,
+    normalize_scores_array,
+)
+from engine.plan import ScoringPlan, load_plan
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+_REPO_ROOT = _SCRIPT_DIR.parent
+COMPANIES_FILE = _REPO_ROOT / "store" / "companies.csv"
+MASTER_STATS_FILE = _REPO_ROOT / "store" / "baselines" / "MASTER_PEOPLE_STATS.json"
+
+MIN_MATCH_CONFIDENCE = 90.0
+# Below these, calculate_match_score_normalized can't reach MIN_MATCH_CONFIDENCE
+_CONTAINMENT_LENGTH_RATIO = 0.9
+_SEQUENCE_MIN_LENGTH = 25
+_SEQUENCE_LENGTH_RATIO = 0.96
+
+OUTPUT_FIELDS = [
+    "First Name", "Last Name", "Full Name", "Job Title", "Company Name",
+    "Lead Score", "Contact Score", "Company Score", "Seniority", "Domain", "Warmth",
+    "Matched Company", "Match Confidence",
+]
+
+
+class CompanyIndex:
+    """Exact/length-bucketed index over the scored companies list."""
+
+    def __init__(self, companies_df: pd.DataFrame):
+        normal_column = "Normal Company" if "Normal Company" in companies_df.columns else "Normalized Name"
+        self.companies_df = companies_df
+        self.names = companies_df["Company Name"].tolist()
+        self.scores = companies_df["Company Score"].tolist()
+        self.normals = companies_df[normal_column].tolist()
+        company_scores = pd.to_numeric(companies_df["Company Score"], errors="coerce")
+        # NaN when a company has no score: a match on it gives Lead Score 100
+        self.max_company_score = float(company_scores.max()) if company_scores.notna().all() else math.nan
+
+        self.exact: Dict[str, int] = {}
+        self.by_length: Dict[int, List[int]] = {}
+        for position, normal in enumerate(self.normals):
+            if not isinstance(normal, str) or not normal.strip():
+                continue
+            self.exact.setdefault(normal, position)
+            self.by_length.setdefault(len(normal), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _candidates(self, length: int) -> List[int]:
+        low = math.floor(length * _CONTAINMENT_LENGTH_RATIO)
+        high = math.ceil(length / _CONTAINMENT_LENGTH_RATIO)
+        positions = []
+        for candidate_length in range(max(1, low), high + 1):
+            positions.extend(self.by_length.get(candidate_length, ()))
+        positions.sort()
+        return positions
+
+    def match(self, person_normal_company: str) -> Tuple[str, float, float]:
+        """Same result as engine.people.match_person_to_company over the full list."""
+        if not isinstance(person_normal_company, str) or not person_normal_company.strip():
+            return "", 0.0, 0.0
+
+        position = self.exact.get(person_normal_company)
+        if position is not None:
+            return self.names[position], 100, self.scores[position]
+
+        person_length = len(person_normal_company)
+        best_position, best_score = None, 0.0
+        for position in self._candidates(person_length):
+            normal = self.normals[position]
+            shorter, longer = sorted((person_length, len(normal)))
+            length_ratio = shorter / longer
+            containment_possible = (
+                length_ratio > _CONTAINMENT_LENGTH_RATIO and shorter >= 5
+                and (person_normal_company in normal or normal in person_normal_company)
+            )
+            sequence_possible = shorter >= _SEQUENCE_MIN_LENGTH and length_ratio >= _SEQUENCE_LENGTH_RATIO
+            if not (containment_possible or sequence_possible):
+                continue
+            score = calculate_match_score_normalized(person_normal_company, normal)
+            if score >= MIN_MATCH_CONFIDENCE and score > best_score:
+                best_position, best_score = position, score
+
+        if best_position is None:
+            return "", 0.0, 0.0
+        return self.names[best_position], best_score, self.scores[best_position]
+
+
+def load_company_index(companies_file: Optional[Path] = None) -> CompanyIndex:
+    """Build a CompanyIndex from the scored companies CSV."""
+    return CompanyIndex(pd.read_csv(companies_file or COMPANIES_FILE))
+
+
+@dataclass
+class WarmState:
+    """Compiled config + company index + normalization stats + warmth index."""
+
+    plan: ScoringPlan
+    company_index: CompanyIndex
+    stats: dict
+    warmth_index: pd.Series
+    signature: tuple = field(default_factory=tuple)
+
+
+def _mtime(path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+def warm_state_signature(companies_file: Optional[Path] = None, config_dir: Optional[str] = None) -> tuple:
+    """Cheap fingerprint of every input WarmState is built from (paths + mtimes)."""
+    config_file = get_latest_config_file(config_dir)
+    companies_file = companies_file or COMPANIES_FILE
+    return (
+        (config_file, _mtime(config_file)),
+        (str(companies_file), _mtime(companies_file)),
+        _mtime(EVENTS_FILE),
+        _mtime(MASTER_STATS_FILE),
+    )
+
+
+def load_warm_state(companies_file: Optional[Path] = None, config_dir: Optional[str] = None) -> WarmState:
+    """Load everything needed to score people without touching disk again."""
+    from engine.people import load_master_stats
+
+    signature = warm_state_signature(companies_file, config_dir)
+    return WarmState(
+        plan=load_plan(config_dir),
+        company_index=load_company_index(companies_file),
+        stats=load_master_stats(),
+        warmth_index=load_warmth_index(),
+        signature=signature,
+    )
+
+
+def _text(record: dict, *fields: str) -> str:
+    for name in fields:
+        value = record.get(name)
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        return str(value)
+    return ""
+
+
+def score_records(state: WarmState, records: List[dict]) -> List[dict]:
+    """Score people records against warm state.
+
+    Records use the staging column names (First Name, Last Name, Job Title,
+    Company Name or Company, optionally Normal Company). Scores are
+    normalized with the fixed master stats, so a person scores the same
+    whether sent alone or in a batch.
+
+    Returns:
+        One dict per record with the scored-output fields (OUTPUT_FIELDS).
+    """
+    if not records:
+        return []
+    plan, index = state.plan, state.company_index
+
+    first = [_text(r, "First Name") for r in records]
+    last = [_text(r, "Last Name") for r in records]
+    titles = [_text(r, "Job Title") for r in records]
+    companies = [_text(r, "Company Name", "Company") for r in records]
+
+    title_scores = [plan.title_scores(title) for title in titles]
+    seniority = np.array([s for s, _ in title_scores], dtype=float)
+    domain = np.array([d for _, d in title_scores], dtype=float)
+    warmth = warmth_for_keys(person_keys(first, last, companies), state.warmth_index)
+    raw_contact = plan.contact_score(seniority, domain, warmth)
+
+    matches = []
+    for record, company in zip(records, companies):
+        normal = _text(record, "Normal Company").strip() or (normalize_company_name(company) if company else "")
+        matches.append(index.match(normal))
+    confidence = np.array([m[1] for m in matches], dtype=float)
+    company_score = np.array([m[2] for m in matches], dtype=float)
+    has_title = np.array([bool(t.strip()) for t in titles])
+
+    raw_lead = calculate_lead_scores(raw_contact, company_score, confidence >= MIN_MATCH_CONFIDENCE, has_title)
+    stats = state.stats
+    contact = normalize_scores_array(raw_contact, stats.get("contact_score_min"), stats.get("contact_score_max"))
+    lead = normalize_scores_array(raw_lead, stats.get("lead_score_min"), stats.get("lead_score_max"))
+
+    scored = []
+    for i in range(len(records)):
+        scored.append({
+            "First Name": first[i],
+            "Last Name": last[i],
+            "Full Name": f"{first[i]} {last[i]}".strip(),
+            "Job Title": titles[i],
+            "Company Name": companies[i],
+            "Lead Score": int(round(lead[i])),
+            "Contact Score": int(round(contact[i])),
+            "Company Score": int(round(company_score[i])) if company_score[i] > 0 else "",
+            "Seniority": int(round(seniority[i])),
+            "Domain": int(round(domain[i])),
+            "Warmth": int(round(warmth[i])),
+            "Matched Company": matches[i][0],
+            "Match Confidence": int(round(confidence[i])) if confidence[i] > 0 else "",
+        })
+    return scored
@@ -3,7 +3,8 @@ Close CRM enrichment: Funnel status, meetings, engagement -> update warmth signa
 
 Pulls deal progression data from Close CRM API to refresh Demand pillar data.
 Priority columns: Close Status, Close Status Change Dt.
-Also updates warmth scores for people who've had recent CRM interactions.
+Also updates warmth scores for people who've had recent CRM interactions:
+positive replies go to engine.engagement.add_engagement_events as "Response".
 
 Status: STUB — Close CRM accessible via Slack MCP (AppTurbine workspace).
 """
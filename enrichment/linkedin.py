@@ -4,6 +4,7 @@ LinkedIn enrichment: People extraction + title/company parsing.
 Extracts people from LinkedIn post reactions, profile views, connection requests.
 Parses titles and companies for scoring input.
 Feeds into turbine-bd-tools for tiered outreach automation.
+Post reactions feed Warmth via engine.engagement.add_engagement_events as "Engaged".
 
 Status: STUB — extraction logic lives in turbine-bd-tools repo.
 """
@@ -2,6 +2,8 @@
 [CONFERENCE NAME] — Conference People Scorer
 
 Copy this file for each new conference. Change the 4 config lines below.
+(Conferences that only need a column mapping can instead be a JSON entry in
+conferences/, scored with python -m engine.run.)
 
 Usage:
     python -m scorers.[filename]
@@ -18,11 +20,18 @@ _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 sys.path.insert(0, str(_REPO_ROOT))
 
-from engine.people import process_people_scoring, load_config
+from engine import configure_logging
+from engine.config import refresh_config_in_background
+from engine.people import process_people_scoring
+from engine.plan import load_plan
+from engine.outputs import write_scored_outputs
+from engine.profiling import profile_run
+from engine.telemetry import stage
 
 
 def main():
     """Score [CONFERENCE NAME] attendees."""
+    configure_logging()
 
     # ===== CONFIGURE THESE 4 THINGS =====
     input_file = _REPO_ROOT / 'sources' / "YOUR_CONFERENCE_INPUT.tsv"         # Input attendee file
@@ -39,6 +48,12 @@ def main():
     INPUT_SOURCE = 'Source'
     INPUT_EXTRA = 'Extra Data'       # Optional — set to None if not present
 
+    # Extra output files (see engine/outputs.py)
+    TIER_FILES = False               # One TSV per lead tier
+    TOP_VIEW = None                  # e.g. 200 for a _top200 file
+    MIN_TIER = None                  # e.g. "auto" to leave low/noise rows out
+    PER_COMPANY = None               # e.g. 3 for the best 3 contacts per company
+
     print(f"Processing conference scoring...")
     print(f"Input: {input_file}")
     print(f"Companies: {companies_file}")
@@ -46,7 +61,9 @@ def main():
 
     # Read input
     input_sep = '\t' if str(input_file).endswith('.tsv') else ','
-    people_df = pd.read_csv(input_file, sep=input_sep)
+    with stage("load input") as load_stage:
+        people_df = pd.read_csv(input_file, sep=input_sep)
+        load_stage["rows"] = len(people_df)
     print(f"Loaded {len(people_df)} people from input file")
 
     # Create staging format
@@ -66,14 +83,19 @@ def main():
     staging_df.to_csv(temp_staging, sep='\t', index=False)
 
     # Preprocess companies
-    companies_df = pd.read_csv(companies_file)
-    if 'Normalized Name' in companies_df.columns and 'Normal Company' not in companies_df.columns:
-        companies_df['Normal Company'] = companies_df['Normalized Name']
-    temp_companies = temp_dir / 'COMPANIES_temp.csv'
-    companies_df.to_csv(temp_companies, index=False)
+    with stage("load companies") as companies_stage:
+        companies_df = pd.read_csv(companies_file)
+        if 'Normalized Name' in companies_df.columns and 'Normal Company' not in companies_df.columns:
+            companies_df['Normal Company'] = companies_df['Normalized Name']
+        temp_companies = temp_dir / 'COMPANIES_temp.csv'
+        companies_df.to_csv(temp_companies, index=False)
+        companies_stage["rows"] = len(companies_df)
 
     # Score
-    config = load_config()
+    config = load_plan()
+    # Check the sheet for edits without waiting on it; a changed config is
+    # saved for the next run and this run keeps the cached one
+    refresh_config_in_background()
     results_df = process_people_scoring(str(temp_staging), str(temp_companies), config)
 
     column_order = [
@@ -85,8 +107,9 @@ def main():
     results_df = results_df[column_order]
 
     # Save
-    os.makedirs(output_file.parent, exist_ok=True)
-    results_df.to_csv(output_file, sep='\t', index=False)
+    with stage("write output", rows=len(results_df)):
+        write_scored_outputs(results_df, output_file, tier_files=TIER_FILES, top_k=TOP_VIEW, min_tier=MIN_TIER,
+                             per_company=PER_COMPANY, config_hash=config.config_hash)
 
     # Cleanup
     os.remove(temp_staging)
@@ -106,9 +129,11 @@ def main():
     VERSION_LABEL = "v1 (your description)"       # e.g. "v1 (LISN + MTM Scrape 1)"
 
     from engine.velocity import record_iteration, format_velocity_report
-    record_iteration(CONFERENCE_KEY, results_df, VERSION_LABEL)
+    record_iteration(CONFERENCE_KEY, results_df, VERSION_LABEL, config_hash=config.config_hash)
     print("\n" + format_velocity_report(CONFERENCE_KEY, format="text"))
 
 
 if __name__ == "__main__":
-    main()
+    # TURBINE_PROFILE=1 saves a cProfile to output/ and prints hot-path counters
+    with profile_run("template"):
+        main()
@@ -13,6 +13,7 @@ Workflow:
 
 Usage:
     python -m scorers.gdc_sf_26
+    TURBINE_PROFILE=1 python -m scorers.gdc_sf_26    # profile the run
 """
 
 import os
@@ -27,17 +28,29 @@ _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 _REPO_ROOT = _SCRIPT_DIR.parent
 sys.path.insert(0, str(_REPO_ROOT))
 
-from engine.people import process_people_scoring, load_config
+from engine import configure_logging
+from engine.config import refresh_config_in_background
+from engine.people import process_people_scoring
+from engine.plan import load_plan
+from engine.outputs import write_scored_outputs
+from engine.profiling import profile_run
+from engine.score_cache import score_cache_path
+from engine.telemetry import stage
 
 
 # ===== CONFERENCE CONFIG =====
 CONFERENCE_KEY = "gdc_sf_26"
 VERSION_LABEL = "v3 (accumulated)"  # UPDATE THIS each scoring run
+TIER_FILES = False   # also write one TSV per lead tier (_manual, _high, ...)
+TOP_VIEW = None      # e.g. 200: also write the top 200 leads to _top200
+MIN_TIER = None      # e.g. "auto": leave low/noise rows out of the written files
+PER_COMPANY = None   # e.g. 3: best 3 contacts per matched company + company rollups
 # =============================
 
 
 def main():
     """Score GDC San Francisco '26 attendees from accumulated list."""
+    configure_logging()
 
     # Input: the accumulated attendee list (built by engine.accumulate)
     input_file = _REPO_ROOT / 'sources' / 'accum' / f'{CONFERENCE_KEY}_accum.tsv'
@@ -58,7 +71,9 @@ def main():
 
     # Read the accumulated input
     print("\nPreprocessing input file...")
-    people_df = pd.read_csv(input_file, sep='\t', dtype=str, keep_default_na=False)
+    with stage("load accum") as load_stage:
+        people_df = pd.read_csv(input_file, sep='\t', dtype=str, keep_default_na=False)
+        load_stage["rows"] = len(people_df)
 
     print(f"Loaded {len(people_df)} people from accumulated list")
     print(f"Columns: {list(people_df.columns)}")
@@ -70,7 +85,9 @@ def main():
         'Job Title': people_df['Job Title'],
         'Company Name': people_df['Company'],
         'Source': people_df['Source'],
-        'Extra Data': people_df['Extra Data'] if 'Extra Data' in people_df.columns else ''
+        'Extra Data': people_df['Extra Data'] if 'Extra Data' in people_df.columns else '',
+        # Lets the score cache skip people untouched since the last scrape
+        'Last Updated': people_df['Last Updated'] if 'Last Updated' in people_df.columns else ''
     })
 
     # Save staging file temporarily
@@ -82,20 +99,26 @@ def main():
 
     # Preprocess companies file — map 'Normalized Name' -> 'Normal Company'
     print("Preprocessing companies file...")
-    companies_df = pd.read_csv(companies_file)
+    with stage("load companies") as companies_stage:
+        companies_df = pd.read_csv(companies_file)
 
-    if 'Normalized Name' in companies_df.columns and 'Normal Company' not in companies_df.columns:
-        companies_df['Normal Company'] = companies_df['Normalized Name']
-        print("Mapped 'Normalized Name' -> 'Normal Company'")
+        if 'Normalized Name' in companies_df.columns and 'Normal Company' not in companies_df.columns:
+            companies_df['Normal Company'] = companies_df['Normalized Name']
+            print("Mapped 'Normalized Name' -> 'Normal Company'")
 
-    temp_companies_file = temp_dir / 'COMPANY_SCORES_temp.csv'
-    companies_df.to_csv(temp_companies_file, index=False)
+        temp_companies_file = temp_dir / 'COMPANY_SCORES_temp.csv'
+        companies_df.to_csv(temp_companies_file, index=False)
+        companies_stage["rows"] = len(companies_df)
 
     # Load config and score
     print("\nLoading latest scoring configuration...")
-    config = load_config()
+    config = load_plan()
+    # Check the sheet for edits without waiting on it; a changed config is
+    # saved for the next run and this run keeps the cached one
+    refresh_config_in_background()
 
-    results_df = process_people_scoring(str(temp_staging_file), str(temp_companies_file), config)
+    results_df = process_people_scoring(str(temp_staging_file), str(temp_companies_file), config,
+                                        score_cache_file=str(score_cache_path(CONFERENCE_KEY)))
 
     # Reorder columns
     column_order = [
@@ -107,8 +130,10 @@ def main():
     results_df = results_df[column_order]
 
     # Save results as TSV
-    os.makedirs(output_file.parent, exist_ok=True)
-    results_df.to_csv(output_file, sep='\t', index=False)
+    with stage("write output", rows=len(results_df)):
+        written = write_scored_outputs(results_df, output_file, tier_files=TIER_FILES,
+                                       top_k=TOP_VIEW, min_tier=MIN_TIER, per_company=PER_COMPANY,
+                                       config_hash=config.config_hash)
 
     # Clean up temp files
     os.remove(temp_staging_file)
@@ -135,13 +160,18 @@ def main():
     print(f"Lead Score range: {lead_score_range}")
 
     print(f"\nResults saved to: {output_file}")
+    for name, path in written.items():
+        if name != "all":
+            print(f"  {name}: {path}")
 
     # Record velocity tracking
     from engine.velocity import record_iteration, format_velocity_report
 
-    record_iteration(CONFERENCE_KEY, results_df, VERSION_LABEL)
+    record_iteration(CONFERENCE_KEY, results_df, VERSION_LABEL, config_hash=config.config_hash)
     print("\n" + format_velocity_report(CONFERENCE_KEY, format="text"))
 
 
 if __name__ == "__main__":
-    main()
+    # TURBINE_PROFILE=1 saves a cProfile to output/ and prints hot-path counters
+    with profile_run(CONFERENCE_KEY):
+        main()
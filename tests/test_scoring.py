@@ -5,20 +5,74 @@ expected results given known inputs.
 
 import sys
 import os
+import io
+import json
+import asyncio
+import subprocess
+import tempfile
+
+import pandas as pd
 
 # Add repo root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from engine.config import load_latest_config
+from engine.config import (
+    load_latest_config,
+    get_latest_config_file,
+    update_config,
+    refresh_config_in_background,
+    CONFIG_URL_ENV,
+)
 from engine.people import (
     calculate_seniority_score,
     calculate_domain_score,
     calculate_contact_score,
     check_one_offs,
     apply_seniority_modifiers,
+    calculate_title_scores,
+)
+from engine.plan import compile_config, load_plan_from_file
+from engine.people import process_people_scoring, load_master_stats, match_person_to_company
+from engine.warm import CompanyIndex, WarmState, score_records
+from engine.service import ScoringService
+from engine.client import ScoringClient
+from engine.stream import score_stream
+from engine.run import load_registry, run_conferences
+from engine.pipeline import run_pipeline
+from engine import profiling
+from engine.outputs import (
+    company_rollups,
+    output_meta_path,
+    partition_tiers,
+    read_output_meta,
+    top_contacts_per_company,
+    top_k_rows,
+    write_scored_outputs,
+)
+from engine.frames import SCORE_FLOAT_FORMAT, compact_frame, frame_memory_mb, load_extra_data, read_scored_frame
+from engine.plan import ScoringPlan
+from benchmarks.synthetic import synthetic_people
+from benchmarks.run import run_benchmarks, compare_results
+from benchmarks.equivalence import (
+    compare_company_engines, compare_matching, compare_people_engines, diff_outputs,
+    prepare_companies, reference_people_scoring,
+)
+from benchmarks.synthetic import synthetic_company_staging
+from engine.companies import rescore_company_weights
+from engine.delta import diff_configs, rescore_with_config_delta
+from engine.lead import branch_and_bound, calculate_lead_score, calculate_lead_scores, lead_score_upper_bounds
+from engine.tuning import apply_config_edits, run_replay
+import engine.velocity as velocity
+from engine import telemetry
+import engine.engagement as engagement
+from engine.normalize import normalize_company_name, calculate_match_score, normalize_scores, normalize_scores_array
+from engine.notes import (
+    merge_dk_notes,
+    save_notes_snapshot,
+    load_notes_history,
+    load_latest_notes,
+    get_note_history,
 )
-from engine.lead import calculate_lead_score
-from engine.normalize import normalize_company_name, calculate_match_score, normalize_scores
 
 
 def test_config_loads():
@@ -65,6 +119,709 @@ def test_contact_score(config):
     print("  contact score OK")
 
 
+def test_compiled_plan(config):
+    """Compiled plan scores titles exactly like the dict walk, and caches by hash."""
+    plan = compile_config(config)
+    titles = ["", "CEO", "Senior Producer", "Jr Game Designer", "VP of Marketing",
+              "Head of Live Ops", "Co-Founder & CTO", "Associate Product Manager"]
+    for pillar in ("Seniority", "Domain", "One-Offs"):
+        components = config['peopleScore']['pillars'][pillar].get('components') or {}
+        for data in components.values():
+            for keyword in str(data.get('Keywords to Match', '')).split(','):
+                if keyword.strip():
+                    titles += [keyword.strip(), f"Senior {keyword.strip()}", f"Junior {keyword.strip()} Lead"]
+    for title in titles:
+        assert plan.title_scores(title) == calculate_title_scores(title, config), title
+    assert calculate_contact_score(80, 95, 0, plan) == calculate_contact_score(80, 95, 0, config)
+    assert plan['companyScore'] is config['companyScore']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "SCORE_TUNING_CONFIG_20990101_000000.json")
+        with open(config_path, "w") as f:
+            json.dump(config, f)
+        first = load_plan_from_file(config_path, cache_dir=tmp)
+        cached = [f for f in os.listdir(tmp) if f.endswith(".pkl")]
+        assert len(cached) == 1
+        second = load_plan_from_file(config_path, cache_dir=tmp)
+        assert second.config_hash == first.config_hash
+        assert second.title_scores("Senior Producer") == first.title_scores("Senior Producer")
+
+        with open(config_path, "w") as f:
+            json.dump(apply_config_edits(config, [{"pillar": "Domain", "description": 80}]), f)
+        edited = load_plan_from_file(config_path, cache_dir=tmp)
+        assert edited.config_hash != first.config_hash and edited.domain_weight == 80.0
+
+    try:
+        compile_config({"peopleScore": {"pillars": {}}, "companyScore": {"pillars": {}}})
+        assert False, "missing pillars should fail validation"
+    except ValueError:
+        pass
+    print("  compiled plan OK")
+
+
+def test_config_refresh(config):
+    """Refresh only writes a new config when content changes; background refresh doesn't block."""
+    previous_url = os.environ.get(CONFIG_URL_ENV)
+    with tempfile.TemporaryDirectory() as tmp:
+        endpoint = os.path.join(tmp, "endpoint.json")
+        config_dir = os.path.join(tmp, "configs")
+        with open(endpoint, "w") as f:
+            json.dump(config, f)
+        os.environ[CONFIG_URL_ENV] = endpoint
+        try:
+            first = update_config(config_dir=config_dir)
+            assert get_latest_config_file(config_dir) == first
+
+            # Same content (even re-serialized) -> no new file
+            assert update_config(force_refresh=True, config_dir=config_dir) == first
+            # Recently checked -> endpoint skipped entirely
+            os.remove(endpoint)
+            assert update_config(config_dir=config_dir) == first
+
+            edited = apply_config_edits(config, [{"pillar": "Domain", "description": 80}])
+            with open(endpoint, "w") as f:
+                json.dump(edited, f, indent=4)
+            thread = refresh_config_in_background(config_dir, max_age_seconds=0)
+            thread.join(timeout=10)
+            assert load_latest_config(config_dir)['peopleScore']['pillars']['Domain']['description'] == 80
+        finally:
+            if previous_url is None:
+                os.environ.pop(CONFIG_URL_ENV, None)
+            else:
+                os.environ[CONFIG_URL_ENV] = previous_url
+    print("  config refresh OK")
+
+
+def _score_to_tsv(people, companies, config, tmp, name):
+    """Run full people scoring on in-memory frames; return the output as read back from TSV."""
+    people_file = os.path.join(tmp, f"{name}_people.tsv")
+    companies_file = os.path.join(tmp, f"{name}_companies.csv")
+    output_file = os.path.join(tmp, f"{name}_scored.tsv")
+    people.to_csv(people_file, sep="\t", index=False)
+    companies.to_csv(companies_file, index=False)
+    process_people_scoring(people_file, companies_file, config).to_csv(output_file, sep="\t", index=False)
+    return pd.read_csv(output_file, sep="\t", dtype=str, keep_default_na=False)
+
+
+def test_config_delta_rescore(config):
+    """Delta rescoring a prior output matches a full rerun under the new config."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(40)
+    companies["Normal Company"] = companies["Normalized Name"]
+    titles = ["CEO", "Senior Producer", "Jr Game Designer", "Head of Product", "VP of Marketing",
+              "Lead Engineer", "Intern", "", "Community Manager", "Director of Live Ops"]
+    people = pd.DataFrame({
+        "First Name": [f"P{i}" for i in range(60)],
+        "Last Name": ["Test"] * 60,
+        "Job Title": [titles[i % len(titles)] for i in range(60)],
+        "Company Name": [companies["Company Name"].iloc[i % 40] if i % 7 else "Unknown Co" for i in range(60)],
+        "Source": ["test"] * 60,
+        "Extra Data": [""] * 60,
+    })
+    edited = apply_config_edits(config, [
+        {"pillar": "Seniority", "component": "Producer", "Score": 55,
+         "Keywords to Match": "Producer, Production Lead"},
+        {"pillar": "Domain", "description": 85},
+    ])
+    edited["companyScore"]["pillars"]["Alignment"]["weight"] = 20
+
+    sort_key = ["Lead Score", "First Name"]
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = _score_to_tsv(people, companies, config, tmp, "old")
+        rescored_companies = rescore_company_weights(companies, compile_config(edited))
+        expected = _score_to_tsv(people, rescored_companies, edited, tmp, "new")
+
+    delta, summary = rescore_with_config_delta(previous, config, edited, companies)
+    diff = summary["diff"]
+    assert diff["components"] == {"Seniority": ["Producer"]}, diff
+    assert diff["people_weights"] == ["Domain"] and diff["company"]
+    assert 0 < summary["people_rescored"] < len(people)
+
+    delta = delta.astype(str).sort_values(sort_key).reset_index(drop=True)
+    expected = expected.sort_values(sort_key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(delta, expected)
+
+    assert diff_configs(config, config) == {"components": {}, "people_weights": [], "company": False}
+
+    # The old config is read from the output's own sidecar
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "conf.tsv")
+        write_scored_outputs(previous, output_file, config_hash="old-hash")
+        assert read_output_meta(output_file)["config_hash"] == "old-hash"
+        assert output_meta_path(output_file).name == "conf.meta.json"
+        assert read_output_meta(os.path.join(tmp, "other.tsv")) is None
+    print("  config delta rescore OK")
+
+
+def test_incremental_score_cache(config):
+    """Rescoring with the score cache reuses unchanged people and matches a full run."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(30)
+    companies["Normal Company"] = companies["Normalized Name"]
+    titles = ["CEO", "Senior Producer", "Jr Game Designer", "Head of Product", "", "Lead Engineer"]
+    people = pd.DataFrame({
+        "First Name": [f"P{i}" for i in range(24)],
+        "Last Name": ["Test"] * 24,
+        "Job Title": [titles[i % len(titles)] for i in range(24)],
+        "Company Name": [companies["Company Name"].iloc[i] for i in range(24)],
+        "Source": ["test"] * 24,
+        "Extra Data": [""] * 24,
+        "Last Updated": ["2026-03-01"] * 24,
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        companies_file = os.path.join(tmp, "companies.csv")
+        cache_file = os.path.join(tmp, "cache.pkl")
+        companies.to_csv(companies_file, index=False)
+
+        people.to_csv(people_file, sep="\t", index=False)
+        process_people_scoring(people_file, companies_file, config, score_cache_file=cache_file)
+
+        # Next scrape: one title change, one new person
+        people.loc[3, ["Job Title", "Last Updated"]] = ["VP of Product", "2026-03-08"]
+        people.loc[24] = ["New", "Person", "CTO", companies["Company Name"].iloc[25], "test", "", "2026-03-08"]
+        people.to_csv(people_file, sep="\t", index=False)
+
+        telemetry.drain_stages()
+        incremental = process_people_scoring(people_file, companies_file, config, score_cache_file=cache_file)
+        rows = {s["stage"]: s["rows"] for s in telemetry.drain_stages()}
+        assert rows["title scoring"] == 2 and rows["company matching"] == 2, rows
+
+        full = process_people_scoring(people_file, companies_file, config)
+
+    sort_key = ["Lead Score", "First Name"]
+    pd.testing.assert_frame_equal(
+        incremental.sort_values(sort_key).reset_index(drop=True),
+        full.sort_values(sort_key).reset_index(drop=True),
+    )
+    print("  incremental score cache OK")
+
+
+def test_engagement_warmth(config):
+    """Warmth decays per event half-life, normalizes to the warmest person, and feeds scoring."""
+    from datetime import datetime, timezone
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    events = pd.DataFrame({
+        "Person Key": ["ana|lee|acme", "ana|lee|acme", "bo|kim|acme", "cy|wu|acme"],
+        "Event Type": ["Response", "Engaged", "Engaged", "Response"],
+        "Timestamp": ["2026-06-01", "2026-03-03", "2026-06-01", "2025-12-03"],
+        "Source": ["close", "linkedin", "linkedin", "close"],
+    })
+    raw = engagement.raw_warmth_by_person(events, now=now)
+    assert abs(raw["ana|lee|acme"] - (7 + 2.5)) < 1e-9   # Engaged at one half-life
+    assert abs(raw["cy|wu|acme"] - 3.5) < 1e-9           # Response at one half-life
+    index = engagement.build_warmth_index(events, now=now)
+    assert index["ana|lee|acme"] == 100 and abs(index["bo|kim|acme"] - 500 / 9.5) < 1e-9
+    warmth = engagement.warmth_for_keys(["bo|kim|acme", "nobody|x|y"], index)
+    assert warmth[1] == 0.0
+
+    original_events_file = engagement.EVENTS_FILE
+    with tempfile.TemporaryDirectory() as tmp:
+        engagement.EVENTS_FILE = os.path.join(tmp, "events.csv")
+        try:
+            added = engagement.add_engagement_events(pd.DataFrame({
+                "First Name": ["Ana", "Ana"], "Last Name": ["Lee", "Lee"], "Company": ["Acme", "Acme"],
+                "Event Type": ["Response", "Response"], "Timestamp": ["2026-05-01", "2026-05-01"],
+            }))
+            assert added == 1
+            again = engagement.add_engagement_events(pd.DataFrame({
+                "First Name": ["Ana", "Bo"], "Last Name": ["Lee", "Kim"], "Company Name": ["Acme", "Beta"],
+                "Event Type": ["Response", "Engaged"], "Timestamp": ["2026-05-01", "2026-05-02"],
+            }))
+            assert again == 1 and len(engagement.load_engagement_events()) == 2
+            try:
+                engagement.add_engagement_events(pd.DataFrame({
+                    "First Name": ["Ana"], "Last Name": ["Lee"], "Event Type": ["Response"], "Timestamp": ["2026-05-03"],
+                }))
+                assert False, "events without a company column should be rejected"
+            except ValueError:
+                pass
+
+            people_file = os.path.join(tmp, "people.tsv")
+            companies_file = os.path.join(tmp, "companies.csv")
+            pd.DataFrame({"First Name": ["Ana", "Bo"], "Last Name": ["Lee", "Kim"],
+                          "Job Title": ["Producer", "Producer"], "Company Name": ["Acme", "Acme"]}
+                         ).to_csv(people_file, sep="\t", index=False)
+            pd.DataFrame({"Company Name": ["Other"], "Company Score": [50.0], "Normal Company": ["other"]}
+                         ).to_csv(companies_file, index=False)
+            scored = process_people_scoring(people_file, companies_file, config).set_index("First Name")
+        finally:
+            engagement.EVENTS_FILE = original_events_file
+    assert scored.loc["Ana", "Warmth"] == 100 and scored.loc["Bo", "Warmth"] == 0
+    assert scored.loc["Ana", "Contact Score"] > scored.loc["Bo", "Contact Score"]
+    print("  engagement warmth OK")
+
+
+def test_company_index_matches_full_scan():
+    """CompanyIndex.match returns what match_person_to_company's full scan does."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(80)
+    long_names = ["interactive entertainment studios worldwide", "the very long named mobile games company",
+                  "massively multiplayer online entertainment group holdings"]
+    companies = pd.concat([companies, pd.DataFrame({
+        "Company Name": [name.title() for name in long_names], "Company Score": [70, 40, 55],
+        "Normalized Name": long_names,
+    })], ignore_index=True)
+    companies["Normal Company"] = companies["Normalized Name"]
+
+    queries = ["", "   ", None]
+    for normal in companies["Normal Company"].dropna().astype(str).head(40).tolist() + long_names:
+        middle = len(normal) // 2
+        queries += [
+            normal,                                           # exact
+            normal[:-1], normal[:-2], normal[:-4],            # prefixes, near and far in length
+            normal[1:], normal[2:],                           # suffixes
+            normal + "s", normal + " co",                     # longer names containing it
+            normal[:middle] + "x" + normal[middle + 1:],      # same length, one character off
+            normal[:middle] + normal[middle + 1:],            # one character dropped
+        ]
+
+    index = CompanyIndex(companies)
+    confidences = set()
+    for query in queries:
+        expected = match_person_to_company(query, companies)
+        assert index.match(query) == expected, (query, index.match(query), expected)
+        confidences.add(expected[1])
+    # Exact, containment and near-identical sequence matches were all exercised
+    assert 100 in confidences and 97 in confidences and any(98 <= c < 100 for c in confidences)
+    print("  company index matches full scan OK")
+
+
+def test_warm_scoring_service(config):
+    """Warm scoring matches process_people_scoring; the service and stream serve it."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(40)
+    companies["Normal Company"] = companies["Normalized Name"]
+    titles = ["CEO", "Senior Producer", "Jr Game Designer", "", "Lead Engineer"]
+    names = [companies["Company Name"].iloc[i] for i in range(20)]
+    names[1] = names[1] + " Inc"
+    names[2] = "Unknown Co That Matches Nothing"
+    people = pd.DataFrame({
+        "First Name": [f"P{i}" for i in range(20)],
+        "Last Name": ["Test"] * 20,
+        "Job Title": [titles[i % len(titles)] for i in range(20)],
+        "Company Name": names,
+        "Source": ["test"] * 20,
+        "Extra Data": [""] * 20,
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        companies_file = os.path.join(tmp, "companies.csv")
+        people.to_csv(people_file, sep="\t", index=False)
+        companies.to_csv(companies_file, index=False)
+        full = process_people_scoring(people_file, companies_file, config).set_index("First Name")
+
+    state = WarmState(
+        plan=compile_config(config),
+        company_index=CompanyIndex(companies),
+        stats=load_master_stats(),
+        warmth_index=engagement.load_warmth_index(),
+    )
+    warm = pd.DataFrame(score_records(state, people.to_dict("records"))).set_index("First Name")
+    for column in ["Lead Score", "Contact Score", "Seniority", "Domain", "Matched Company"]:
+        assert warm[column].tolist() == full.loc[warm.index, column].tolist(), column
+    assert warm.loc["P2", "Matched Company"] == ""
+
+    # Batch scoring gives the same result as scoring one at a time
+    alone = score_records(state, [people.iloc[0].to_dict()])[0]
+    assert alone["Lead Score"] == warm.loc["P0", "Lead Score"]
+
+    service = ScoringService.__new__(ScoringService)
+    service.state, service.reloads, service.requests, service.load_seconds = state, 0, 0, 0.0
+
+    async def round_trip():
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for path, payload in [("/score_person", people.iloc[0].to_dict()),
+                              ("/score_batch", {"people": people.head(3).to_dict("records")}),
+                              ("/nope", {})]:
+            body = json.dumps(payload).encode()
+            writer.write(f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while (line := await reader.readline()) != b"\r\n":
+                if line.lower().startswith(b"content-length"):
+                    length = int(line.split(b":")[1])
+            responses.append((status, json.loads(await reader.readexactly(length))))
+        writer.close()
+        await writer.wait_closed()
+
+        def client_calls():
+            client = ScoringClient(port=port)
+            try:
+                return client.score_person(people.iloc[0].to_dict()), client.score_batch(people.head(2).to_dict("records"))
+            finally:
+                client.close()
+
+        responses.append(await asyncio.get_running_loop().run_in_executor(None, client_calls))
+        await asyncio.sleep(0.05)  # let the handler see EOF before shutdown
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    (s1, person), (s2, batch), (s3, _), (client_person, client_batch) = asyncio.run(round_trip())
+    assert (s1, s2, s3) == (200, 200, 404)
+    assert client_person == alone and client_batch == batch[:2]
+    assert person == alone
+    assert [r["Lead Score"] for r in batch] == warm["Lead Score"].tolist()[:3]
+    print("  warm scoring service OK")
+
+    # Streaming: results written per line, extra fields passed through, bad lines skipped
+    lines = [json.dumps({"id": i, **people.iloc[i].to_dict()}) for i in range(3)]
+    output, errors = io.StringIO(), io.StringIO()
+    summary = score_stream(state, lines[:2] + ["not json", ""] + lines[2:], output, errors)
+    streamed = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert (summary["scored"], summary["skipped"]) == (3, 1) and "line 3" in errors.getvalue()
+    assert [r["id"] for r in streamed] == [0, 1, 2]
+    assert [r["Lead Score"] for r in streamed] == warm["Lead Score"].tolist()[:3]
+    print("  stream scoring OK")
+
+
+def test_batch_runner(config):
+    """Registry-driven runs share warm state and match a direct scorer run."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(30)
+    companies["Normal Company"] = companies["Normalized Name"]
+    people = pd.DataFrame({
+        "Given": [f"P{i}" for i in range(12)],
+        "Family": ["Test"] * 12,
+        "Role": ["CEO", "Senior Producer", "", "Lead Engineer"] * 3,
+        "Org": [companies["Company Name"].iloc[i] for i in range(12)],
+    })
+
+    original_dir = velocity.VELOCITY_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        velocity.VELOCITY_DIR = velocity.Path(tmp)
+        registry_dir = os.path.join(tmp, "conferences")
+        os.makedirs(registry_dir)
+        companies_file = os.path.join(tmp, "companies.csv")
+        companies.to_csv(companies_file, index=False)
+        people.to_csv(os.path.join(tmp, "conf_a.csv"), index=False)
+        people.head(5).to_csv(os.path.join(tmp, "conf_b.csv"), index=False)
+
+        columns = {"First Name": "Given", "Last Name": "Family", "Job Title": "Role", "Company Name": "Org"}
+        for key in ["conf_a", "conf_b", "conf_missing"]:
+            with open(os.path.join(registry_dir, f"{key}.json"), "w") as f:
+                json.dump({
+                    "input": os.path.join(tmp, f"{key}.csv"),
+                    "columns": columns,
+                    "output": os.path.join(tmp, "{key}_{date}.tsv"),
+                    "velocity_key": f"test_{key}",
+                }, f)
+
+        try:
+            registry = load_registry(registry_dir)
+            summaries = run_conferences(list(registry), registry, workers=2, companies_file=companies_file,
+                                        version_label="v1", plan=compile_config(config))
+        finally:
+            velocity.VELOCITY_DIR = original_dir
+
+        assert [s["status"] for s in summaries] == ["scored", "scored", "missing input"]
+        assert [s["people"] for s in summaries[:2]] == [12, 5]
+        assert os.path.exists(os.path.join(tmp, "test_conf_b.jsonl"))
+        batch = pd.read_csv(summaries[0]["output"], sep="\t")
+
+        staging_file = os.path.join(tmp, "staging.tsv")
+        people.rename(columns={v: k for k, v in columns.items()}).to_csv(staging_file, sep="\t", index=False)
+        direct = process_people_scoring(staging_file, companies_file, config)
+
+    sort_key = ["Lead Score", "First Name"]
+    compare = ["First Name", "Lead Score", "Contact Score", "Matched Company"]
+    assert (batch.sort_values(sort_key)[compare].reset_index(drop=True)
+            .equals(direct.sort_values(sort_key)[compare].reset_index(drop=True)))
+    print("  batch runner OK")
+
+
+def test_top_leads(config):
+    """Top-leads runs match fewer people and return exactly the top of a full run."""
+    import numpy as np
+
+    contact = np.array([-7.0, 0.0, 35.0, 80.0, 100.0, np.nan])
+    for titled in (True, False):
+        bound = lead_score_upper_bounds(contact, [titled] * 6, 70.0)
+        for company in (0.0, 30.0, 70.0):
+            for matched in (True, False):
+                exact = calculate_lead_scores(contact, [company] * 6, [matched] * 6, [titled] * 6)
+                assert (bound >= exact).all(), (titled, company, matched)
+
+    # Only positions whose bound can beat the running top-2 are evaluated
+    evaluated = branch_and_bound([90, 80, 70, 10], lambda i: [85, 75, 5, 9][i], top_k=2)
+    assert evaluated == {0: 85, 1: 75}
+
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(60)
+    companies["Normal Company"] = companies["Normalized Name"]
+    titles = ["CEO", "Senior Producer", "", "Jr Game Designer", "Intern", "Lead Engineer"]
+    people = pd.DataFrame({
+        "First Name": [f"P{i}" for i in range(48)],
+        "Last Name": ["Test"] * 48,
+        "Job Title": [titles[i % len(titles)] for i in range(48)],
+        "Company Name": [companies["Company Name"].iloc[i] for i in range(48)],
+    })
+
+    class CountingIndex(CompanyIndex):
+        lookups = 0
+
+        def match(self, normal):
+            CountingIndex.lookups += 1
+            return super().match(normal)
+
+    index = CountingIndex(companies)
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        people.to_csv(people_file, sep="\t", index=False)
+        full = process_people_scoring(people_file, None, config, company_index=index)
+        threshold = int(full["Lead Score"].iloc[5])
+        for options, expected in [({"min_lead_score": threshold}, full[full["Lead Score"] >= threshold]),
+                                  ({"top_k": 5}, full.head(5))]:
+            CountingIndex.lookups = 0
+            top = process_people_scoring(people_file, None, config, company_index=index, **options)
+            assert CountingIndex.lookups < len(people), options
+            assert top["Lead Score"].tolist() == expected["Lead Score"].tolist(), options
+            cut = expected["Lead Score"].min()
+            above = lambda df: sorted(df.loc[df["Lead Score"] > cut, "First Name"])
+            assert above(top) == above(expected), options
+    print("  top leads OK")
+
+
+def test_scored_outputs():
+    """Top-K and tier files match sorting and filtering the full list."""
+    scores = [55, 12, 90, 40, 40, 3, 20, 61, 40, 19, 0, 75]
+    scored = pd.DataFrame({"First Name": [f"P{i}" for i in range(len(scores))], "Lead Score": scores})
+    ordered = scored.sort_values("Lead Score", ascending=False, kind="stable")
+    for k in (1, 4, 6, 12, 20):
+        assert top_k_rows(scored, k).equals(ordered.head(k)), k
+    assert top_k_rows(scored, 0).empty
+
+    tiers = partition_tiers(ordered, min_tier="auto")
+    assert list(tiers) == ["manual", "high", "auto"]
+    assert tiers["high"]["Lead Score"].tolist() == [55, 40, 40, 40]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        written = write_scored_outputs(ordered, os.path.join(tmp, "conf.tsv"), tier_files=True, top_k=3, min_tier="auto")
+        assert sorted(p.name for p in written.values()) == [
+            "conf.tsv", "conf_auto.tsv", "conf_high.tsv", "conf_manual.tsv", "conf_top3.tsv"]
+        main_file = pd.read_csv(written["all"], sep="\t")
+        assert main_file["Lead Score"].tolist() == [s for s in ordered["Lead Score"] if s >= 20]
+        assert pd.read_csv(written["top"], sep="\t")["First Name"].tolist() == ["P2", "P11", "P7"]
+    print("  scored outputs OK")
+
+
+def test_per_company_views():
+    """Grouped top-N and rollups agree with a sort + groupby over the full list."""
+    scored = pd.DataFrame({
+        "Full Name": [f"P{i}" for i in range(10)],
+        "Lead Score": [50, 90, 70, 70, 10, 80, 60, 30, 95, 40],
+        "Matched Company": ["Ubi", "Ubi", "Ubi", "Ubi", "Ubi", "Rovio", "", "Rovio", None, "Supercell"],
+        "Company Score": [80, 80, 80, 80, 80, 60, 0, 60, 0, 90],
+    })
+    top = top_contacts_per_company(scored, 2)
+    assert top["Full Name"].tolist() == ["P1", "P2", "P5", "P7", "P9"]
+
+    rollups = company_rollups(scored).set_index("Matched Company")
+    assert list(rollups.index) == ["Ubi", "Rovio", "Supercell"]
+    assert rollups.loc["Ubi", ["Contacts", "Best Lead Score", "Top 3 Lead Score Sum"]].tolist() == [5, 90, 230]
+    assert rollups.loc["Rovio", "Best Contact"] == "P5" and rollups.loc["Supercell", "Company Score"] == 90
+
+    with tempfile.TemporaryDirectory() as tmp:
+        written = write_scored_outputs(scored, os.path.join(tmp, "conf.tsv"), per_company=1)
+        assert pd.read_csv(written["by_company"], sep="\t")["Full Name"].tolist() == ["P1", "P5", "P9"]
+        assert len(pd.read_csv(written["companies"], sep="\t")) == 3
+    print("  per-company views OK")
+
+
+def test_pipeline_stage_cache(config):
+    """Pipeline stages are reused when their inputs are unchanged (e.g. notes-only reruns)."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(20)
+    companies["Normal Company"] = companies["Normalized Name"]
+    scrape = pd.DataFrame({
+        "First Name": [f"P{i}" for i in range(8)],
+        "Last Name": ["Test"] * 8,
+        "Job Title": ["CEO", "Senior Producer", "", "Lead Engineer"] * 2,
+        "Company": [companies["Company Name"].iloc[i] for i in range(8)],
+    })
+
+    original_dir = velocity.VELOCITY_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        velocity.VELOCITY_DIR = velocity.Path(tmp)
+        companies_file = os.path.join(tmp, "companies.csv")
+        companies.to_csv(companies_file, index=False)
+        scrape_file = os.path.join(tmp, "scrape1.tsv")
+        scrape.to_csv(scrape_file, sep="\t", index=False)
+        entry = {
+            "name": "Test", "input": os.path.join(tmp, "test_accum.tsv"), "columns": {"Company Name": "Company"},
+            "output": os.path.join(tmp, "out_{date}.tsv"), "velocity_key": "test_pipe",
+            "version_label": "v1", "score_cache": False,
+        }
+        kwargs = dict(plan=compile_config(config, "test-hash"), companies_file=companies_file,
+                      cache_dir=os.path.join(tmp, "cache"), notes_dir=os.path.join(tmp, "notes"))
+
+        try:
+            first = run_pipeline("test_pipe", entry, [(scrape_file, "Scrape 1")], **kwargs)
+            again = run_pipeline("test_pipe", entry, [(scrape_file, "Scrape 1")], **kwargs)
+
+            notes = pd.read_csv(first["output"], sep="\t", dtype=str, keep_default_na=False)
+            notes["DK notes"] = ""
+            notes.loc[0, "DK notes"] = "met at booth"
+            notes_file = os.path.join(tmp, "sheet_export.tsv")
+            notes.to_csv(notes_file, sep="\t", index=False)
+            with_notes = run_pipeline("test_pipe", entry, [(scrape_file, "Scrape 1")], notes_file, **kwargs)
+            # Top-leads entries rescore, honour output options and leave velocity alone
+            top_entry = dict(entry, top_leads=3, per_company=1)
+            top = run_pipeline("test_pipe", top_entry, [(scrape_file, "Scrape 1")], notes_file, **kwargs)
+
+            with open(os.path.join(tmp, "test_pipe.jsonl")) as f:
+                velocity_entries = len(f.readlines())
+        finally:
+            velocity.VELOCITY_DIR = original_dir
+
+        merged = pd.read_csv(with_notes["output"], sep="\t", dtype=str, keep_default_na=False)
+        top_leads = pd.read_csv(top["output"], sep="\t")
+        top_by_company = top["output"].replace(".tsv", "_by_company.tsv")
+        assert os.path.exists(top_by_company)
+        assert [read_output_meta(run["output"])["config_hash"] for run in (first, top)] == ["test-hash"] * 2
+
+    assert first["stages"] == {"accumulate": "ran", "score": "ran",
+                               "notes": "skipped (no prior notes)", "velocity": "ran"}
+    assert again["stages"] == {"accumulate": "reused", "score": "reused",
+                               "notes": "skipped (no prior notes)", "velocity": "reused"}
+    assert with_notes["stages"] == {"accumulate": "reused", "score": "reused",
+                                    "notes": "ran", "velocity": "reused"}
+    assert top["stages"] == {"accumulate": "reused", "score": "ran",
+                             "notes": "ran", "velocity": "skipped (top-leads run)"}
+    assert top["output"].endswith("_Top_Leads.tsv") and len(top_leads) == 3
+    assert os.path.basename(top_by_company) == os.path.basename(top["output"]).replace(".tsv", "_by_company.tsv")
+    assert velocity_entries == 1
+    assert merged.set_index("First Name").loc[notes.loc[0, "First Name"], "DK notes"] == "met at booth"
+    print("  pipeline stage cache OK")
+
+
+def test_benchmark_suite(config):
+    """Synthetic data is deterministic; benchmark compare flags slowdowns."""
+    people = synthetic_people(200, config, seed=7)
+    assert people.equals(synthetic_people(200, config, seed=7))
+    assert not people.equals(synthetic_people(200, config, seed=8))
+    assert people["Job Title"].str.strip().ne("").mean() > 0.8
+
+    current = run_benchmarks([200], ["title scoring", "notes merge"], repeat=1, plan=compile_config(config))
+    seconds = current["results"]["title scoring"]["200"]["seconds"]
+    baseline = json.loads(json.dumps(current))
+    baseline["results"]["title scoring"]["200"]["seconds"] = seconds / 2
+    flagged = {row["stage"]: row["regression"] for row in compare_results(current, baseline, threshold=0.25)}
+    assert flagged == {"title scoring": True, "notes merge": False}
+
+    capped = run_benchmarks([5000], ["company scoring"], repeat=1, plan=compile_config(config))
+    assert "skipped" in capped["results"]["company scoring"]["5000"]
+    assert capped["meta"]["stage_caps"] == {"company scoring": 2000}
+    print("  benchmark suite OK")
+
+
+def test_equivalence_harness(config):
+    """Optimized engine paths reproduce the reference output; the diff names bad rows."""
+    companies = pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv"))
+    companies = prepare_companies(companies.head(150))
+    people = synthetic_people(60, config, seed=3, companies=companies)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        companies_file = os.path.join(tmp, "companies.csv")
+        people.to_csv(people_file, sep="\t", index=False)
+        companies.to_csv(companies_file, index=False)
+
+        reports = compare_people_engines(people_file, companies_file, config)
+        assert all(report["equivalent"] for report in reports.values()), reports
+        reference = reference_people_scoring(people_file, companies_file, config)
+
+    normals = [normalize_company_name(name) for name in people["Company Name"]]
+    assert all(report["equivalent"] for report in compare_matching(normals, companies).values())
+    staging = synthetic_company_staging(40, seed=3)
+    assert all(report["equivalent"] for report in compare_company_engines(staging, config).values())
+
+    # A drifted candidate is reported with the triggering row and column
+    drifted = reference.copy()
+    drifted.loc[0, "Matched Company"] = "Somewhere Else"
+    drifted.loc[len(drifted) - 1, "Lead Score"] = 99
+    report = diff_outputs(reference, drifted, ["First Name", "Last Name", "Job Title", "Company Name"],
+                          sort_column="Lead Score")
+    assert not report["equivalent"]
+    assert report["columns"]["Matched Company"] == 1 and report["columns"]["Lead Score"] == 1
+    example = report["examples"][0]
+    assert example["row"].startswith(f"{reference.loc[0, 'First Name']}|") and example["candidate"] == "Somewhere Else"
+    assert report["order"]["mismatches"] >= 1
+
+    # Swapping rows within a score tie is not an order mismatch
+    ties = reference[reference["Lead Score"] == reference["Lead Score"].iloc[0]].index
+    if len(ties) > 1:
+        swapped = reference.copy()
+        swapped.iloc[[ties[0], ties[1]]] = reference.iloc[[ties[1], ties[0]]].values
+        report = diff_outputs(reference, swapped, ["First Name", "Last Name", "Job Title", "Company Name"],
+                              sort_column="Lead Score")
+        assert report["equivalent"] and report["order"]["tie_reorders"] == 2
+    print("  equivalence harness OK")
+
+
+def test_profiling_hooks(config):
+    """TURBINE_PROFILE off patches nothing; on, it counts hot paths and saves a profile."""
+    plan = compile_config(config)
+    title_scores = ScoringPlan.title_scores
+    with profiling.profile_run("test", enabled=False) as counters:
+        assert counters is None and ScoringPlan.title_scores is title_scores
+
+    companies = prepare_companies(pd.read_csv(os.path.join(os.path.dirname(__file__), "..", "store", "companies.csv")).head(300))
+    people = synthetic_people(40, config, seed=5, companies=companies)
+    with tempfile.TemporaryDirectory() as tmp:
+        people_file = os.path.join(tmp, "people.tsv")
+        companies_file = os.path.join(tmp, "companies.csv")
+        cache_file = os.path.join(tmp, "cache.pkl")
+        people.to_csv(people_file, sep="\t", index=False)
+        companies.to_csv(companies_file, index=False)
+
+        plain = process_people_scoring(people_file, companies_file, plan, score_cache_file=cache_file)
+        with profiling.profile_run("test", enabled=True, profile_dir=tmp) as counters:
+            profiled = process_people_scoring(people_file, companies_file, plan, score_cache_file=cache_file)
+            process_people_scoring(people_file, companies_file, config)
+        assert len([name for name in os.listdir(tmp) if name.endswith(".prof")]) == 1
+
+    assert profiled.equals(plain)
+    assert counters["score cache hits"] == 40 and counters["score cache misses"] == 0
+    # Second run used the raw dict: legacy title scorer and its re.search calls
+    assert counters["titles scored"] == 40 and counters["regex evaluations"] > 40
+    assert counters["company lookups"] == 40 and counters["candidates compared"] > 0
+    assert "regex evals / title" in profiling.format_counters(counters)
+    assert ScoringPlan.title_scores is title_scores and not profiling._PATCHES
+    assert not any(isinstance(row[-1], profiling._CountingPattern) for row in plan.seniority_components)
+    print("  profiling hooks OK")
+
+
+def test_compact_frames(config):
+    """Compact dtypes hold the same values, write the same file, and leave Extra Data on disk."""
+    scored = synthetic_people(500, config, seed=11).astype(object)
+    for column in ["Lead Score", "Contact Score", "Company Score", "Match Confidence"]:
+        scored[column] = [str(i % 101) if i % 4 else "" for i in range(len(scored))]
+    scored["Matched Company"] = scored["Company Name"]
+    scored["Extra Data"] = [json.dumps({"row": i}) for i in range(len(scored))]
+
+    compact = compact_frame(scored)
+    assert str(compact["Lead Score"].dtype) == "Float32" and compact["Lead Score"].isna().sum() == 125
+    assert str(compact["Source"].dtype) == "category"
+    assert scored.to_csv(sep="\t", index=False) == compact.to_csv(sep="\t", index=False,
+                                                                  float_format=SCORE_FLOAT_FORMAT)
+    assert frame_memory_mb(compact) < frame_memory_mb(scored)
+    # Fractional scores are kept exactly, or left alone when float32 can't hold them
+    fractional = compact_frame(pd.DataFrame({"Match Confidence": ["97.5", "", "60.25"], "Seniority": [33.3, 30.0, 1.0]}))
+    assert str(fractional["Match Confidence"].dtype) == "Float32"
+    assert fractional["Match Confidence"].astype("Float64").fillna(-1).tolist() == [97.5, -1, 60.25]
+    assert fractional["Seniority"].dtype == float and fractional["Seniority"].tolist() == [33.3, 30.0, 1.0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scored.tsv")
+        scored.to_csv(path, sep="\t", index=False)
+        lean = read_scored_frame(path)
+        assert "Extra Data" not in lean.columns and str(lean["Company Score"].dtype) == "Float32"
+        assert lean["Lead Score"].astype("Float64").fillna(-1).tolist() == compact["Lead Score"].astype("Float64").fillna(-1).tolist()
+        kept = lean[lean["Lead Score"] > 90].index
+        assert load_extra_data(path, kept).tolist() == scored.loc[kept, "Extra Data"].tolist()
+    print("  compact frames OK")
+
+
 def test_lead_score():
     """Lead score follows the spec rules."""
     # Normal case
@@ -120,6 +877,265 @@ def test_score_normalization():
     print("  score normalization OK")
 
 
+def test_vectorized_scores():
+    """Array lead-score and normalization kernels match the scalar/list versions."""
+    import numpy as np
+    contact = [80, 80, 0, 0, 150, -20, 55.5]
+    company = [90, 0, 90, 0, 90, 90, float("nan")]
+    matched = [True, False, True, False, True, True, True]
+    titled = [True, True, False, False, True, True, True]
+    vectorized = calculate_lead_scores(contact, company, matched, titled)
+    scalar = [calculate_lead_score(*row) for row in zip(contact, company, matched, titled)]
+    assert vectorized.tolist() == scalar, (vectorized, scalar)
+
+    raw = np.array([3.5, 17.25, 42.0, 9.0])
+    assert normalize_scores_array(raw).tolist() == normalize_scores(raw.tolist())
+    assert normalize_scores_array(raw, 0.0, 60.0).tolist() == normalize_scores(raw.tolist(), 0.0, 60.0)
+    assert normalize_scores_array(np.array([42.0])).tolist() == [42.0]
+    print("  vectorized scores OK")
+
+
+def test_merge_dk_notes():
+    """Prior DK notes carry onto matching people without touching the input."""
+    prior = pd.DataFrame({
+        "Full Name": ["Ilkka Paananen", "Jane Doe"],
+        "Company Name": ["Supercell", "Moon Active"],
+        "DK notes": ["met at GDC", ""],
+        "DK status": ["LIDM", "Skipped"],
+    })
+    new = pd.DataFrame({
+        "Full Name": ["ilkka paananen ", "New Person"],
+        "Company Name": ["SUPERCELL", "Rovio"],
+    }, index=[10, 11])
+
+    merged = merge_dk_notes(new, prior)
+    assert list(merged.index) == [10, 11]
+    assert merged.at[10, "DK notes"] == "met at GDC"
+    assert merged.at[10, "DK status"] == "LIDM"
+    assert merged.at[11, "DK status"] == ""
+    assert "_match_key" not in prior.columns
+    print("  dk notes merge OK")
+
+
+def test_fuzzy_notes_carry_forward():
+    """Notes survive company suffix and middle-name edits, but never change first name."""
+    prior = pd.DataFrame({
+        "Full Name": ["Ilkka Paananen", "Jon Smith", "Jane Park", "Ann Lee", "Mary Ng"],
+        "Company Name": ["Supercell", "Rovio", "King", "Zynga", "Moon Active"],
+        "DK status": ["DK email", "LIDM", "LIDM", "Skipped", "DK email"],
+    })
+    new = pd.DataFrame({
+        "Full Name": ["Ilkka Paananen", "Jonathan Smith", "Jake Park", "Ann Lee", "Mary J. Ng", "Bob Lee"],
+        "Company Name": ["Supercell Oy", "Rovio Entertainment", "King", "Zynga", "Moon Active", "Zynga"],
+    })
+
+    merged = merge_dk_notes(new, prior)
+    # Same last name and company but a different (or shortened) first name: not carried
+    assert list(merged["DK status"]) == ["DK email", "", "", "Skipped", "DK email", ""]
+    assert "DK Match Confidence" not in merged.columns
+
+    confidence = list(merge_dk_notes(new, prior, match_confidence=True)["DK Match Confidence"])
+    assert confidence[3] == 100
+    assert 85 <= confidence[0] < 100 and 85 <= confidence[4] < 100
+    assert confidence[1] == confidence[2] == confidence[5] == ""
+
+    exact_only = merge_dk_notes(new, prior, fuzzy=False)
+    assert list(exact_only["DK status"]) == ["", "", "", "Skipped", "", ""]
+    print("  fuzzy notes carry-forward OK")
+
+
+def test_notes_history():
+    """Notes history keeps every version and treats v10 as newer than v9."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for version, status in [("v9", "LIDM"), ("v10", "Scheduling")]:
+            scored = pd.DataFrame({
+                "Full Name": ["Jane Doe", "No Notes"],
+                "Company Name": ["Moon Active", "Rovio"],
+                "DK status": [status, ""],
+            })
+            save_notes_snapshot(scored, "test_conf", version, notes_dir=tmp)
+
+        latest = load_latest_notes("test_conf", notes_dir=tmp)
+        assert len(latest) == 1
+        assert latest.iloc[0]["DK status"] == "Scheduling"
+
+        history = load_notes_history("test_conf", notes_dir=tmp)
+        lead = get_note_history(history, "Jane Doe", "Moon Active")
+        assert list(lead["Version"]) == ["v9", "v10"]
+        assert get_note_history(history, "No Notes", "Rovio").empty
+
+        # A note cleared in a later version stays cleared (only one tombstone row)
+        cleared = pd.DataFrame({"Full Name": ["Jane Doe"], "Company Name": ["Moon Active"], "DK status": [""]})
+        save_notes_snapshot(cleared, "test_conf", "v11", notes_dir=tmp)
+        save_notes_snapshot(cleared, "test_conf", "v12", notes_dir=tmp)
+        assert load_latest_notes("test_conf", notes_dir=tmp).empty
+        lead = get_note_history(load_notes_history("test_conf", notes_dir=tmp), "Jane Doe", "Moon Active")
+        assert list(lead["Version"]) == ["v9", "v10", "v11"]
+    print("  notes history OK")
+
+
+def test_config_replay(config):
+    """A variant that lifts a flagged-too-low title counts as a fix."""
+    feedback = pd.DataFrame({
+        "Job Title": ["Game Designer", "CEO"],
+        "Company Score": ["80", "80"],
+        "DK: title too low (1) or too high (0)": ["1", ""],
+    })
+    edits = [{"pillar": "Seniority", "component": "Designer",
+              "Keywords to Match": "Game Designer", "Score": 90}]
+
+    edited = apply_config_edits(config, edits)
+    assert "Designer" in edited["peopleScore"]["pillars"]["Seniority"]["components"]
+    assert "Designer" not in config["peopleScore"]["pillars"]["Seniority"]["components"]
+
+    # Tier shifts are counted over the whole list, the feedback rows separately
+    population = pd.DataFrame({
+        "Job Title": ["Game Designer", "CEO"] + ["Level Designer", "Game Designer", "Producer"] * 4,
+        "Company Score": ["80"] * 14,
+    })
+    report = run_replay(feedback, [{"name": "designer up", "edits": edits}],
+                        base_config=config, workers=1, population=population)
+    assert list(report["Variant"]) == ["baseline", "designer up"]
+    row = report.iloc[1]
+    assert row["Fixed"] == 1 and row["Broken"] == 0 and row["Collateral"] == 0
+    labels = [label for label, _ in velocity.LEAD_TIERS]
+    assert sum(row[label] for label in labels) == len(population)
+    assert sum(row[f"{label} Δ"] for label in labels) == 0
+    assert sum(abs(row[f"{label} Δ"]) for label in labels) > sum(abs(row[f"Feedback {label} Δ"]) for label in labels) > 0
+    print("  config replay OK")
+
+
+def test_velocity_jsonl_histograms():
+    """Velocity entries append as JSONL with histograms that re-cut exactly."""
+    scored = pd.DataFrame({
+        "Lead Score": [72, 45, 45, 21, 12, 3, 0],
+        "Contact Score": [90, 70, 60, 40, 30, -7, 10],
+        "Company Score": [80, 64, "", 52, "", "", ""],
+        "Match Confidence": [100, 97, "", 100, "", "", ""],
+        "Matched Company": ["A", "B", "", "C", "", "", ""],
+        "Source": ["LISN"] * 7,
+    })
+
+    original_dir = velocity.VELOCITY_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        velocity.VELOCITY_DIR = velocity.Path(tmp)
+        try:
+            velocity.record_iteration("test_conf", scored, "v1")
+            second = velocity.record_iteration("test_conf", scored.head(5), "v2")
+            with open(os.path.join(tmp, "test_conf.jsonl")) as f:
+                assert len(f.readlines()) == 2
+            assert second["delta"]["previous_version"] == "v1"
+            assert "v2" in velocity.format_velocity_report("test_conf", format="markdown")
+        finally:
+            velocity.VELOCITY_DIR = original_dir
+
+    hists = second["histograms"]
+    tiers = velocity.histogram_tier_counts(hists["lead_score"])
+    direct = velocity.assign_lead_tiers(scored.head(5)["Lead Score"]).value_counts()
+    assert tiers == {label: int(direct.get(label, 0)) for label, _ in velocity.LEAD_TIERS}
+    assert velocity.histogram_percentile(hists["lead_score"], 50) == 45
+    assert hists["company_score"]["missing"] == 2
+    assert velocity.score_histogram(scored["Contact Score"])["below"] == 1
+    print("  velocity jsonl histograms OK")
+
+
+def test_velocity_people_churn():
+    """Key-set diffs count exact added/removed/updated people."""
+    before = pd.DataFrame({
+        "First Name": ["Ann", "Bob", "Cat"],
+        "Last Name": ["Lee", "Ray", "Kim"],
+        "Company Name": ["Zynga", "Rovio", "King"],
+        "Job Title": ["Producer", "CEO", "Artist"],
+        "Lead Score": [30, 70, 5],
+    })
+    after = pd.DataFrame({
+        "First Name": ["Ann", "Bob", "Dan", "Eve"],
+        "Last Name": ["Lee", "Ray", "Fox", "Ng"],
+        "Company Name": ["Zynga", "Rovio", "Supercell", "Moon Active"],
+        "Job Title": ["Senior Producer", "CEO", "VP Product", "Intern"],
+        "Lead Score": [35, 70, 55, 2],
+    })
+
+    diff = velocity.diff_key_sets(velocity.person_key_set(before), velocity.person_key_set(after))
+    assert diff == {"added": 2, "removed": 1, "updated": 1, "new_high_tier": 1}
+
+    # Key sets are stored in the log entry itself; a missing one is reported
+    original_dir = velocity.VELOCITY_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        velocity.VELOCITY_DIR = velocity.Path(tmp)
+        try:
+            first = velocity.record_iteration("test_churn", before, "v1")
+            assert first["people_keys"]["count"] == 3
+            second = velocity.record_iteration("test_churn", after, "v2")
+            assert {k: second["delta"][k] for k in diff} == diff
+            assert os.listdir(tmp) == ["test_churn.jsonl"]
+
+            velocity._append_velocity_entry("test_churn", dict(second, people_keys="test_churn_keys/gone.npz"))
+            third = velocity.record_iteration("test_churn", after, "v3")
+            assert third["delta"]["baseline"] == "missing" and "added" not in third["delta"]
+            assert "previous key set missing" in velocity.format_velocity_report("test_churn")
+        finally:
+            velocity.VELOCITY_DIR = original_dir
+    print("  velocity people churn OK")
+
+
+def test_stage_telemetry():
+    """Nested stages record depth; totals count only top-level stages."""
+    telemetry.drain_stages()
+
+    @telemetry.timed_stage("outer")
+    def outer(rows):
+        with telemetry.stage("inner") as inner:
+            inner["rows"] = len(rows)
+        return rows
+
+    outer([1, 2, 3])
+    stages = telemetry.drain_stages()
+    assert [(s["stage"], s["depth"], s["rows"]) for s in stages] == [("inner", 1, 3), ("outer", 0, 3)]
+    summary = telemetry.summarize_stages(stages)
+    assert summary["total_seconds"] == stages[1]["seconds"]
+    assert summary["slowest_stage"] == "inner"
+    assert telemetry.drain_stages() == []
+    print("  stage telemetry OK")
+
+
+def test_stage_memory_peaks():
+    """With tracemalloc on, each stage records its own peak; a parent covers its sub-stages."""
+    import tracemalloc
+
+    telemetry.drain_stages()
+    tracemalloc.start()
+    try:
+        with telemetry.stage("outer"):
+            with telemetry.stage("big"):
+                block = [str(i) for i in range(200_000)]
+                del block
+            with telemetry.stage("small"):
+                block = [0] * 10
+    finally:
+        tracemalloc.stop()
+    with telemetry.stage("untraced"):
+        pass
+    peaks = {s["stage"]: s["traced_peak_mb"] for s in telemetry.drain_stages()}
+    assert peaks["big"] > 5 and peaks["small"] < 1
+    assert peaks["outer"] >= peaks["big"] and peaks["untraced"] is None
+    print("  stage memory peaks OK")
+
+
+def test_light_imports():
+    """CLI-facing modules start without pandas/numpy/scipy/requests; imports don't configure logging."""
+    from benchmarks.startup import LIGHT_MODULES, heavy_imports
+
+    for module in LIGHT_MODULES:
+        assert heavy_imports(module) == [], module
+    assert "scipy" not in heavy_imports("engine.companies")
+    check = "import logging, engine.people, engine.companies; print(len(logging.getLogger().handlers))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True,
+                            cwd=os.path.join(os.path.dirname(__file__), ".."))
+    assert result.stdout.strip() == "0", result.stderr
+    print("  light imports OK")
+
+
 def main():
     print("Running scoring engine tests...\n")
 
@@ -129,10 +1145,36 @@ def main():
     test_seniority_scores(config)
     test_domain_scores(config)
     test_contact_score(config)
+    test_compiled_plan(config)
+    test_config_refresh(config)
+    test_config_delta_rescore(config)
+    test_incremental_score_cache(config)
+    test_engagement_warmth(config)
+    test_company_index_matches_full_scan()
+    test_warm_scoring_service(config)
+    test_batch_runner(config)
+    test_top_leads(config)
+    test_scored_outputs()
+    test_per_company_views()
+    test_pipeline_stage_cache(config)
+    test_benchmark_suite(config)
+    test_equivalence_harness(config)
+    test_profiling_hooks(config)
+    test_compact_frames(config)
+    test_config_replay(config)
     test_lead_score()
     test_company_name_normalization()
     test_fuzzy_matching()
     test_score_normalization()
+    test_vectorized_scores()
+    test_merge_dk_notes()
+    test_fuzzy_notes_carry_forward()
+    test_notes_history()
+    test_velocity_jsonl_histograms()
+    test_velocity_people_churn()
+    test_stage_telemetry()
+    test_stage_memory_peaks()
+    test_light_imports()
 
     print("\nAll tests passed!")
 